@@ -0,0 +1,138 @@
+"""End-to-end latency benchmark against the local fake Quotex platform.
+
+Drives the real QuotexInterface/SeleniumManager stack under headless Chrome
+and measures login time, snapshot read latency, order-entry latency and the
+tick throughput the page and the poller can keep up with.
+
+    python -m benchmarks.e2e_latency --orders 20 --output e2e.json
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The fake platform accepts any credentials
+os.environ.setdefault('QUOTEX_EMAIL', 'benchmark@example.com')
+os.environ.setdefault('QUOTEX_PASSWORD', 'benchmark')
+
+from benchmarks.fake_quotex.server import FakeQuotexServer
+from src.scraper.quotex_interface import QuotexInterface
+
+logger = logging.getLogger(__name__)
+
+def summarize(samples):
+    """Summarize latency samples (seconds) as milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100) if len(ordered) > 1 else [ordered[0]] * 99
+    return {
+        'count': len(ordered),
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'p50_ms': cuts[49] * 1000,
+        'p95_ms': cuts[94] * 1000,
+        'p99_ms': cuts[98] * 1000,
+        'max_ms': ordered[-1] * 1000,
+    }
+
+def measure_login(quotex):
+    started = time.perf_counter()
+    if not quotex.login():
+        raise RuntimeError("Login against the fake platform failed")
+    return time.perf_counter() - started
+
+def measure_snapshots(quotex, iterations):
+    balance, price = [], []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        quotex.get_balance()
+        balance.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        quotex.get_current_price()
+        price.append(time.perf_counter() - started)
+    return {'balance': summarize(balance), 'price': summarize(price)}
+
+def measure_orders(quotex, server, count, fast=False):
+    client, to_server = [], []
+    for i in range(count):
+        direction = 'up' if i % 2 == 0 else 'down'
+        before = len(server.orders)
+        sent_at = time.time()
+        started = time.perf_counter()
+        if not quotex.place_trade(direction, 1, fast):
+            raise RuntimeError("Order entry against the fake platform failed")
+        client.append(time.perf_counter() - started)
+
+        # Wait for the order to arrive over the page's WebSocket
+        deadline = time.time() + 5
+        while len(server.orders) == before and time.time() < deadline:
+            time.sleep(0.001)
+        if len(server.orders) > before:
+            to_server.append(server.orders[-1]['received_at'] - sent_at)
+    return {'place_trade': summarize(client), 'click_to_server': summarize(to_server)}
+
+def measure_ticks(quotex, seconds):
+    driver = quotex.selenium.driver
+    driver.execute_script("window.__ticks = 0;")
+    polls, changes, last = 0, 0, None
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        price = quotex.get_current_price()
+        polls += 1
+        if price is not None and price != last:
+            changes += 1
+            last = price
+    elapsed = time.perf_counter() - started
+    rendered = driver.execute_script("return window.__ticks;")
+    return {
+        'page_ticks_per_second': rendered / elapsed,
+        'polls_per_second': polls / elapsed,
+        'observed_changes_per_second': changes / elapsed,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Tick-to-order benchmark on the fake Quotex platform")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--tick-rate', type=float, default=20.0)
+    parser.add_argument('--snapshots', type=int, default=50, help="balance/price reads to time")
+    parser.add_argument('--orders', type=int, default=20, help="orders to place")
+    parser.add_argument('--tick-seconds', type=float, default=10.0, help="duration of the throughput run")
+    parser.add_argument('--action-delay', type=float, default=0.0,
+                        help="anti-detection delay before each action (production uses 2-5 s)")
+    parser.add_argument('--fast-entry', action='store_true',
+                        help="use the order fast path (preset amount, no pauses)")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    server = FakeQuotexServer(port=args.port, tick_rate=args.tick_rate).start_in_thread()
+    quotex = QuotexInterface(headless=True, base_url=server.base_url)
+    quotex.selenium.min_action_delay = quotex.selenium.max_action_delay = args.action_delay
+
+    try:
+        results = {
+            'config': vars(args),
+            'login_seconds': measure_login(quotex),
+            'snapshot': measure_snapshots(quotex, args.snapshots),
+            'orders': measure_orders(quotex, server, args.orders, args.fast_entry),
+            'ticks': measure_ticks(quotex, args.tick_seconds),
+        }
+    finally:
+        quotex.close()
+        server.stop()
+
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""Local stand-in for the Quotex web platform.
+
+Serves static login/trading pages exposing the selectors QuotexInterface
+uses and streams scripted prices over a WebSocket on the same port, so the
+tick-to-order path can be benchmarked without network access.
+
+    python -m benchmarks.fake_quotex.server --port 8765 --tick-rate 10
+"""
+import logging
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import struct
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STATIC_DIR = Path(__file__).resolve().parent / 'static'
+WS_MAGIC = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+CHART_SECONDS = 60   # candle timeframe of the chart
+CHART_BARS = 200     # candles the chart holds, sent to the page on subscribe
+
+ROUTES = {
+    '/': 'login.html',
+    '/login': 'login.html',
+    '/sign-in': 'login.html',
+    '/trading': 'trading.html',
+}
+
+BASE_PRICES = {
+    'EURUSD': 1.08500,
+    'GBPUSD': 1.27000,
+    'USDJPY': 151.200,
+    'AUDUSD': 0.65500,
+    'USDCAD': 1.36000,
+    'EURJPY': 164.100,
+}
+
+class PriceScript:
+    """Deterministic per-asset price source: a replayed file or a seeded random walk."""
+
+    def __init__(self, seed=42, script_path=None):
+        self.random = random.Random(seed)
+        self.prices = dict(BASE_PRICES)
+        self.script = None
+        self.position = 0
+        if script_path:
+            self.script = self.load_script(script_path)
+
+    @staticmethod
+    def load_script(path):
+        """Load ``asset,price`` lines from a file."""
+        rows = []
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                asset, price = line.split(',')[:2]
+                rows.append((asset.strip().upper(), float(price)))
+        return rows
+
+    def next_prices(self):
+        """Advance the script by one step and return the changed prices."""
+        if self.script:
+            asset, price = self.script[self.position % len(self.script)]
+            self.position += 1
+            self.prices[asset] = price
+            return {asset: price}
+
+        for asset, price in self.prices.items():
+            self.prices[asset] = round(price * (1 + self.random.gauss(0, 0.0001)), 5)
+        return dict(self.prices)
+
+class FakeQuotexServer:
+    """HTTP + WebSocket server on a single port."""
+
+    def __init__(self, host='127.0.0.1', port=8765, tick_rate=10.0, seed=42, script_path=None):
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.script = PriceScript(seed, script_path)
+        self.candles = self.backfill_candles(seed)  # asset -> chart candles, oldest first
+        self.clients = {}  # writer -> subscribed asset
+        self.orders = []   # orders received from the page, with receive timestamps
+        self.ticks_sent = 0
+        self.server = None
+        self.loop = None
+        self.thread = None
+        self.ready = threading.Event()
+
+    @staticmethod
+    def backfill_candles(seed):
+        """Chart history before the server started, from a separate seeded walk."""
+        walk = random.Random(seed + 1)
+        first = int(time.time() // CHART_SECONDS - CHART_BARS) * CHART_SECONDS
+        candles = {}
+        for asset, price in BASE_PRICES.items():
+            series = []
+            for index in range(CHART_BARS):
+                close = round(price * (1 + walk.gauss(0, 0.0005)), 5)
+                series.append({
+                    'time': first + index * CHART_SECONDS,
+                    'open': price, 'high': max(price, close), 'low': min(price, close), 'close': close,
+                })
+                price = close
+            candles[asset] = series
+        return candles
+
+    def update_candles(self, prices, now):
+        """Fold ticks into the chart candles."""
+        bucket = int(now // CHART_SECONDS) * CHART_SECONDS
+        for asset, price in prices.items():
+            series = self.candles.setdefault(asset, [])
+            if series and series[-1]['time'] == bucket:
+                candle = series[-1]
+                candle['high'] = max(candle['high'], price)
+                candle['low'] = min(candle['low'], price)
+                candle['close'] = price
+            else:
+                series.append({'time': bucket, 'open': price, 'high': price, 'low': price, 'close': price})
+                del series[:-CHART_BARS]
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def handle_connection(self, reader, writer):
+        """Serve one HTTP request or upgrade it to a WebSocket."""
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            if not request_line:
+                return
+            method, path, _ = request_line.split(' ', 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                key, _, value = line.partition(':')
+                headers[key.strip().lower()] = value.strip()
+
+            path = path.split('?')[0]
+            if headers.get('upgrade', '').lower() == 'websocket':
+                await self.handle_websocket(reader, writer, headers)
+            elif path == '/orders':
+                self.send_http(writer, 200, 'application/json', json.dumps(self.orders).encode())
+            elif path in ROUTES:
+                body = (STATIC_DIR / ROUTES[path]).read_bytes()
+                self.send_http(writer, 200, 'text/html; charset=utf-8', body)
+            else:
+                self.send_http(writer, 404, 'text/plain', b'Not found')
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logger.error("Fake server connection error: %s", e)
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    def send_http(writer, status, content_type, body):
+        """Write a complete HTTP/1.1 response."""
+        reason = {200: 'OK', 404: 'Not Found'}.get(status, 'OK')
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode('latin-1') + body
+        )
+
+    async def handle_websocket(self, reader, writer, headers):
+        """Complete the handshake and read client frames until close."""
+        accept = base64.b64encode(
+            hashlib.sha1((headers['sec-websocket-key'] + WS_MAGIC).encode()).digest()
+        ).decode()
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode('latin-1')
+        )
+        await writer.drain()
+        self.clients[writer] = None
+
+        while True:
+            opcode, payload = await self.read_frame(reader)
+            if opcode == 0x8:  # close
+                return
+            if opcode != 0x1:
+                continue
+            message = json.loads(payload.decode('utf-8'))
+            if message.get('type') == 'subscribe':
+                asset = message.get('asset')
+                self.clients[writer] = asset
+                writer.write(self.encode_frame(json.dumps({
+                    'type': 'history', 'asset': asset, 'candles': self.candles.get(asset, [])
+                })))
+            elif message.get('type') == 'order':
+                message['received_at'] = time.time()
+                self.orders.append(message)
+
+    @staticmethod
+    async def read_frame(reader):
+        """Read one (masked) client frame."""
+        first, second = await reader.readexactly(2)
+        opcode = first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack('!H', await reader.readexactly(2))[0]
+        elif length == 127:
+            length = struct.unpack('!Q', await reader.readexactly(8))[0]
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(length)
+        if mask:
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        return opcode, payload
+
+    @staticmethod
+    def encode_frame(text):
+        """Encode an unmasked server text frame."""
+        payload = text.encode('utf-8')
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x81, length)
+        elif length < 65536:
+            header = struct.pack('!BBH', 0x81, 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x81, 127, length)
+        return header + payload
+
+    async def stream_prices(self):
+        """Push scripted ticks to subscribed clients at ``tick_rate`` per second."""
+        interval = 1.0 / self.tick_rate
+        next_tick = time.monotonic()
+        while True:
+            prices = self.script.next_prices()
+            now = time.time()
+            self.update_candles(prices, now)
+            for writer, asset in list(self.clients.items()):
+                if asset in prices:
+                    frame = self.encode_frame(json.dumps({
+                        'type': 'tick', 'asset': asset, 'price': prices[asset], 'ts': now
+                    }))
+                    try:
+                        writer.write(frame)
+                        self.ticks_sent += 1
+                    except Exception:
+                        self.clients.pop(writer, None)
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+    async def serve(self):
+        """Serve until cancelled."""
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        streamer = asyncio.create_task(self.stream_prices())
+        logger.info("Fake Quotex listening on %s", self.base_url)
+        self.ready.set()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            streamer.cancel()
+
+    def start_in_thread(self):
+        """Run the server on a background event loop; returns once it is listening."""
+        def run():
+            self.loop = asyncio.new_event_loop()
+            try:
+                self.loop.run_until_complete(self.serve())
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self.loop.close()
+
+        self.thread = threading.Thread(target=run, name='fake-quotex', daemon=True)
+        self.thread.start()
+        self.ready.wait(timeout=10)
+        return self
+
+    async def shutdown(self):
+        """Disconnect WebSocket clients, then stop accepting connections."""
+        for writer in list(self.clients):
+            writer.close()
+        await asyncio.sleep(0.1)  # let the connection handlers see EOF and exit
+        self.server.close()
+
+    def stop(self):
+        """Stop a server started with start_in_thread."""
+        if self.loop and self.server:
+            asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop).result(timeout=5)
+            self.thread.join(timeout=5)
+
+def main():
+    parser = argparse.ArgumentParser(description="Local fake Quotex platform")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--tick-rate', type=float, default=10.0, help="ticks per second")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--script', help="file of 'asset,price' lines to replay instead of a random walk")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = FakeQuotexServer(args.host, args.port, args.tick_rate, args.seed, args.script)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Microbenchmarks for the per-tick hot paths.
+
+Runs each case on synthetic price streams, writes the results as JSON and
+compares them against a stored baseline so per-tick cost regressions are
+caught before they ship.
+
+    python -m benchmarks.microbench --save-baseline          # record a baseline
+    python -m benchmarks.microbench --tolerance 0.25         # fail on >25% slowdowns
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.trading.strategy import TradingStrategy
+from src.trading.indicator_cache import IndicatorCache
+from src.trading.risk_manager import RiskManager
+from src.trading.candles import CandleAggregator
+from src.trading.trade_journal import TradeJournal
+from src.trading.paper_broker import PaperBroker, SyntheticTicks
+from src.trading.risk_simulation import simulate_risk
+from src.bot.telegram_handler import format_trade_notification
+from src.bot.dashboard import StatusDashboard
+
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCH_DIR / 'results' / 'baseline.json'
+DEFAULT_OUTPUT = BENCH_DIR / 'results' / 'latest.json'
+
+BENCHMARKS = {}
+
+def benchmark(name):
+    """Register a benchmark case.
+
+    The decorated function does its setup and returns ``(op, n)``: a callable
+    that runs the measured work once and the number of operations it performs.
+    """
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+def synthetic_prices(count, seed=7, start=1.085, volatility=0.0002):
+    """Seeded random-walk price stream."""
+    rng = random.Random(seed)
+    price = start
+    prices = []
+    for _ in range(count):
+        price *= 1 + rng.gauss(0, volatility)
+        prices.append(round(price, 5))
+    return prices
+
+def synthetic_trades(count, seed=11):
+    """Seeded trade history in the shape RiskManager.add_trade expects."""
+    rng = random.Random(seed)
+    trades = []
+    for _ in range(count):
+        win = rng.random() < 0.55
+        amount = round(rng.uniform(1, 20), 2)
+        trades.append({
+            'result': 'win' if win else 'loss',
+            'profit': round(amount * 0.8, 2) if win else -amount,
+        })
+    return trades
+
+@benchmark('strategy.tick')
+def bench_strategy_tick():
+    prices = synthetic_prices(2000)
+    strategy = TradingStrategy()
+    for price in prices[:strategy.sma_period]:
+        strategy.add_price(price)
+
+    def op():
+        for price in prices:
+            strategy.add_price(price)
+            strategy.calculate_signals()
+    return op, len(prices)
+
+@benchmark('strategy.cached_indicators')
+def bench_cached_indicators():
+    # A consumer re-reading the indicators of an already computed bar
+    prices = synthetic_prices(100)
+    strategy = TradingStrategy('EURUSD', '1m', IndicatorCache())
+    for price in prices:
+        strategy.add_price(price)
+    strategy.calculate_indicators()
+
+    def op():
+        strategy.calculate_indicators()
+    return op, 1
+
+def _make_stats_case(size):
+    def case():
+        manager = RiskManager()
+        manager.trade_history = synthetic_trades(size)
+
+        def op():
+            manager.get_trade_stats()
+        return op, 1
+    return case
+
+for _size in (10, 100, 1000, 10000):
+    benchmark(f'risk.get_trade_stats[{_size}]')(_make_stats_case(_size))
+
+@benchmark('journal.record')
+def bench_journal_record():
+    directory = tempfile.mkdtemp(prefix='microbench-')
+    journal = TradeJournal(Path(directory) / 'journal.db')
+    trades = synthetic_trades(1000)
+
+    def op():
+        for trade in trades:
+            journal.record(trade)
+        journal.flush()
+    return op, len(trades)
+
+@benchmark('paper.tick_and_trade')
+def bench_paper_broker():
+    # One price read plus one order per tick; trades settle 60 ticks later
+    broker = PaperBroker(SyntheticTicks(), balance=1e12)
+    broker.login()
+
+    def op():
+        for i in range(1000):
+            broker.get_current_price()
+            broker.place_trade('up' if i % 2 else 'down', 1.0)
+    return op, 1000
+
+@benchmark('risk.simulate_path_trade')
+def bench_risk_simulation():
+    # One step of one equity path; /risk runs 200k paths x 500 signals
+    def op():
+        simulate_risk(0.55, 1000.0, trades=100, paths=20000, resume=True, seed=1)
+    return op, 100 * 20000
+
+@benchmark('candles.add_tick')
+def bench_candle_aggregation():
+    prices = synthetic_prices(20000)
+    timestamps = [1_700_000_000 + i * 0.5 for i in range(len(prices))]  # 2 ticks/s
+
+    def op():
+        aggregator = CandleAggregator('1m')
+        for price, timestamp in zip(prices, timestamps):
+            aggregator.add_tick(price, timestamp)
+    return op, len(prices)
+
+@benchmark('notify.format_trade')
+def bench_format_notification():
+    def op():
+        format_trade_notification('up', 12.34, 1.08512)
+    return op, 1
+
+@benchmark('notify.dashboard_render')
+def bench_dashboard_render():
+    dashboard = StatusDashboard(None, [], None, 60)
+    snapshot = {
+        'is_trading': True,
+        'asset': 'EURUSD',
+        'is_demo': True,
+        'pnl': 12.5,
+        'open_trades': [{'direction': 'up', 'amount': 2.0, 'price': 1.08512}],
+        'signals': {'signal': None, 'rsi': 48.2, 'sma': 1.08498},
+        'loop_latency': 0.012,
+        'pipeline': {
+            stage: {'queue_depth': 0, 'avg_latency': 0.001}
+            for stage in ('feed', 'indicators', 'risk', 'execution', 'notify')
+        },
+    }
+
+    def op():
+        dashboard.render(snapshot)
+    return op, 1
+
+def measure(case, min_time=0.2, repeats=5):
+    """Time a case; returns per-operation nanoseconds (best and median of repeats)."""
+    op, ops_per_call = case()
+
+    # Calibrate the number of calls so one repeat takes at least min_time
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            op()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or calls >= 1_000_000:
+            break
+        calls *= 10 if elapsed < min_time / 10 else 2
+
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(calls):
+            op()
+        samples.append((time.perf_counter() - started) / (calls * ops_per_call) * 1e9)
+    samples.sort()
+    return {
+        'best_ns': samples[0],
+        'median_ns': samples[len(samples) // 2],
+        'ops': calls * ops_per_call * repeats,
+    }
+
+def compare(results, baseline, tolerance):
+    """Return the cases whose median slowed down by more than ``tolerance``.
+
+    Cases missing from the baseline are reported but not counted as regressions.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base:
+            print(f"WARNING {name}: no baseline, run --save-baseline to add it")
+            continue
+        ratio = result['median_ns'] / base['median_ns']
+        result['baseline_ratio'] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot-path microbenchmarks")
+    parser.add_argument('--filter', help="only run cases containing this substring")
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds per repeat")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT))
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE))
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown before failing")
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    if not args.save_baseline and not baseline_path.exists():
+        # Without a baseline the regression gate would silently pass
+        print(f"ERROR no baseline at {baseline_path}; record one with --save-baseline")
+        sys.exit(2)
+
+    results = {}
+    for name, case in BENCHMARKS.items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(case, args.min_time, args.repeats)
+        print(f"{name:32} {results[name]['median_ns']:>14,.0f} ns/op")
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'timestamp': time.time(),
+        'results': results,
+    }
+
+    regressions = []
+    if not args.save_baseline:
+        regressions = compare(results, json.loads(baseline_path.read_text()), args.tolerance)
+
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2))
+
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {baseline_path}")
+
+    for name, ratio in regressions:
+        print(f"REGRESSION {name}: {ratio:.2f}x baseline")
+    if regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
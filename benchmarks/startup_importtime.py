@@ -0,0 +1,94 @@
+"""Startup import-time guard.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter and
+fails if importing the bot pulls in the browser or analytics stack, or if
+the total import time exceeds the budget.
+
+    python -m benchmarks.startup_importtime --budget-ms 1500
+"""
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Must only be imported on first use, never by `import main`
+LAZY_MODULES = ('pandas', 'numpy', 'ta', 'selenium', 'webdriver_manager', 'dotenv')
+
+def parse_importtime(stderr):
+    """Parse -X importtime output into {module: (self_us, cumulative_us, depth)}."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        head, cumulative_us, name = line.split('|')
+        self_us = head.split(':')[1]
+        # Nesting is shown by two extra spaces of indentation per level
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+def measure(target, runs):
+    """Import ``target`` in fresh interpreters; return the fastest run's modules."""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {target}'],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"import {target} failed:\n{result.stderr[-2000:]}")
+        modules = parse_importtime(result.stderr)
+        total = sum(cumulative for _, cumulative, depth in modules.values() if depth == 0)
+        if best is None or total < best[0]:
+            best = (total, modules)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Guard the bot's startup import time")
+    parser.add_argument('--target', default='main', help="module to import")
+    parser.add_argument('--budget-ms', type=float, default=1500.0, help="maximum total import time")
+    parser.add_argument('--runs', type=int, default=3, help="fresh interpreters to try; the fastest counts")
+    parser.add_argument('--top', type=int, default=10, help="slowest direct imports to show")
+    parser.add_argument('--json', action='store_true', help="print machine-readable results")
+    args = parser.parse_args()
+
+    total_us, modules = measure(args.target, args.runs)
+    eager = sorted(
+        name for name in modules
+        if name.split('.')[0] in LAZY_MODULES
+    )
+    top_level = sorted(
+        ((cumulative, name) for name, (_, cumulative, depth) in modules.items() if depth == 1),
+        reverse=True
+    )[:args.top]
+
+    failures = []
+    if eager:
+        roots = sorted({name.split('.')[0] for name in eager})
+        failures.append(f"eagerly imported: {', '.join(roots)}")
+    if total_us / 1000 > args.budget_ms:
+        failures.append(f"total {total_us / 1000:.0f} ms exceeds budget {args.budget_ms:.0f} ms")
+
+    if args.json:
+        print(json.dumps({
+            'target': args.target,
+            'total_ms': total_us / 1000,
+            'top': [{'module': name, 'ms': cumulative / 1000} for cumulative, name in top_level],
+            'eager_lazy_modules': eager,
+            'failures': failures,
+        }, indent=2))
+    else:
+        print(f"import {args.target}: {total_us / 1000:.0f} ms")
+        for cumulative, name in top_level:
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
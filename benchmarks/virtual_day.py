@@ -0,0 +1,87 @@
+"""Run the real trading loop on virtual time against the paper broker.
+
+TradingBot, its pipeline, cooldowns, expiry tracking and pacing all sleep on
+a VirtualClock, which jumps to the next scheduled wake-up, so a full day of
+loop behaviour finishes in seconds of wall time.
+
+    python -m benchmarks.virtual_day --hours 24 --signal-event bar
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Nothing is sent to Telegram or a browser in this run
+os.environ.setdefault('TELEGRAM_BOT_TOKEN', '0:virtual-day')
+os.environ.setdefault('QUOTEX_EMAIL', 'virtual@example.com')
+os.environ.setdefault('QUOTEX_PASSWORD', 'virtual')
+
+from config.config import TRADING_CONFIG, STRATEGY_CONFIG, JOURNAL_CONFIG, load_config
+from src.trading.clock import VirtualClock
+from src.trading.paper_broker import PaperBroker, SyntheticTicks
+
+async def run_day(hours, seed):
+    from main import TradingBot
+
+    clock = VirtualClock()
+    broker = PaperBroker(SyntheticTicks(seed), clock=clock)
+    bot = TradingBot(broker, clock)
+    bot.telegram_bot.admin_ids = []
+
+    clock_task = asyncio.create_task(clock.run())
+    started = time.perf_counter()
+    virtual_start = clock.time()
+    try:
+        await bot.start_browser()
+        bot.trade_task = asyncio.create_task(bot.start_trading())
+        await clock.sleep(hours * 3600)
+        await bot.stop_trading()
+        balance = broker.get_balance()
+    finally:
+        clock_task.cancel()
+        if bot.settle_task:
+            bot.settle_task.cancel()
+        bot.stop()
+
+    wall = time.perf_counter() - started
+    pipeline = bot.get_pipeline_stats()
+    return {
+        'virtual_hours': (clock.time() - virtual_start) / 3600,
+        'wall_seconds': wall,
+        'speedup': (clock.time() - virtual_start) / wall,
+        'ticks': pipeline.get('indicators', {}).get('processed', 0),
+        'orders': pipeline.get('execution', {}).get('processed', 0),
+        'trade_stats': bot.risk_manager.get_trade_stats(),
+        'balance': balance,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a day of the trading loop on virtual time")
+    parser.add_argument('--hours', type=float, default=24.0)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--signal-event', choices=('tick', 'bar'), default=TRADING_CONFIG['SIGNAL_EVENT'])
+    parser.add_argument('--strategies', default=','.join(STRATEGY_CONFIG['ENABLED_STRATEGIES']),
+                        help="comma-separated strategy plugins to run")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    args = parser.parse_args()
+
+    load_config()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    TRADING_CONFIG['SIGNAL_EVENT'] = args.signal_event
+    STRATEGY_CONFIG['ENABLED_STRATEGIES'] = args.strategies.split(',')
+    JOURNAL_CONFIG['ENABLED'] = False  # keep simulated trades out of the real journal
+
+    results = asyncio.run(run_day(args.hours, args.seed))
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output)
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,11 @@
 from pathlib import Path
 import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Base paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / 'data'
 LOGS_DIR = BASE_DIR / 'logs'
 
-# Create necessary directories
-for directory in [DATA_DIR, LOGS_DIR]:
-    directory.mkdir(exist_ok=True)
-
 # Trading Configuration
 TRADING_CONFIG = {
     'RISK_PERCENTAGE': 0.02,  # 2% risk per trade
@@ -21,6 +13,31 @@ TRADING_CONFIG = {
     'MAX_DELAY': 300,         # 5 minutes maximum delay
     'DEFAULT_ASSET': 'EURUSD',  # Default trading asset
     'DEFAULT_TIMEFRAME': '1m',  # Default timeframe
+    'TRADE_EXPIRY': 60,       # Seconds until a placed trade expires
+    'TICK_INTERVAL': 1,       # Seconds between price polls
+    'SIGNAL_EVENT': 'bar',    # Evaluate signals on every 'tick' or on 'bar' close
+    'BACKOFF_MAX': 60,        # Maximum seconds to back off after failures
+    'PAYOUT': 0.8,            # Profit per $1 on a winning trade
+    'SETTLE_INTERVAL': 5,     # Seconds between checks for trades the tick feed did not settle
+    'SETTLE_GRACE': 5,        # Seconds after expiry before reading the platform trade history
+    'SETTLE_TIMEOUT': 600,    # Give up on settling a trade this long after expiry
+    'HISTORY_ROWS': 20,       # Trade history rows read per settlement pass
+    'SETTLE_MATCH_WINDOW': 10,  # Max seconds between our and the platform's open time of a trade
+    'SETTLE_TICK_TOLERANCE': 2,  # Max seconds from the last tick before expiry to settle on it
+    'FAST_ORDER_ENTRY': True, # Skip human-like pauses when typing the amount and clicking
+    'BALANCE_MAX_AGE': 60,    # Seconds a balance read is reused for sizing
+    'TICK_LOG': None,         # CSV file recording live ticks for replay, e.g. DATA_DIR / 'ticks.csv'
+    'WARM_START': True,       # Fill indicators from the chart's candles after selecting an asset
+}
+
+# Trading Pipeline Configuration (feed -> indicators -> risk -> execution -> notify)
+PIPELINE_CONFIG = {
+    'INDICATORS_QUEUE': 100,  # Stale ticks are dropped when full, bar closes are kept
+    'RISK_QUEUE': 10,
+    'EXECUTION_QUEUE': 10,    # Orders are never dropped
+    'NOTIFY_QUEUE': 100,
+    'NOTIFY_WORKERS': 2,      # Concurrent Telegram uploads
+    'DRAIN_TIMEOUT': 30,      # Seconds to finish queued orders and notifications on stop
 }
 
 # Strategy Configuration
@@ -29,17 +46,129 @@ STRATEGY_CONFIG = {
     'RSI_PERIOD': 14,
     'RSI_OVERBOUGHT': 70,
     'RSI_OVERSOLD': 30,
+    'INDICATOR_CACHE_SIZE': 256,  # Indicator series kept across assets (LRU)
+    'STATE_CACHE_SIZE': 8,        # Assets whose strategy state stays in memory (LRU)
+    'STATE_DIR': DATA_DIR / 'strategy_state',  # Where older assets' state is evicted to
+    'ENABLED_STRATEGIES': ['sma_rsi'],  # Plugins run on every asset, in priority order
+    'VOTING_POLICY': 'priority',        # 'priority', 'majority' or 'unanimous'
+    'STRATEGY_PARAMS': {},              # e.g. {'rsi_reversal': {'rsi_period': 9}}
+    'ARM_MARGIN': 5,                    # RSI points from a threshold at which orders are prepared
 }
 
 # Telegram Configuration
 TELEGRAM_CONFIG = {
     'ADMIN_USER_IDS': [],  # Add admin Telegram user IDs here
     'UPDATE_INTERVAL': 60,  # Seconds between updates
+    'DASHBOARD_ENABLED': True,  # Keep a pinned live status message per admin
+}
+
+# Metrics Configuration
+METRICS_CONFIG = {
+    'ENABLED': False,      # Serve Prometheus-style metrics over HTTP
+    'HOST': '127.0.0.1',   # Local only
+    'PORT': 9108,
+}
+
+# Paper Trading Configuration (in-process broker instead of the browser)
+PAPER_CONFIG = {
+    'ENABLED': False,
+    'BALANCE': 10000.0,
+    'TICKS_FILE': None,     # CSV of timestamp,asset,price rows; synthetic random walk if None
+    'SEED': 42,
+    'TICK_SPACING': 1.0,    # Simulated seconds between synthetic ticks
+    'PAYOUTS': {},          # Per-asset payout overrides, e.g. {'EURUSD': 0.85}
+}
+
+# Historical Market Data (python -m src.trading.importer)
+MARKET_DATA_CONFIG = {
+    'STORE_DIR': DATA_DIR / 'market',  # Daily tick/candle CSV files per asset
+    'CHUNK_BYTES': 64 * 1024 * 1024,   # Source bytes parsed per chunk
+    'TIMEZONE': 'UTC',                 # Zone of source timestamps without an offset
+}
+
+# Walk-Forward Optimization (python -m src.trading.walk_forward)
+WALK_FORWARD_CONFIG = {
+    'IN_SAMPLE_DAYS': 5,       # Days the parameters are optimized on...
+    'OUT_OF_SAMPLE_DAYS': 1,   # ...then traded on; folds roll forward by this much
+    'OBJECTIVE': 'expectancy', # 'expectancy' or 'total_return' of the in-sample trades
+    'MIN_TRADES': 20,          # In-sample trades a parameter set needs to qualify
+    'WORKERS': None,           # Worker processes; None uses every CPU
+    'CACHE_DIR': DATA_DIR / 'walk_forward',
+    'GRID': {                  # STRATEGY_CONFIG values to search
+        'SMA_PERIOD': [10, 20, 50],
+        'RSI_PERIOD': [7, 14, 21],
+        'RSI_OVERBOUGHT': [65, 70, 75],
+        'RSI_OVERSOLD': [25, 30, 35],
+    },
+}
+
+# Risk-of-Ruin Simulation (/risk command)
+RISK_SIMULATION_CONFIG = {
+    'PATHS': 200000,        # Simulated accounts, at most
+    'PATH_TRADES': 100_000_000,  # Paths x signals per run: PATHS at TRADES in full; longer runs use fewer paths
+    'TRADES': 500,          # Signals per account
+    'MAX_TRADES': 5000,     # Largest /risk request
+    'RUIN_DRAWDOWN': 0.5,   # Drawdown counted as ruin
+    'WIN_RATE': 0.55,       # Used until MIN_HISTORY trades are recorded
+    'MIN_HISTORY': 30,
+    'BALANCE': 1000.0,      # Used until a balance has been read
+}
+
+# Trade Journal Configuration
+JOURNAL_CONFIG = {
+    'ENABLED': True,                     # Persist settled trades across restarts
+    'PATH': DATA_DIR / 'trade_journal.db',
+    'SYNCHRONOUS': 'FULL',               # fsync every batch commit; 'NORMAL' fsyncs the WAL at checkpoints only
+}
+
+# Logging Configuration
+LOGGING_CONFIG = {
+    'LEVEL': 'INFO',
+    'MAX_BYTES': 10 * 1024 * 1024,  # Rotate bot.log at 10 MB...
+    'ROTATE_INTERVAL': 24 * 3600,   # ...or daily, whichever comes first
+    'BACKUP_COUNT': 7,
+    'JSON_LINES': False,            # Also write structured records to bot.jsonl
 }
 
 # Selenium Configuration
 SELENIUM_CONFIG = {
     'HEADLESS': True,
     'TIMEOUT': 30,  # seconds
+    'BASE_URL': 'https://quotex.com',  # Overridden by QUOTEX_BASE_URL in load_config()
+    'MIN_ACTION_DELAY': 2,  # seconds, random pause before each click/keystroke
+    'MAX_ACTION_DELAY': 5,
+    'ASSET_TABS': False,  # One tab per asset in the same browser, switched without re-selecting
+    'MAX_TABS': 10,       # Least recently used tab is closed beyond this
+    # host:port of a Chrome started by src.scraper.chrome_sidecar; the bot attaches
+    # to it and leaves it running on exit. Overridden by CHROME_DEBUGGER_ADDRESS
+    'DEBUGGER_ADDRESS': None,
+    'DEBUGGER_PORT': 9222,  # Port the sidecar listens on (local only)
+    'CHROME_BINARY': None,  # Found on PATH when unset
+    'PROFILE_DIR': DATA_DIR / 'chrome_profile',  # Sidecar profile, keeps the session cookies
+    # Page expression holding the chart's loaded candles as [{time, close, ...}], oldest first
+    'CHART_CANDLES_JS': 'window.__chart && window.__chart.candles',
     'USER_AGENT': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-} 
\ No newline at end of file
+} 
+
+_config_loaded = False
+
+def load_config(env_file=None):
+    """Load the .env file, apply environment overrides and create data directories.
+
+    Nothing happens at import time; entry points call this once before reading
+    credentials. Repeated calls are no-ops.
+    """
+    global _config_loaded
+    if _config_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv(env_file)
+    SELENIUM_CONFIG['BASE_URL'] = os.getenv('QUOTEX_BASE_URL', SELENIUM_CONFIG['BASE_URL'])
+    SELENIUM_CONFIG['DEBUGGER_ADDRESS'] = os.getenv('CHROME_DEBUGGER_ADDRESS', SELENIUM_CONFIG['DEBUGGER_ADDRESS'])
+
+    # Create necessary directories
+    for directory in [DATA_DIR, LOGS_DIR]:
+        directory.mkdir(exist_ok=True)
+
+    _config_loaded = True
@@ -1,9 +1,8 @@
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class Credentials:
+    """Read credentials from the environment; call config.load_config() first to load .env."""
+
     @staticmethod
     def get_telegram_token():
         token = os.getenv('TELEGRAM_BOT_TOKEN')
@@ -0,0 +1,116 @@
+import json
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+from config.config import LOGS_DIR, LOGGING_CONFIG
+
+# Structured fields callers may pass via ``extra=`` and that end up in JSON lines
+STRUCTURED_FIELDS = ('trade', 'asset', 'latency')
+
+_listener = None
+
+class SizeTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotate when the file exceeds max_bytes or every ``interval`` seconds."""
+
+    def __init__(self, filename, max_bytes, backup_count, interval, encoding='utf-8'):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self.interval = interval
+        self.rollover_at = time.time() + interval
+
+    def shouldRollover(self, record):
+        if self.interval and time.time() >= self.rollover_at:
+            return True
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.rollover_at = time.time() + self.interval
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including structured fields."""
+
+    def format(self, record):
+        entry = {
+            'ts': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() formats the message in the calling thread so records
+    can be pickled; our queue never leaves the process, so the caller only
+    pays for an enqueue.
+    """
+
+    def prepare(self, record):
+        return record
+
+def setup_logging(json_lines=None):
+    """Route all logging through a queue drained by a background listener thread.
+
+    Console, rotating text log (LOGS_DIR/bot.log) and optional JSON lines
+    (LOGS_DIR/bot.jsonl) handlers run on the listener thread, so disk stalls
+    never block the trading path.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    if json_lines is None:
+        json_lines = LOGGING_CONFIG['JSON_LINES']
+    LOGS_DIR.mkdir(exist_ok=True)
+
+    text_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.StreamHandler(),
+        SizeTimeRotatingFileHandler(
+            LOGS_DIR / 'bot.log',
+            LOGGING_CONFIG['MAX_BYTES'],
+            LOGGING_CONFIG['BACKUP_COUNT'],
+            LOGGING_CONFIG['ROTATE_INTERVAL']
+        ),
+    ]
+    for handler in handlers:
+        handler.setFormatter(text_formatter)
+
+    if json_lines:
+        json_handler = SizeTimeRotatingFileHandler(
+            LOGS_DIR / 'bot.jsonl',
+            LOGGING_CONFIG['MAX_BYTES'],
+            LOGGING_CONFIG['BACKUP_COUNT'],
+            LOGGING_CONFIG['ROTATE_INTERVAL']
+        )
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(LOGGING_CONFIG['LEVEL'])
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(InProcessQueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+def stop_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -2,119 +2,599 @@ import logging
 import asyncio
 import time
 from pathlib import Path
-from config.config import LOGS_DIR, TRADING_CONFIG
+from concurrent.futures import ThreadPoolExecutor
+from config.config import (
+    TRADING_CONFIG, PIPELINE_CONFIG, STRATEGY_CONFIG, METRICS_CONFIG, JOURNAL_CONFIG, PAPER_CONFIG,
+    load_config
+)
+from config.logging_config import setup_logging, stop_logging
 from config.credentials import Credentials
 from src.bot.telegram_handler import TelegramBot
 from src.bot.command_handler import CommandHandler
-from src.scraper.quotex_interface import QuotexInterface
 from src.trading.strategy import TradingStrategy
+from src.trading.indicator_cache import IndicatorCache
+from src.trading.strategy_store import StrategyStore
 from src.trading.risk_manager import RiskManager
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOGS_DIR / 'bot.log'),
-        logging.StreamHandler()
-    ]
-)
+from src.trading.trade_journal import TradeJournal
+from src.trading.position_tracker import PositionTracker
+from src.trading.feed import PriceFeed
+from src.trading.pacing import TradeCooldown, Backoff
+from src.trading.candles import timeframe_to_seconds
+from src.trading.clock import REAL_CLOCK
+from src.trading.replay import TickRecorder
+from src.trading.pipeline import Pipeline, DROP_OLDEST
+from src.monitoring.metrics import REGISTRY, MetricsServer
 
 logger = logging.getLogger(__name__)
 
 class TradingBot:
-    def __init__(self):
+    def __init__(self, broker=None, clock=None):
         self.telegram_bot = TelegramBot()
-        self.command_handler = CommandHandler()
-        self.quotex = QuotexInterface(headless=True)
-        self.strategy = TradingStrategy()
-        self.risk_manager = RiskManager()
+        self.command_handler = CommandHandler(self)
+        self.clock = clock or REAL_CLOCK  # a VirtualClock runs the loop faster than real time
+        # Anything with the QuotexInterface API, e.g. a PaperBroker; the
+        # browser interface is created on first use otherwise (pulls in Selenium)
+        self._quotex = broker
+        self.indicator_cache = IndicatorCache(STRATEGY_CONFIG['INDICATOR_CACHE_SIZE'])
+        # asset -> TradingStrategy, keeps warm-up per asset
+        self.strategies = StrategyStore(
+            lambda asset: TradingStrategy(asset, TRADING_CONFIG['DEFAULT_TIMEFRAME'], self.indicator_cache),
+            STRATEGY_CONFIG['STATE_CACHE_SIZE'],
+            STRATEGY_CONFIG['STATE_DIR']
+        )
+        journal = None
+        if JOURNAL_CONFIG['ENABLED']:
+            journal = TradeJournal(JOURNAL_CONFIG['PATH'], JOURNAL_CONFIG['SYNCHRONOUS'])
+        self.risk_manager = RiskManager(journal)
+        self.positions = PositionTracker(
+            self.risk_manager, TRADING_CONFIG['PAYOUT'],
+            TRADING_CONFIG['SETTLE_MATCH_WINDOW'], TRADING_CONFIG['SETTLE_TICK_TOLERANCE']
+        )
+        self.cooldown = TradeCooldown(self.risk_manager.min_delay, self.risk_manager.max_delay, self.clock)
         self.is_trading = False
         self.current_asset = TRADING_CONFIG['DEFAULT_ASSET']
+        # Build the first strategy now so a bad STRATEGY_CONFIG fails at startup, not on a signal
+        self.get_strategy(self.current_asset)
+        self.asset_selected = False
+        self.pending_demo_mode = None
+        self.prepare_task = None
         self.trade_task = None
+        self.stop_task = None
+        self.settle_task = None
+        self.pipeline = None
+        self.feed_factory = None  # asset -> feed with PriceFeed's interface, e.g. a replay
+        self.recorder = None  # DecisionRecorder logging signals, risk decisions and orders
+        self.tick_recorder = None
+        if TRADING_CONFIG['TICK_LOG'] and broker is None:
+            self.tick_recorder = TickRecorder(str(TRADING_CONFIG['TICK_LOG']))
+        # Selenium is not thread-safe: every browser call goes through this one thread
+        self.browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='browser')
+        self.metrics_server = None
+        self.browser_state = 'not started'
+        self.browser_ready = asyncio.Event()
+        self.browser_startup_seconds = None
+        self.last_balance = None
+        self.last_price = None
+        self.last_trade = None
+        self.last_signals = None
+        self.last_loop_latency = None
         # Set the trading bot reference in telegram_bot
         self.telegram_bot.set_trading_bot(self)
 
+    @property
+    def quotex(self):
+        """Quotex browser interface, created (and Selenium imported) on first use."""
+        if self._quotex is None:
+            from src.scraper.quotex_interface import QuotexInterface
+            self._quotex = QuotexInterface(headless=True, clock=self.clock)
+        return self._quotex
+
+    @property
+    def is_demo_mode(self):
+        """Whether the browser session is on the demo account."""
+        return self._quotex is not None and self._quotex.is_demo_mode
+
+    @property
+    def strategy(self):
+        """Strategy holding the indicator state of the current asset."""
+        return self.get_strategy(self.current_asset)
+
+    def get_strategy(self, asset):
+        """Get the strategy of an asset: in memory, restored after eviction, or new."""
+        return self.strategies.get(asset)
+
+    def switch_asset(self, asset):
+        """Switch the traded asset; the browser follows on the next loop iteration."""
+        if asset != self.current_asset:
+            self.current_asset = asset
+            self.asset_selected = False
+            self.last_signals = self.strategy.calculate_signals()
+            logger.info("Switching asset to %s", asset, extra={'asset': asset})
+
+    async def change_asset(self, asset):
+        """Select an asset in the browser and switch to it; False keeps the current asset.
+
+        Selecting first rejects unknown symbols before they reach the
+        trading loop or the strategy store.
+        """
+        if asset == self.current_asset:
+            return True
+        if self.browser_state != 'ready':
+            return False
+        try:
+            selected = await self.run_in_browser(self.quotex.select_asset, asset)
+        except Exception as e:
+            logger.error("Failed to select asset %s: %s", asset, e)
+            selected = False
+        if not selected:
+            self.asset_selected = False  # reselect the current asset on the next loop iteration
+            return False
+        self.switch_asset(asset)
+        self.asset_selected = True
+        return True
+
+    def request_demo_mode(self, enabled):
+        """Request a demo/live account switch; applied on the next loop iteration."""
+        self.pending_demo_mode = enabled
+
+    def apply_pending_changes(self):
+        """Apply queued asset and account changes to the browser session."""
+        if not self.asset_selected:
+            if not self.quotex.select_asset(self.current_asset):
+                return False
+            self.asset_selected = True
+
+        if self.pending_demo_mode is not None:
+            if self.pending_demo_mode != self.is_demo_mode:
+                switch = self.quotex.switch_to_demo if self.pending_demo_mode else self.quotex.switch_to_live
+                if not switch():
+                    return False
+                # Balance belongs to the previous account
+                self.last_balance = None
+            self.pending_demo_mode = None
+
+        return True
+
+    async def run_in_browser(self, func, *args):
+        """Run a blocking browser call on the dedicated browser thread."""
+        loop = asyncio.get_running_loop()
+        async with self.clock.busy():
+            return await loop.run_in_executor(self.browser_executor, func, *args)
+
+    async def start_browser(self):
+        """Set up the browser and log in on the browser thread while Telegram is serving."""
+        self.browser_state = 'logging in'
+        started = time.perf_counter()
+        await self.telegram_bot.broadcast("Browser: logging in…")
+
+        try:
+            # Creating the interface here also imports Selenium off the event loop
+            logged_in = await self.run_in_browser(lambda: self.quotex.login())
+        except Exception as e:
+            logger.error("Browser startup failed: %s", e, exc_info=True)
+            logged_in = False
+
+        self.browser_startup_seconds = time.perf_counter() - started
+        self.browser_state = 'ready' if logged_in else 'failed'
+        # Wake waiters on failure too; they check browser_state
+        self.browser_ready.set()
+
+        if logged_in:
+            logger.info("Browser ready in %.1fs", self.browser_startup_seconds)
+            await self.telegram_bot.broadcast(f"Browser: ready in {self.browser_startup_seconds:.1f} s")
+        else:
+            logger.error("Failed to login to Quotex")
+            await self.telegram_bot.broadcast("Browser: login to Quotex failed, check the logs")
+
+    async def wait_for_browser(self):
+        """Wait until browser startup finished; returns True if it is usable."""
+        await self.browser_ready.wait()
+        return self.browser_state == 'ready'
+
     async def start_trading(self):
-        """Start the trading loop."""
+        """Start the staged trading pipeline."""
+        if self.stop_task is not None and not self.stop_task.done():
+            await self.stop_task  # let the previous pipeline finish draining
         if self.is_trading:
             logger.warning("Trading is already active")
             return
 
         self.is_trading = True
+        if not await self.wait_for_browser():
+            logger.error("Cannot start trading without a logged-in browser")
+            self.is_trading = False
+            return
         logger.info("Starting trading loop")
+        if self.settle_task is None or self.settle_task.done():
+            self.settle_task = asyncio.create_task(self.settle_trades())
+
+        # On stop only notifications of placed trades are finished; queued orders are dropped
+        self.pipeline = Pipeline(drain_timeout=PIPELINE_CONFIG['DRAIN_TIMEOUT'], drain_from='notify')
+        self.pipeline.add_stage(
+            'indicators', self.indicators_stage,
+            PIPELINE_CONFIG['INDICATORS_QUEUE'], policy=DROP_OLDEST,
+            droppable=lambda event: event['kind'] == 'tick'  # bar closes are never dropped
+        )
+        self.pipeline.add_stage('risk', self.risk_stage, PIPELINE_CONFIG['RISK_QUEUE'])
+        self.pipeline.add_stage(
+            'execution', self.execution_stage,
+            PIPELINE_CONFIG['EXECUTION_QUEUE'], on_discard=self.discard_order
+        )
+        self.pipeline.add_stage(
+            'notify', self.notify_stage,
+            PIPELINE_CONFIG['NOTIFY_QUEUE'], workers=PIPELINE_CONFIG['NOTIFY_WORKERS']
+        )
+
+        try:
+            await self.pipeline.run(self.feed_source)
+        finally:
+            self.is_trading = False
+
+    async def feed_source(self, indicators):
+        """Produce price events into the indicators stage while trading."""
+        backoff = Backoff(maximum=TRADING_CONFIG['BACKOFF_MAX'], clock=self.clock)
+        stats = self.pipeline.source_stats
+        feed = None
 
         while self.is_trading:
             try:
-                # Get current balance
-                balance = self.quotex.get_balance()
-                if balance is None:
-                    logger.error("Failed to get balance")
+                # Follow asset or account changes requested from Telegram
+                if not await self.run_in_browser(self.apply_pending_changes):
+                    logger.error("Failed to apply pending asset/account changes")
+                    stats.errors += 1
+                    await backoff.wait()
                     continue
 
-                # Check if we can trade based on risk management
-                if not self.risk_manager.can_trade(balance):
-                    logger.info("Trading paused due to risk management rules")
-                    await asyncio.sleep(60)  # Check again in 1 minute
-                    continue
+                if feed is None or feed.asset != self.current_asset:
+                    feed = self.create_feed(self.current_asset)
+                    await self.warm_start(feed.asset)
 
-                # Get current price and update strategy
-                current_price = self.quotex.get_current_price()
-                if current_price is None:
+                # Wait for the price to move or a bar to close
+                read_started = time.perf_counter()
+                event = await feed.next_event()
+                if event is None:
                     logger.error("Failed to get current price")
+                    stats.errors += 1
+                    await backoff.wait()
                     continue
+                backoff.reset()
 
-                self.strategy.add_price(current_price)
-                signals = self.strategy.calculate_signals()
+                kind, payload, timestamp = event
+                if kind == 'tick':
+                    self.last_price = payload
+                    if self.positions.on_tick(feed.asset, payload, timestamp):
+                        self.quotex.invalidate_balance()  # the payout is credited
+                    if self.tick_recorder:
+                        self.tick_recorder.record(timestamp, feed.asset, payload)
+                stats.record(time.perf_counter() - read_started)
+                await indicators.put({
+                    'kind': kind,
+                    'payload': payload,
+                    'timestamp': timestamp,
+                    'asset': feed.asset,
+                    'received': time.perf_counter(),
+                })
 
-                if signals and signals['signal']:
-                    # Calculate position size
-                    position_size = self.risk_manager.calculate_position_size(balance)
-                    if position_size is None:
-                        continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Error in trading loop: %s", e)
+                stats.errors += 1
+                await backoff.wait()
 
-                    # Place trade
-                    trade_result = self.quotex.place_trade(
-                        signals['signal'],
-                        position_size
+    def create_feed(self, asset):
+        """Create the price feed of an asset, polling the browser unless a feed factory is set."""
+        if self.feed_factory:
+            return self.feed_factory(asset)
+        return PriceFeed(
+            asset,
+            lambda: self.run_in_browser(self.quotex.get_current_price),
+            TRADING_CONFIG['DEFAULT_TIMEFRAME'],
+            TRADING_CONFIG['TICK_INTERVAL'],
+            self.clock
+        )
+
+    async def warm_start(self, asset):
+        """Fill an asset's bar history from the chart's loaded candles, else the market data store.
+
+        Only closed bars are loaded; the forming one is completed by the feed.
+        """
+        if (not TRADING_CONFIG['WARM_START'] or self.feed_factory
+                or TRADING_CONFIG['SIGNAL_EVENT'] != 'bar'):
+            return
+        strategy = self.get_strategy(asset)
+        seconds = timeframe_to_seconds(TRADING_CONFIG['DEFAULT_TIMEFRAME'])
+        current_bar = self.clock.time() // seconds * seconds
+        try:
+            source = 'chart'
+            candles = await self.run_in_browser(self.quotex.get_chart_candles, strategy.history_size + 1)
+            bars = [(candle['time'], candle['close']) for candle in candles or []]
+            if len(bars) <= strategy.history_size:
+                source = 'store'
+                # Keep virtual time still while the store is read off the loop
+                async with self.clock.busy():
+                    bars = await asyncio.get_running_loop().run_in_executor(
+                        None, self.load_stored_bars, asset,
+                        current_bar - (strategy.history_size + 1) * seconds, current_bar
                     )
+            bars = [bar for bar in bars if bar[0] < current_bar]
+            last_bar = strategy.bar_time
+            if not bars or (last_bar is not None and bars[-1][0] <= last_bar):
+                return  # the strategy is already at the newest closed bar
+            if (last_bar is not None and len(bars) < strategy.history_size
+                    and bars[0][0] - seconds <= last_bar):
+                # No gap: extend the held history with the newer bars only
+                bars = [(None, close) for close in strategy.price_history] + [
+                    bar for bar in bars if bar[0] > last_bar
+                ]
+            # Otherwise the held history is stale or the loaded bars cover it: replace it
+            loaded = strategy.load_history(bars)
+        except Exception as e:
+            logger.error("Failed to warm start %s: %s", asset, e)
+            return
+        if asset == self.current_asset:
+            self.last_signals = strategy.calculate_signals()
+        logger.info("Warm start of %s: %d bars from the %s", asset, loaded, source, extra={'asset': asset})
+
+    @staticmethod
+    def load_stored_bars(asset, start, end):
+        """Closed bars of an asset from the market data store as ``(bar_time, close)`` pairs."""
+        from src.trading.market_store import MarketStore
+
+        bar_times, closes = MarketStore().load_bars(asset, TRADING_CONFIG['DEFAULT_TIMEFRAME'], start, end)
+        return list(zip(bar_times.tolist(), closes.tolist()))
+
+    def record_decision(self, kind, **fields):
+        """Add a decision to the replay log, if one is being recorded."""
+        if self.recorder:
+            self.recorder.record(kind, self.clock.time(), **fields)
+
+    async def indicators_stage(self, event):
+        """Update the strategy from a price event and emit actionable signals."""
+        if event['kind'] != TRADING_CONFIG['SIGNAL_EVENT']:
+            return None
+
+        strategy = self.get_strategy(event['asset'])
+        if event['kind'] == 'tick':
+            price, bar_time = event['payload'], event['timestamp']
+        else:
+            price, bar_time = event['payload']['close'], event['payload']['time']
+        strategy.add_price(price, bar_time)
+        signals = strategy.calculate_signals()
+        if event['asset'] == self.current_asset:
+            self.last_signals = signals
+        self.last_loop_latency = time.perf_counter() - event['received']
+
+        if event['asset'] != self.current_asset or not signals:
+            return None
+        if not signals['signal']:
+            if signals['armed'] and self.cooldown.is_ready():
+                self.prepare_order()
+            return None
+        self.record_decision(
+            'signal', asset=event['asset'], direction=signals['signal'], price=price, votes=signals['votes']
+        )
+        return {
+            'asset': event['asset'],
+            'direction': signals['signal'],
+            'price': price,
+            'votes': signals['votes'],
+            'received': event['received'],
+        }
+
+    async def read_balance(self):
+        """Get the account balance, skipping the page read while the last one is fresh."""
+        quotex = self.quotex
+        if quotex.is_balance_fresh(TRADING_CONFIG['BALANCE_MAX_AGE']):
+            return quotex.balance
+        balance = await self.run_in_browser(quotex.get_balance)
+        if balance is not None:
+            self.last_balance = balance
+        return balance
+
+    def prepare_order(self):
+        """Refresh the balance and preset the amount field while a signal is near."""
+        if self.prepare_task is not None and not self.prepare_task.done():
+            return
+        self.prepare_task = asyncio.create_task(self._prepare_order())
+
+    async def _prepare_order(self):
+        try:
+            balance = await self.read_balance()
+            if balance is None:
+                return
+            amount = self.risk_manager.calculate_position_size(balance)
+            if amount is not None and amount != self.quotex.preset_amount:
+                await self.run_in_browser(
+                    self.quotex.set_amount, amount, TRADING_CONFIG['FAST_ORDER_ENTRY']
+                )
+        except Exception as e:
+            logger.error("Failed to prepare order: %s", e)
+
+    async def risk_stage(self, signal):
+        """Turn a signal into a sized order if cooldown and risk rules allow it."""
+        if not self.cooldown.is_ready():
+            logger.debug("Signal %s skipped, cooldown %.0fs", signal['direction'], self.cooldown.remaining())
+            self.record_decision('risk', decision='cooldown')
+            return None
+
+        # Get current balance, reusing a fresh read
+        balance = await self.read_balance()
+        if balance is None:
+            logger.error("Failed to get balance")
+            self.record_decision('risk', decision='no_balance')
+            return None
+        self.last_balance = balance
+
+        # Check if we can trade based on risk management
+        if not self.risk_manager.can_trade(balance):
+            logger.info("Trading paused due to risk management rules")
+            self.record_decision('risk', decision='blocked', balance=balance)
+            return None
 
-                    if trade_result:
-                        # Take screenshot of the trade
-                        screenshot_path = f"screenshots/trade_{int(time.time())}.png"
-                        self.quotex.take_screenshot(screenshot_path)
+        # Calculate position size
+        position_size = self.risk_manager.calculate_position_size(balance)
+        if position_size is None:
+            self.record_decision('risk', decision='no_size', balance=balance)
+            return None
+        self.record_decision('risk', decision='approved', balance=balance, amount=position_size)
 
-                        # Send trade notification
-                        await self.telegram_bot.send_trade_notification(
-                            signals['signal'],
-                            position_size,
-                            current_price,
-                            screenshot_path
-                        )
+        # Reserve the cooldown now so queued signals cannot double-trade
+        self.cooldown.record_trade()
+        return dict(signal, amount=position_size)
 
-                # Wait for next check
-                await asyncio.sleep(TRADING_CONFIG['MIN_DELAY'])
+    async def execution_stage(self, order):
+        """Place an order in the browser and hand it over for notification."""
+        trade_result = await self.run_in_browser(
+            self.quotex.place_trade,
+            order['direction'],
+            order['amount'],
+            TRADING_CONFIG['FAST_ORDER_ENTRY']
+        )
+        self.record_decision(
+            'order', asset=order['asset'], direction=order['direction'], amount=order['amount'],
+            placed=bool(trade_result)
+        )
+        if not trade_result:
+            self.cooldown.reset()
+            return None
 
+        opened_at = self.clock.time()
+        self.last_trade = {
+            'asset': order['asset'],
+            'direction': order['direction'],
+            'amount': order['amount'],
+            'price': order['price'],
+            'votes': order['votes'],
+            'opened_at': opened_at,
+            'expires_at': opened_at + TRADING_CONFIG['TRADE_EXPIRY'],
+        }
+        self.positions.open(self.last_trade)
+        latency = time.perf_counter() - order['received']
+        logger.info(
+            "Signal-to-order latency: %.3fs",
+            latency,
+            extra={'trade': self.last_trade, 'asset': order['asset'], 'latency': latency}
+        )
+
+        # Take screenshot of the trade
+        screenshot_path = f"screenshots/trade_{int(self.clock.time())}.png"
+        if not await self.run_in_browser(self.quotex.take_screenshot, screenshot_path):
+            screenshot_path = None
+        return dict(order, screenshot_path=screenshot_path)
+
+    def discard_order(self, order):
+        """Drop an order that was sized but not placed before trading stopped."""
+        logger.warning(
+            "Trading stopped, %s order of $%.2f on %s not placed",
+            order['direction'], order['amount'], order['asset'], extra={'asset': order['asset']}
+        )
+        self.record_decision(
+            'order', asset=order['asset'], direction=order['direction'], amount=order['amount'],
+            placed=False
+        )
+        self.cooldown.reset()  # the order reserved the cooldown in risk_stage
+
+    async def notify_stage(self, trade):
+        """Send the trade notification to the admins."""
+        await self.telegram_bot.send_trade_notification(
+            trade['direction'],
+            trade['amount'],
+            trade['price'],
+            trade['screenshot_path']
+        )
+
+    async def settle_trades(self):
+        """Settle expired trades the tick feed could not, from one batched history read."""
+        positions = self.positions
+        while self.is_trading or positions.pending or positions.unresolved:
+            try:
+                await self.clock.sleep(TRADING_CONFIG['SETTLE_INTERVAL'])
+                now = self.clock.time()
+                positions.abandon(now - TRADING_CONFIG['SETTLE_TIMEOUT'])
+                if not positions.collect_overdue(now - TRADING_CONFIG['SETTLE_GRACE']):
+                    continue
+
+                history = await self.run_in_browser(
+                    self.quotex.get_trade_history, TRADING_CONFIG['HISTORY_ROWS']
+                )
+                if history and positions.settle_from_history(history):
+                    self.quotex.invalidate_balance()
+
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error in trading loop: {str(e)}")
-                await asyncio.sleep(60)  # Wait before retrying
+                logger.error("Error settling trades: %s", e)
+
+    def get_pipeline_stats(self):
+        """Get per-stage latency and queue-depth counters."""
+        if self.pipeline is None:
+            return {}
+        return self.pipeline.get_stats()
+
+    def collect_pipeline_metrics(self):
+        """Expose pipeline queue depths and drop counts as gauges."""
+        samples = []
+        for stage, stats in self.get_pipeline_stats().items():
+            samples.append(('pipeline_queue_depth', {'stage': stage}, stats['queue_depth']))
+            samples.append(('pipeline_dropped', {'stage': stage}, stats['dropped']))
+            samples.append(('pipeline_errors', {'stage': stage}, stats['errors']))
+        return samples
+
+    def get_status_snapshot(self):
+        """Get an in-memory snapshot of the bot state for status views."""
+        return {
+            'is_trading': self.is_trading,
+            'asset': self.current_asset,
+            'is_demo': self.is_demo_mode,
+            'balance': self.last_balance,
+            'price': self.last_price,
+            'last_trade': self.last_trade,
+            'pnl': self.risk_manager.get_total_profit(),
+            'open_trades': self.positions.get_open_trades(),
+            'unknown_trades': list(self.positions.unknown),
+            'signals': self.last_signals,
+            'loop_latency': self.last_loop_latency,
+            'browser': self.browser_state,
+            'browser_startup_seconds': self.browser_startup_seconds,
+            'pipeline': self.get_pipeline_stats(),
+        }
+
+    def request_stop(self):
+        """Stop trading at once and finish pending notifications in the background."""
+        self.is_trading = False
+        if self.stop_task is None or self.stop_task.done():
+            self.stop_task = asyncio.create_task(self.stop_trading())
+        return self.stop_task
 
     async def stop_trading(self):
-        """Stop the trading loop."""
+        """Stop the feed, drop queued orders and wait for pending notifications."""
         self.is_trading = False
-        if self.trade_task:
-            self.trade_task.cancel()
+        if self.pipeline:
+            self.pipeline.stop()
+        if self.trade_task and not self.trade_task.done():
+            try:
+                # wait_for cancels the pipeline if draining takes too long
+                await asyncio.wait_for(self.trade_task, PIPELINE_CONFIG['DRAIN_TIMEOUT'])
+            except asyncio.TimeoutError:
+                logger.warning("Trading loop did not drain within %ss, cancelled", PIPELINE_CONFIG['DRAIN_TIMEOUT'])
+            except Exception as e:
+                logger.error("Trading loop failed while stopping: %s", e)
         logger.info("Trading stopped")
 
     def start(self):
         """Start the trading bot."""
         try:
-            # Initialize Quotex interface
-            if not self.quotex.login():
-                logger.error("Failed to login to Quotex")
-                return
+            if METRICS_CONFIG['ENABLED']:
+                self.metrics_server = MetricsServer(
+                    REGISTRY, METRICS_CONFIG['HOST'], METRICS_CONFIG['PORT']
+                )
+                REGISTRY.add_collector(self.collect_pipeline_metrics)
+                REGISTRY.add_collector(self.indicator_cache.collect_metrics)
+                REGISTRY.add_collector(self.strategies.collect_metrics)
+                self.metrics_server.start()
 
-            # Start Telegram bot
+            # Start Telegram bot; the browser logs in from its post_init hook
             logger.info("Starting Telegram bot...")
             self.telegram_bot.run()
 
@@ -126,12 +606,25 @@ class TradingBot:
         """Stop the trading bot."""
         try:
             self.is_trading = False
-            self.quotex.close()
+            # Persist trades and ticks first; closing the browser can fail
+            if self.risk_manager.journal is not None:
+                self.risk_manager.journal.close()
+            if self.tick_recorder:
+                self.tick_recorder.close()
+            if self._quotex is not None:
+                self._quotex.close()
+            self.browser_executor.shutdown(wait=False)
+            if self.metrics_server:
+                self.metrics_server.stop()
             logger.info("Trading bot stopped")
+            stop_logging()
         except Exception as e:
             logger.error(f"Error stopping bot: {str(e)}", exc_info=True)
 
 def main():
+    load_config()
+    setup_logging()
+
     try:
         # Initialize credentials
         telegram_token = Credentials.get_telegram_token()
@@ -142,8 +635,19 @@ def main():
         logger.info(f"Admin IDs: {admin_ids}")
 
         # Initialize and start trading bot
-        bot = TradingBot()
-        bot.start()
+        # The paper broker times its trades on the bot's clock so they settle against its ticks
+        clock = REAL_CLOCK
+        broker = None
+        if PAPER_CONFIG['ENABLED']:
+            from src.trading.paper_broker import create_paper_broker
+            broker = create_paper_broker(clock)
+            logger.info("Paper trading enabled, no browser will be started")
+        bot = TradingBot(broker, clock)
+        try:
+            bot.start()
+        finally:
+            # run_polling returns on Ctrl+C too: commit queued journal trades and recorded ticks
+            bot.stop()
 
     except Exception as e:
         logger.error(f"Error in main: {str(e)}", exc_info=True)
@@ -24,10 +24,16 @@ class QuotexScraper:
         self.email = os.getenv('QUOTEX_EMAIL')
         self.password = os.getenv('QUOTEX_PASSWORD')
         self.proxy = os.getenv('PROXY_SERVER')  # Format: "host:port" or "username:password@host:port"
+        self.current_asset = None  # asset whose trading page is loaded
+        # host:port of a Chrome started with remote debugging (src.scraper.chrome_sidecar)
+        self.debugger_address = os.getenv('CHROME_DEBUGGER_ADDRESS')
+        self.attached = False
         logger.info("QuotexScraper initialized")
         
     def setup_driver(self):
         """Set up undetected Chrome WebDriver with anti-detection measures."""
+        if self.debugger_address:
+            return self.attach_driver()
         try:
             logger.info("Setting up undetected Chrome WebDriver...")
             
@@ -69,6 +75,21 @@ class QuotexScraper:
             logger.error(f"Failed to setup WebDriver: {str(e)}")
             return False
         
+    def attach_driver(self):
+        """Attach to the running Chrome at CHROME_DEBUGGER_ADDRESS instead of launching one."""
+        try:
+            logger.info(f"Attaching to Chrome at {self.debugger_address}...")
+            options = Options()
+            options.add_experimental_option('debuggerAddress', self.debugger_address)
+            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+            self.wait = WebDriverWait(self.driver, 30)
+            self.attached = True
+            logger.info(f"Attached to Chrome, current page: {self.driver.current_url}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to attach to Chrome: {str(e)}")
+            return False
+
     def random_delay(self, min_seconds=1, max_seconds=3):
         """Add a random delay to mimic human behavior."""
         delay = random.uniform(min_seconds, max_seconds)
@@ -98,6 +119,10 @@ class QuotexScraper:
     def login(self):
         """Log in to Quotex."""
         try:
+            if self.attached and self.driver.find_elements(By.CLASS_NAME, 'balance'):
+                logger.info("Attached browser is already logged in")
+                return True
+
             logger.info("Attempting to login to Quotex...")
             # First navigate to the homepage
             self.driver.get('https://quotex.com/')
@@ -390,13 +415,15 @@ class QuotexScraper:
         """Place a trade on the specified asset."""
         try:
             logger.info(f"Attempting to place {direction} trade for {asset} with amount {amount}")
-            # Navigate to trading page
-            self.driver.get(f'https://quotex.com/trading/{asset}')
-            logger.info(f"Navigated to trading page for {asset}")
-            self.random_delay(5, 8)
-            
-            # Take screenshot for debugging
-            self.driver.save_screenshot('trading_page.png')
+            # Navigate to trading page, unless it is already loaded
+            if self.current_asset != asset or not self.driver.current_url.endswith(f'/trading/{asset}'):
+                self.driver.get(f'https://quotex.com/trading/{asset}')
+                logger.info(f"Navigated to trading page for {asset}")
+                self.random_delay(5, 8)
+                self.current_asset = asset
+
+                # Take screenshot for debugging
+                self.driver.save_screenshot('trading_page.png')
             
             # Select direction (call/put)
             logger.info(f"Looking for {direction} button...")
@@ -467,6 +494,11 @@ class QuotexScraper:
     def close(self):
         """Close the browser."""
         if self.driver:
+            if self.attached:
+                # Leave the sidecar browser and its session running
+                self.driver.service.stop()
+                logger.info("Detached from browser")
+                return
             logger.info("Closing browser...")
             self.driver.quit()
             logger.info("Browser closed")
@@ -1,18 +1,46 @@
+import asyncio
 import logging
+from functools import partial
 from telegram import Update
 from telegram.ext import ContextTypes
+from telegram.ext import CommandHandler as TelegramCommandHandler
 from config.credentials import Credentials
+from config.config import TRADING_CONFIG, RISK_SIMULATION_CONFIG
+from src.monitoring.metrics import REGISTRY
 
 logger = logging.getLogger(__name__)
 
 class CommandHandler:
-    def __init__(self):
+    def __init__(self, trading_bot=None):
         self.admin_ids = Credentials.get_admin_ids()
+        self.trading_bot = trading_bot
+
+    def set_trading_bot(self, trading_bot):
+        """Set the trading bot reference after initialization."""
+        self.trading_bot = trading_bot
 
     def is_admin(self, user_id: int) -> bool:
         """Check if user is an admin."""
         return user_id in self.admin_ids
 
+    def register(self, application) -> None:
+        """Register the slash commands on a telegram Application."""
+        commands = {
+            'stop': self.handle_stop,
+            'status': self.handle_status,
+            'balance': self.handle_balance,
+            'asset': self.handle_asset,
+            'settings': self.handle_settings,
+            'demo': self.handle_demo,
+            'perf': self.handle_perf,
+            'risk': self.handle_risk,
+            'tabs': self.handle_tabs,
+            'reconcile': self.handle_reconcile,
+            'help': self.handle_help,
+        }
+        for name, callback in commands.items():
+            application.add_handler(TelegramCommandHandler(name, callback))
+
     async def handle_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /start command."""
         if not self.is_admin(update.effective_user.id):
@@ -29,6 +57,10 @@ class CommandHandler:
             "/asset [name] - Change trading asset\n"
             "/settings - View/change bot settings\n"
             "/demo - Toggle demo mode\n"
+            "/perf - Show latency percentiles\n"
+            "/risk [win%] [trades] - Simulate drawdowns and risk of ruin\n"
+            "/tabs - Show the price and memory of every asset tab\n"
+            "/reconcile [win|loss|tie] - Settle a trade whose result could not be read\n"
             "/help - Show this help message"
         )
 
@@ -38,7 +70,11 @@ class CommandHandler:
             await update.message.reply_text("You are not authorized to use this bot.")
             return
 
-        # TODO: Implement stop trading logic
+        if not self.trading_bot.is_trading:
+            await update.message.reply_text("Trading is not active")
+            return
+
+        self.trading_bot.request_stop()
         await update.message.reply_text("Stopping trading operations...")
 
     async def handle_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -47,13 +83,37 @@ class CommandHandler:
             await update.message.reply_text("You are not authorized to use this bot.")
             return
 
-        # TODO: Implement status check logic
+        snapshot = self.trading_bot.get_status_snapshot()
+        stats = self.trading_bot.risk_manager.get_trade_stats()
+        lifetime = self.trading_bot.risk_manager.get_lifetime_stats()
+        last_trade = snapshot['last_trade']
+        if last_trade:
+            last_trade_text = (
+                f"{last_trade['direction'].upper()} {last_trade['asset']} "
+                f"${last_trade['amount']:.2f} @ {last_trade['price']}"
+            )
+        else:
+            last_trade_text = "None"
+
         await update.message.reply_text(
             "Bot Status:\n"
-            "Trading: Not Active\n"
-            "Current Asset: EURUSD\n"
-            "Mode: Live\n"
-            "Last Trade: None"
+            f"Trading: {'Active' if snapshot['is_trading'] else 'Not Active'}\n"
+            f"Current Asset: {snapshot['asset']}\n"
+            f"Mode: {'Demo' if snapshot['is_demo'] else 'Live'}\n"
+            f"Browser: {snapshot['browser']}\n"
+            f"Last Trade: {last_trade_text}\n"
+            f"Open Trades: {len(snapshot['open_trades'])}\n"
+            + (
+                f"Unsettled Trades: {len(snapshot['unknown_trades'])} (trading paused, see /reconcile)\n"
+                if snapshot['unknown_trades'] else ""
+            ) +
+            f"P&L: ${snapshot['pnl']:.2f}\n"
+            f"Total Trades: {stats['total_trades']}\n"
+            f"Win Rate: {stats['win_rate']}%"
+            + (
+                f"\nLifetime: {lifetime['total_trades']} trades, ${lifetime['net_profit']:.2f}"
+                if lifetime else ""
+            )
         )
 
     async def handle_balance(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -62,8 +122,12 @@ class CommandHandler:
             await update.message.reply_text("You are not authorized to use this bot.")
             return
 
-        # TODO: Implement balance check logic
-        await update.message.reply_text("Current Balance: $0.00")
+        balance = self.trading_bot.get_status_snapshot()['balance']
+        if balance is None:
+            await update.message.reply_text("Balance not available yet - it is refreshed by the trading loop")
+            return
+
+        await update.message.reply_text(f"Current Balance: ${balance:.2f}")
 
     async def handle_asset(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /asset command."""
@@ -72,12 +136,24 @@ class CommandHandler:
             return
 
         if not context.args:
-            await update.message.reply_text("Please specify an asset. Example: /asset EURUSD")
+            await update.message.reply_text(
+                f"Current asset: {self.trading_bot.current_asset}\n"
+                "Please specify an asset. Example: /asset EURUSD"
+            )
             return
 
         asset = context.args[0].upper()
-        # TODO: Implement asset change logic
-        await update.message.reply_text(f"Changing asset to {asset}...")
+        if not await self.trading_bot.change_asset(asset):
+            await update.message.reply_text(
+                f"Could not select {asset}, still on {self.trading_bot.current_asset}. "
+                "Check the symbol, or wait until the browser is ready."
+            )
+            return
+        info = self.trading_bot.strategy.get_strategy_info()
+        await update.message.reply_text(
+            f"Switched asset to {asset}\n"
+            f"Price history: {info['price_history_length']}/{info['history_size']}"
+        )
 
     async def handle_settings(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /settings command."""
@@ -85,13 +161,24 @@ class CommandHandler:
             await update.message.reply_text("You are not authorized to use this bot.")
             return
 
-        # TODO: Implement settings display/change logic
+        settings = self.trading_bot.strategy.get_strategy_info()
+        risk_settings = self.trading_bot.risk_manager.get_risk_settings()
+        indicators = settings['indicators']
+        if indicators:
+            indicators_text = f"SMA {indicators['sma']:.5f}, RSI {indicators['rsi']:.1f}"
+        else:
+            indicators_text = "warming up"
+        strategy_names = ', '.join(strategy['name'] for strategy in settings['strategies'])
         await update.message.reply_text(
             "Current Settings:\n"
-            "Risk per trade: 2%\n"
-            "Strategy: SMA/RSI\n"
-            "Timeframe: 1m\n"
-            "Demo Mode: Off"
+            f"Risk per trade: {risk_settings['risk_percentage']*100:g}%\n"
+            f"Strategies: {strategy_names} ({settings['voting_policy']})\n"
+            f"Strategy: SMA({settings['sma_period']})/RSI({settings['rsi_period']})\n"
+            f"RSI Levels: {settings['rsi_oversold']}/{settings['rsi_overbought']}\n"
+            f"Indicators: {indicators_text}\n"
+            f"Timeframe: {TRADING_CONFIG['DEFAULT_TIMEFRAME']}\n"
+            f"Trade Delay: {risk_settings['min_delay']}-{risk_settings['max_delay']}s\n"
+            f"Demo Mode: {'On' if self.trading_bot.is_demo_mode else 'Off'}"
         )
 
     async def handle_demo(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -100,9 +187,175 @@ class CommandHandler:
             await update.message.reply_text("You are not authorized to use this bot.")
             return
 
-        # TODO: Implement demo mode toggle logic
-        await update.message.reply_text("Toggling demo mode...")
+        if not self.trading_bot.browser_ready.is_set():
+            await update.message.reply_text("Browser is still logging in, the switch will follow when it is ready…")
+        if not await self.trading_bot.wait_for_browser():
+            await update.message.reply_text("Browser is not available")
+            return
+
+        enabled = not self.trading_bot.is_demo_mode
+        self.trading_bot.request_demo_mode(enabled)
+        if not self.trading_bot.is_trading:
+            # No loop is running to pick the change up, apply it now
+            if not await self.trading_bot.run_in_browser(self.trading_bot.apply_pending_changes):
+                await update.message.reply_text("Failed to toggle demo mode")
+                return
+
+        await update.message.reply_text(f"Switching to {'demo' if enabled else 'live'} account...")
+
+    async def handle_perf(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Handle the /perf command."""
+        if not self.is_admin(update.effective_user.id):
+            await update.message.reply_text("You are not authorized to use this bot.")
+            return
+
+        quantiles = REGISTRY.get_quantiles()
+        if not quantiles:
+            await update.message.reply_text("No timings recorded yet")
+            return
+
+        lines = ["Latency p50 / p95 / p99 (ms):"]
+        for name, data in quantiles.items():
+            p50, p95, p99 = (data['quantiles'][q] * 1000 for q in (0.5, 0.95, 0.99))
+            lines.append(f"{name}: {p50:.1f} / {p95:.1f} / {p99:.1f} (n={data['count']})")
+
+        cache = self.trading_bot.indicator_cache.get_stats()
+        lines.append(
+            f"Indicator cache: {cache['hits']} hits / {cache['misses']} misses "
+            f"({cache['hit_rate']}%)"
+        )
+        await update.message.reply_text("\n".join(lines))
+
+    def get_simulation_inputs(self):
+        """Win rate, loss streak and balance to simulate from, preferring recorded trades."""
+        risk_manager = self.trading_bot.risk_manager
+        lifetime = risk_manager.get_lifetime_stats()
+        history = risk_manager.trade_history
+
+        if lifetime and lifetime['wins'] + lifetime['losses'] >= RISK_SIMULATION_CONFIG['MIN_HISTORY']:
+            win_rate = lifetime['wins'] / (lifetime['wins'] + lifetime['losses'])
+        elif len(history) >= RISK_SIMULATION_CONFIG['MIN_HISTORY']:
+            win_rate = sum(trade['result'] == 'win' for trade in history) / len(history)
+        else:
+            win_rate = RISK_SIMULATION_CONFIG['WIN_RATE']
+
+        loss_streak = 0
+        for trade in reversed(history):
+            if trade['result'] != 'loss':
+                break
+            loss_streak += 1
+
+        balance = self.trading_bot.get_status_snapshot()['balance'] or RISK_SIMULATION_CONFIG['BALANCE']
+        return win_rate, loss_streak, balance
+
+    async def handle_risk(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Handle the /risk command."""
+        if not self.is_admin(update.effective_user.id):
+            await update.message.reply_text("You are not authorized to use this bot.")
+            return
+
+        from src.trading.risk_simulation import simulate_risk
+
+        win_rate, loss_streak, balance = self.get_simulation_inputs()
+        trades = None
+        max_trades = RISK_SIMULATION_CONFIG['MAX_TRADES']
+        try:
+            if context.args:
+                win_rate = float(context.args[0]) / 100
+                if not 0 < win_rate < 1:
+                    raise ValueError(win_rate)
+            if len(context.args) > 1:
+                trades = int(context.args[1])
+                if not 1 <= trades <= max_trades:
+                    raise ValueError(trades)
+        except ValueError:
+            await update.message.reply_text(
+                "Usage: /risk [win rate %] [trades], with 0 < win rate < 100 "
+                f"and 1 <= trades <= {max_trades}. Example: /risk 56 500"
+            )
+            return
+
+        await update.message.reply_text("Simulating…")
+        loop = asyncio.get_running_loop()
+        # NumPy work kept off the event loop; both scenarios run side by side
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                None, partial(simulate_risk, win_rate, balance, trades=trades, loss_streak=loss_streak, resume=resume)
+            )
+            for resume in (False, True)
+        ))
+
+        lines = [
+            f"Risk of ruin: {results[0]['paths']} paths x {results[0]['trades']} signals",
+            f"Win rate {win_rate*100:.1f}%, payout {results[0]['payout']*100:g}%, "
+            f"risk {results[0]['risk_percentage']*100:g}%, balance ${balance:.2f}",
+        ]
+        for result in results:
+            drawdowns = result['drawdown_quantiles']
+            lines.extend([
+                "",
+                "Resuming after every pause:" if result['resume'] else "Pausing after 3 losses (current rules):",
+                f"Median trades: {result['median_trades']}, paused: {result['pause_probability']*100:.1f}%",
+                f"Ruin (>= {result['ruin_drawdown']*100:g}% drawdown): {result['ruin_probability']*100:.2f}%",
+                f"Max drawdown p50/p95/p99: {drawdowns['p50']*100:.1f}% / "
+                f"{drawdowns['p95']*100:.1f}% / {drawdowns['p99']*100:.1f}%",
+                f"Final balance p5/p50/p95: ${result['balance_quantiles']['p5']:.2f} / "
+                f"${result['balance_quantiles']['p50']:.2f} / ${result['balance_quantiles']['p95']:.2f}",
+            ])
+        await update.message.reply_text("\n".join(lines))
+
+    async def handle_tabs(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Handle the /tabs command."""
+        if not self.is_admin(update.effective_user.id):
+            await update.message.reply_text("You are not authorized to use this bot.")
+            return
+
+        if not self.trading_bot.browser_ready.is_set() or not await self.trading_bot.wait_for_browser():
+            await update.message.reply_text("Browser is not available")
+            return
+
+        status = await self.trading_bot.run_in_browser(self.trading_bot.quotex.get_tab_status)
+        if not status:
+            await update.message.reply_text("No asset tabs open (enable SELENIUM_CONFIG['ASSET_TABS'])")
+            return
+
+        lines = [f"Asset tabs ({len(status)}):"]
+        for asset, values in status.items():
+            price = f"{values['price']:.5f}" if values['price'] is not None else "n/a"
+            memory = f"{values['memory_mb']:.1f} MB" if values['memory_mb'] is not None else "n/a"
+            marker = " *" if asset == self.trading_bot.current_asset else ""
+            lines.append(f"{asset}{marker}: {price}, JS heap {memory}")
+        await update.message.reply_text("\n".join(lines))
+
+    async def handle_reconcile(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Handle the /reconcile command."""
+        if not self.is_admin(update.effective_user.id):
+            await update.message.reply_text("You are not authorized to use this bot.")
+            return
+
+        unknown = self.trading_bot.positions.unknown
+        if not context.args or context.args[0].lower() not in ('win', 'loss', 'tie'):
+            lines = [f"Unsettled trades: {len(unknown)}"]
+            for trade in unknown:
+                lines.append(
+                    f"{trade['direction'].upper()} {trade['asset']} ${trade['amount']:.2f} @ {trade['price']}"
+                )
+            lines.append("Usage: /reconcile win|loss|tie - settle the oldest one with its real result")
+            await update.message.reply_text("\n".join(lines))
+            return
+
+        outcome = self.trading_bot.positions.reconcile(context.args[0].lower())
+        if outcome is None:
+            await update.message.reply_text("No unsettled trades")
+            return
+        self.trading_bot.quotex.invalidate_balance()
+        remaining = len(unknown)
+        await update.message.reply_text(
+            f"Settled {outcome['direction'].upper()} {outcome['asset']} ${outcome['amount']:.2f}: "
+            f"{outcome['result']} {outcome['profit']:+.2f}\n"
+            + (f"{remaining} unsettled trades left, trading stays paused" if remaining else "Trading can resume")
+        )
 
     async def handle_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /help command."""
-        await self.handle_start(update, context)  # Reuse start command for help 
\ No newline at end of file
+        await self.handle_start(update, context)  # Reuse start command for help
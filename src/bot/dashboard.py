@@ -0,0 +1,113 @@
+import logging
+import asyncio
+import hashlib
+from telegram.error import BadRequest
+from config.config import TELEGRAM_CONFIG
+
+logger = logging.getLogger(__name__)
+
+class StatusDashboard:
+    """Keep one pinned status message per admin and edit it in place."""
+
+    def __init__(self, bot, admin_ids, snapshot_provider, interval=None):
+        self.bot = bot
+        self.admin_ids = admin_ids
+        self.snapshot_provider = snapshot_provider
+        self.interval = interval or TELEGRAM_CONFIG['UPDATE_INTERVAL']
+        self.message_ids = {}     # admin_id -> message_id of the pinned dashboard
+        self.content_hashes = {}  # admin_id -> hash of the text currently shown
+
+    def render(self, snapshot):
+        """Render a state snapshot as dashboard text."""
+        signals = snapshot.get('signals') or {}
+        latency = snapshot.get('loop_latency')
+        open_trades = snapshot.get('open_trades') or []
+
+        lines = [
+            "📊 Live Dashboard",
+            "",
+            f"Trading: {'Active' if snapshot.get('is_trading') else 'Inactive'}",
+            f"Asset: {snapshot.get('asset')}",
+            f"Mode: {'Demo' if snapshot.get('is_demo') else 'Live'}",
+            f"Browser: {snapshot.get('browser', 'n/a')}",
+            f"P&L: ${snapshot.get('pnl', 0):.2f}",
+            f"Open Trades: {len(open_trades)}",
+        ]
+        for trade in open_trades:
+            lines.append(f"  • {trade['direction'].upper()} ${trade['amount']:.2f} @ {trade['price']}")
+        unknown_trades = snapshot.get('unknown_trades') or []
+        if unknown_trades:
+            lines.append(f"Unsettled Trades: {len(unknown_trades)} - trading paused, /reconcile")
+
+        if signals:
+            lines.append(
+                f"Signal: {(signals.get('signal') or 'none').upper()} "
+                f"(RSI {signals['rsi']:.1f}, SMA {signals['sma']:.5f})"
+            )
+            votes = signals.get('votes') or {}
+            if len(votes) > 1:
+                for name, vote in votes.items():
+                    lines.append(f"  • {name}: {(vote or 'none').upper()}")
+        else:
+            lines.append("Signal: warming up")
+
+        lines.append(f"Loop Latency: {latency * 1000:.0f} ms" if latency is not None else "Loop Latency: n/a")
+
+        pipeline = snapshot.get('pipeline') or {}
+        if pipeline:
+            lines.append("")
+            lines.append("Pipeline (queue / avg latency):")
+            for name, stats in pipeline.items():
+                lines.append(f"  {name}: {stats['queue_depth']} / {stats['avg_latency'] * 1000:.0f} ms")
+        return "\n".join(lines)
+
+    async def refresh(self):
+        """Push the current snapshot to every admin whose view is out of date."""
+        text = self.render(self.snapshot_provider())
+        content_hash = hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+        for admin_id in self.admin_ids:
+            if self.content_hashes.get(admin_id) == content_hash:
+                continue
+            try:
+                await self._show(admin_id, text)
+                self.content_hashes[admin_id] = content_hash
+            except Exception as e:
+                logger.error("Failed to update dashboard for %s: %s", admin_id, e)
+
+    async def _show(self, admin_id, text):
+        """Edit the admin's dashboard message, creating and pinning it if needed."""
+        message_id = self.message_ids.get(admin_id)
+        if message_id is not None:
+            try:
+                await self.bot.edit_message_text(text, chat_id=admin_id, message_id=message_id)
+                return
+            except BadRequest as e:
+                if 'not modified' in str(e).lower():
+                    return
+                # The message was deleted or is no longer editable; post a fresh one
+                logger.warning("Dashboard message for %s lost, recreating: %s", admin_id, e)
+
+        message = await self.bot.send_message(chat_id=admin_id, text=text)
+        self.message_ids[admin_id] = message.message_id
+        try:
+            await self.bot.pin_chat_message(
+                chat_id=admin_id,
+                message_id=message.message_id,
+                disable_notification=True
+            )
+        except Exception as e:
+            logger.warning("Failed to pin dashboard for %s: %s", admin_id, e)
+
+    async def run(self):
+        """Refresh the dashboard every UPDATE_INTERVAL seconds until cancelled."""
+        logger.info("Dashboard started, refreshing every %ss", self.interval)
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # A bad snapshot or render must not end the dashboard for good
+                logger.error("Failed to refresh dashboard: %s", e, exc_info=True)
+            await asyncio.sleep(self.interval)
@@ -12,18 +12,32 @@ from telegram.ext import (
 )
 from config.credentials import Credentials
 from config.config import TELEGRAM_CONFIG
+from src.monitoring.metrics import timed, timer
+from .dashboard import StatusDashboard
 
 logger = logging.getLogger(__name__)
 
 # Conversation states
 SELECTING_ACTION, SELECTING_ASSET, SETTING_PARAMETERS = range(3)
 
+def format_trade_notification(direction, amount, price):
+    """Format the caption of a trade notification."""
+    return (
+        f"New Trade Executed:\n\n"
+        f"Direction: {'UP' if direction == 'up' else 'DOWN'}\n"
+        f"Amount: ${amount:.2f}\n"
+        f"Price: ${price:.2f}"
+    )
+
 class TelegramBot:
     def __init__(self, trading_bot=None):
         self.token = Credentials.get_telegram_token()
         self.admin_ids = Credentials.get_admin_ids()
         self.application = None
         self.trading_bot = trading_bot
+        self.dashboard = None
+        self.dashboard_task = None
+        self.startup_tasks = []
 
     def set_trading_bot(self, trading_bot):
         """Set the trading bot reference after initialization."""
@@ -71,7 +85,7 @@ class TelegramBot:
 
         elif query.data == 'stop_trading':
             if self.trading_bot.is_trading:
-                await self.trading_bot.stop_trading()
+                self.trading_bot.request_stop()
                 await query.edit_message_text("Stopping trading...")
             else:
                 await query.edit_message_text("Trading is not active")
@@ -104,7 +118,7 @@ class TelegramBot:
                 "Bot Status:\n\n"
                 f"Trading: {'Active' if self.trading_bot.is_trading else 'Inactive'}\n"
                 f"Current Asset: {self.trading_bot.current_asset}\n"
-                f"Mode: {'Demo' if self.trading_bot.quotex.is_demo_mode else 'Live'}\n\n"
+                f"Mode: {'Demo' if self.trading_bot.is_demo_mode else 'Live'}\n\n"
                 f"Trading Statistics:\n"
                 f"Total Trades: {stats['total_trades']}\n"
                 f"Win Rate: {stats['win_rate']}%\n"
@@ -115,7 +129,12 @@ class TelegramBot:
             await query.edit_message_text(message)
 
         elif query.data == 'balance':
-            balance = self.trading_bot.quotex.get_balance()
+            if not self.trading_bot.browser_ready.is_set():
+                await query.edit_message_text("Browser is still logging in, please wait…")
+            if not await self.trading_bot.wait_for_browser():
+                await query.edit_message_text("Browser is not available")
+                return SELECTING_ACTION
+            balance = await self.trading_bot.run_in_browser(self.trading_bot.quotex.get_balance)
             if balance is not None:
                 await query.edit_message_text(f"Current Balance: ${balance:.2f}")
             else:
@@ -123,33 +142,73 @@ class TelegramBot:
 
         return SELECTING_ACTION
 
+    async def broadcast(self, text):
+        """Send a text message to all admin users."""
+        for admin_id in self.admin_ids:
+            try:
+                await self.application.bot.send_message(chat_id=admin_id, text=text)
+            except Exception as e:
+                logger.error("Failed to send message to %s: %s", admin_id, e)
+
+    @timed('telegram')
     async def send_trade_notification(self, direction, amount, price, screenshot_path):
         """Send trade notification to all admin users."""
-        message = (
-            f"New Trade Executed:\n\n"
-            f"Direction: {'UP' if direction == 'up' else 'DOWN'}\n"
-            f"Amount: ${amount:.2f}\n"
-            f"Price: ${price:.2f}"
-        )
+        message = format_trade_notification(direction, amount, price)
 
         for admin_id in self.admin_ids:
             try:
-                with open(screenshot_path, 'rb') as photo:
+                if screenshot_path is None:
+                    await self.application.bot.send_message(chat_id=admin_id, text=message)
+                    continue
+                with open(screenshot_path, 'rb') as photo, timer('telegram', 'send_photo'):
                     await self.application.bot.send_photo(
                         chat_id=admin_id,
                         photo=photo,
                         caption=message
                     )
             except Exception as e:
-                logger.error(f"Failed to send trade notification to {admin_id}: {str(e)}")
+                logger.error("Failed to send trade notification to %s: %s", admin_id, e)
 
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Log errors caused by updates."""
-        logger.error(f"Update {update} caused error {context.error}")
+        logger.error("Update %s caused error %s", update, context.error)
+
+    async def post_init(self, application: Application) -> None:
+        """Start background tasks once the application is initialized."""
+        if self.trading_bot:
+            # Bring the browser and analytics stack up while we already answer commands
+            loop = asyncio.get_running_loop()
+            self.startup_tasks = [
+                asyncio.create_task(self.trading_bot.start_browser()),
+                loop.run_in_executor(None, self.trading_bot.strategy.preload_dependencies),
+            ]
+
+        if TELEGRAM_CONFIG['DASHBOARD_ENABLED'] and self.trading_bot:
+            self.dashboard = StatusDashboard(
+                application.bot,
+                self.admin_ids,
+                self.trading_bot.get_status_snapshot
+            )
+            self.dashboard_task = asyncio.create_task(self.dashboard.run())
+
+    async def post_stop(self, application: Application) -> None:
+        """Cancel background tasks when the application stops."""
+        if self.dashboard_task:
+            self.dashboard_task.cancel()
+            self.dashboard_task = None
+        for task in self.startup_tasks:
+            task.cancel()
+        self.startup_tasks = []
 
     def run(self):
         """Run the bot."""
-        self.application = Application.builder().token(self.token).build()
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .post_init(self.post_init)
+            .post_stop(self.post_stop)
+            .build()
+        )
 
         # Add conversation handler
         conv_handler = ConversationHandler(
@@ -163,6 +222,11 @@ class TelegramBot:
         )
 
         self.application.add_handler(conv_handler)
+
+        # Add slash commands served from the trading bot's state
+        if self.trading_bot:
+            self.trading_bot.command_handler.register(self.application)
+
         self.application.add_error_handler(self.error_handler)
 
         # Start the bot
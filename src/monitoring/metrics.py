@@ -0,0 +1,261 @@
+import logging
+import time
+import bisect
+import functools
+import inspect
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = 'quotex_bot_'
+
+# Upper bounds in seconds, from a fast DOM read to a slow login
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+def _format_labels(labels, extra=None):
+    """Render a label tuple as a Prometheus label set."""
+    items = list(labels)
+    if extra:
+        items.append(extra)
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in items) + '}'
+
+class Counter:
+    """Monotonic counter."""
+
+    __slots__ = ('value', 'lock')
+
+    def __init__(self):
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def inc(self, amount=1):
+        """Increase the counter."""
+        with self.lock:
+            self.value += amount
+
+class Histogram:
+    """Fixed-bucket histogram of observed durations."""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count', 'lock')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def quantile(self, q):
+        """Estimate a quantile by interpolating inside its bucket."""
+        with self.lock:
+            counts = list(self.counts)
+            total = self.count
+        if total == 0:
+            return None
+
+        rank = q * total
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+class MetricsRegistry:
+    """Holds all counters and histograms and renders them for scraping."""
+
+    def __init__(self):
+        self.histograms = {}  # (name, labels) -> Histogram
+        self.counters = {}    # (name, labels) -> Counter
+        self.collectors = []  # callables returning [(name, labels, value)] gauges
+        self.lock = threading.Lock()
+
+    def histogram(self, name, **labels):
+        """Get or create the histogram for a name and label set."""
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self.lock:
+                histogram = self.histograms.setdefault(key, Histogram())
+        return histogram
+
+    def counter(self, name, **labels):
+        """Get or create the counter for a name and label set."""
+        key = (name, tuple(sorted(labels.items())))
+        counter = self.counters.get(key)
+        if counter is None:
+            with self.lock:
+                counter = self.counters.setdefault(key, Counter())
+        return counter
+
+    def add_collector(self, collector):
+        """Register a callable producing gauge samples at scrape time."""
+        self.collectors.append(collector)
+
+    def get_quantiles(self, quantiles=(0.5, 0.95, 0.99)):
+        """Get quantile estimates for every histogram with observations."""
+        result = {}
+        for (name, labels), histogram in sorted(self.histograms.items()):
+            if histogram.count:
+                label_text = ','.join(str(value) for _, value in labels)
+                result[f"{name}[{label_text}]" if label_text else name] = {
+                    'count': histogram.count,
+                    'quantiles': {q: histogram.quantile(q) for q in quantiles},
+                }
+        return result
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        seen = set()
+
+        for (name, labels), counter in sorted(self.counters.items()):
+            full_name = METRIC_PREFIX + name
+            if full_name not in seen:
+                lines.append(f"# TYPE {full_name} counter")
+                seen.add(full_name)
+            lines.append(f"{full_name}{_format_labels(labels)} {counter.value}")
+
+        for (name, labels), histogram in sorted(self.histograms.items()):
+            full_name = METRIC_PREFIX + name
+            if full_name not in seen:
+                lines.append(f"# TYPE {full_name} histogram")
+                seen.add(full_name)
+            with histogram.lock:
+                counts = list(histogram.counts)
+                total, total_sum = histogram.count, histogram.sum
+            cumulative = 0
+            for bound, bucket_count in zip(histogram.buckets + ('+Inf',), counts):
+                cumulative += bucket_count
+                lines.append(f"{full_name}_bucket{_format_labels(labels, ('le', bound))} {cumulative}")
+            lines.append(f"{full_name}_sum{_format_labels(labels)} {total_sum}")
+            lines.append(f"{full_name}_count{_format_labels(labels)} {total}")
+
+        for collector in self.collectors:
+            try:
+                for name, labels, value in collector():
+                    full_name = METRIC_PREFIX + name
+                    if full_name not in seen:
+                        lines.append(f"# TYPE {full_name} gauge")
+                        seen.add(full_name)
+                    lines.append(f"{full_name}{_format_labels(sorted(labels.items()))} {value}")
+            except Exception as e:
+                logger.error("Metrics collector failed: %s", e)
+
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = MetricsRegistry()
+
+@contextmanager
+def timer(component, operation):
+    """Time a block into the ``operation_seconds`` histogram."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        REGISTRY.counter('operation_errors_total', component=component, operation=operation).inc()
+        raise
+    finally:
+        REGISTRY.histogram(
+            'operation_seconds', component=component, operation=operation
+        ).observe(time.perf_counter() - started)
+
+def timed(component, operation=None):
+    """Decorator timing a sync or async function into ``operation_seconds``."""
+    def decorator(func):
+        name = operation or func.__name__
+        histogram = REGISTRY.histogram('operation_seconds', component=component, operation=name)
+        errors = REGISTRY.counter('operation_errors_total', component=component, operation=name)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                except Exception:
+                    errors.inc()
+                    raise
+                finally:
+                    histogram.observe(time.perf_counter() - started)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                errors.inc()
+                raise
+            finally:
+                histogram.observe(time.perf_counter() - started)
+        return wrapper
+
+    return decorator
+
+class MetricsServer:
+    """Serve ``/metrics`` over HTTP from a background thread."""
+
+    def __init__(self, registry=REGISTRY, host='127.0.0.1', port=9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """Start serving; returns False if the port could not be bound."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes would otherwise flood stderr
+
+        try:
+            self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            logger.error("Failed to start metrics server on %s:%s: %s", self.host, self.port, e)
+            return False
+
+        self.thread = threading.Thread(target=self.server.serve_forever, name='metrics', daemon=True)
+        self.thread.start()
+        logger.info("Metrics available at http://%s:%s/metrics", self.host, self.port)
+        return True
+
+    def stop(self):
+        """Stop the HTTP server."""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,92 @@
+"""Long-lived Chrome for the bot to attach to.
+
+Run it once, then start the bot with CHROME_DEBUGGER_ADDRESS set:
+
+    python -m src.scraper.chrome_sidecar --port 9222
+    CHROME_DEBUGGER_ADDRESS=127.0.0.1:9222 python main.py
+
+The bot logs in on first start; later restarts attach to the same browser
+and resume its logged-in page, so only the bot process is restarted.
+"""
+import json
+import shutil
+import logging
+import argparse
+import subprocess
+import urllib.request
+from config.config import SELENIUM_CONFIG
+
+logger = logging.getLogger(__name__)
+
+CHROME_NAMES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome')
+
+def find_chrome(binary=None):
+    """Path of the Chrome binary, or None when none is installed."""
+    if binary:
+        return shutil.which(binary) or binary
+    for name in CHROME_NAMES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+def build_command(binary, port, profile_dir, headless=True, user_agent=None):
+    """Chrome command line with the same flags SeleniumManager launches with."""
+    command = [
+        binary,
+        f'--remote-debugging-port={port}',
+        '--remote-debugging-address=127.0.0.1',
+        f'--user-data-dir={profile_dir}',
+        f'--user-agent={user_agent or SELENIUM_CONFIG["USER_AGENT"]}',
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--window-size=1920,1080',
+        '--disable-blink-features=AutomationControlled',
+        '--no-first-run',
+        '--no-default-browser-check',
+    ]
+    if headless:
+        command.append('--headless=new')
+    command.append('about:blank')
+    return command
+
+def get_version(address, timeout=2):
+    """The DevTools ``/json/version`` of a Chrome at ``host:port``, or None if nothing listens."""
+    try:
+        with urllib.request.urlopen(f'http://{address}/json/version', timeout=timeout) as response:
+            return json.load(response)
+    except Exception:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Chrome with remote debugging for the bot to attach to")
+    parser.add_argument('--port', type=int, default=SELENIUM_CONFIG['DEBUGGER_PORT'])
+    parser.add_argument('--profile', default=str(SELENIUM_CONFIG['PROFILE_DIR']),
+                        help="user data directory, keeps cookies across sidecar restarts")
+    parser.add_argument('--binary', default=SELENIUM_CONFIG['CHROME_BINARY'])
+    parser.add_argument('--headed', action='store_true', help="show the browser window")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    address = f'127.0.0.1:{args.port}'
+    version = get_version(address)
+    if version:
+        logger.info("%s is already listening at %s", version.get('Browser'), address)
+        return 0
+
+    binary = find_chrome(args.binary)
+    if binary is None:
+        logger.error("Chrome not found; set SELENIUM_CONFIG['CHROME_BINARY'] or pass --binary")
+        return 1
+
+    process = subprocess.Popen(build_command(binary, args.port, args.profile, headless=not args.headed))
+    logger.info("Chrome started (pid %d); attach with CHROME_DEBUGGER_ADDRESS=%s", process.pid, address)
+    try:
+        return process.wait()
+    except KeyboardInterrupt:
+        process.terminate()
+        return process.wait()
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,28 +1,54 @@
 import logging
-import time
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from config.credentials import Credentials
+from config.config import SELENIUM_CONFIG
+from src.monitoring.metrics import timed
+from src.trading.clock import REAL_CLOCK
 from .selenium_manager import SeleniumManager
+from .tab_manager import TabManager
 
 logger = logging.getLogger(__name__)
 
 class QuotexInterface:
-    def __init__(self, headless=True):
-        self.selenium = SeleniumManager(headless=headless)
+    def __init__(self, headless=True, base_url=None, clock=REAL_CLOCK):
+        self.selenium = SeleniumManager(headless=headless, clock=clock)
+        self.clock = clock
+        self.base_url = (base_url or SELENIUM_CONFIG['BASE_URL']).rstrip('/')
         self.credentials = Credentials.get_quotex_credentials()
         self.is_logged_in = False
         self.is_demo_mode = False
+        # Page state known from our own actions, used to skip redundant reads/input
+        self.current_asset = None
+        self.preset_amount = None  # value currently typed into the amount field
+        self.balance = None
+        self.balance_read_at = None
+        # One tab per asset, switched by window handle instead of re-selecting
+        self.tabs = TabManager(self.selenium, SELENIUM_CONFIG['MAX_TABS']) if SELENIUM_CONFIG['ASSET_TABS'] else None
+        self.trading_url = None
 
+    def is_balance_fresh(self, max_age):
+        """Whether the last balance read is recent and no trade, settlement or account change happened since."""
+        return self.balance_read_at is not None and self.clock.monotonic() - self.balance_read_at < max_age
+
+    def invalidate_balance(self):
+        """Force the next get_balance call to read the page."""
+        self.balance_read_at = None
+
+    @timed('quotex')
     def login(self):
         """Login to Quotex platform."""
         try:
             if not self.selenium.setup_driver():
                 return False
 
+            if self.selenium.attached and self.resume_session():
+                return True
+
             # Navigate to Quotex login page
-            self.selenium.driver.get("https://quotex.com/login")
+            self.selenium.driver.get(f"{self.base_url}/login")
             self.selenium.random_delay()
 
             # Handle cookie consent if present
@@ -60,6 +86,7 @@ class QuotexInterface:
                     EC.presence_of_element_located((By.CLASS_NAME, "balance"))
                 )
                 self.is_logged_in = True
+                self.trading_url = self.selenium.driver.current_url
                 logger.info("Successfully logged in to Quotex")
                 return True
             except TimeoutException:
@@ -67,9 +94,29 @@ class QuotexInterface:
                 return False
 
         except Exception as e:
-            logger.error(f"Login failed: {str(e)}")
+            logger.error("Login failed: %s", e)
             return False
 
+    def resume_session(self):
+        """Adopt the sidecar's page when it is already logged in, instead of logging in again."""
+        driver = self.selenium.driver
+        # Tabs of a previous run belong to no asset here; keep the active one
+        active = driver.current_window_handle
+        for handle in driver.window_handles:
+            if handle != active:
+                driver.switch_to.window(handle)
+                driver.close()
+        driver.switch_to.window(active)
+
+        if not driver.find_elements(By.CLASS_NAME, "balance"):
+            logger.info("Attached browser is not logged in, logging in")
+            return False
+        self.is_logged_in = True
+        self.trading_url = driver.current_url
+        logger.info("Resumed the logged-in session at %s", self.trading_url)
+        return True
+
+    @timed('quotex')
     def switch_to_demo(self):
         """Switch to demo account mode."""
         try:
@@ -88,13 +135,42 @@ class QuotexInterface:
                 return False
 
             self.is_demo_mode = True
+            self.invalidate_balance()
             logger.info("Switched to demo account")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to switch to demo mode: {str(e)}")
+            logger.error("Failed to switch to demo mode: %s", e)
+            return False
+
+    @timed('quotex')
+    def switch_to_live(self):
+        """Switch to live account mode."""
+        try:
+            if not self.is_logged_in:
+                logger.error("Must be logged in to switch to live mode")
+                return False
+
+            # Click on balance to open account switcher
+            if not self.selenium.click_element(By.CLASS_NAME, "balance"):
+                return False
+
+            # Click live account button
+            if not self.selenium.click_element(
+                By.XPATH, "//div[contains(text(), 'Live')]"
+            ):
+                return False
+
+            self.is_demo_mode = False
+            self.invalidate_balance()
+            logger.info("Switched to live account")
+            return True
+
+        except Exception as e:
+            logger.error("Failed to switch to live mode: %s", e)
             return False
 
+    @timed('quotex')
     def get_balance(self):
         """Get current account balance."""
         try:
@@ -106,86 +182,232 @@ class QuotexInterface:
             if balance_text:
                 # Extract numeric value from balance text
                 balance = float(balance_text.replace('$', '').replace(',', ''))
+                self.balance = balance
+                self.balance_read_at = self.clock.monotonic()
                 return balance
             return None
 
         except Exception as e:
-            logger.error(f"Failed to get balance: {str(e)}")
+            logger.error("Failed to get balance: %s", e)
+            return None
+
+    @timed('quotex')
+    def get_current_price(self):
+        """Get the current price of the selected asset."""
+        try:
+            if not self.is_logged_in:
+                logger.error("Must be logged in to get price")
+                return None
+
+            price_text = self.selenium.get_element_text(By.CLASS_NAME, "current-price")
+            if price_text:
+                return float(price_text.replace(',', ''))
+            return None
+
+        except Exception as e:
+            logger.error("Failed to get current price: %s", e)
             return None
 
+    @timed('quotex')
     def select_asset(self, asset_name):
-        """Select trading asset."""
+        """Select trading asset, in its own tab when ASSET_TABS is enabled."""
         try:
             if not self.is_logged_in:
                 logger.error("Must be logged in to select asset")
                 return False
 
-            # Click on asset selector
-            if not self.selenium.click_element(
-                By.XPATH, "//div[contains(@class, 'asset-selector')]"
-            ):
+            if self.tabs is not None:
+                if self.tabs.switch_to(asset_name):
+                    self.current_asset = asset_name
+                    self.preset_amount = None  # the amount field belongs to the tab
+                    logger.info("Switched to the tab of %s", asset_name)
+                    return True
+                if len(self.tabs):
+                    self.tabs.open(asset_name, self.trading_url)
+                    self.preset_amount = None
+                    if not self.selenium.wait_for_element(By.CLASS_NAME, "balance"):
+                        self.tabs.close(asset_name)
+                        return False
+                if not self.choose_asset(asset_name):
+                    return False
+                self.tabs.adopt(asset_name)
+            elif not self.choose_asset(asset_name):
                 return False
 
-            # Search for asset
-            if not self.selenium.send_keys(
-                By.XPATH, "//input[@placeholder='Search']", asset_name
-            ):
+            self.current_asset = asset_name
+            logger.info("Selected asset: %s", asset_name)
+            return True
+
+        except Exception as e:
+            logger.error("Failed to select asset %s: %s", asset_name, e)
+            return False
+
+    def choose_asset(self, asset_name):
+        """Pick an asset in the active tab's asset selector."""
+        # Click on asset selector
+        if not self.selenium.click_element(
+            By.XPATH, "//div[contains(@class, 'asset-selector')]"
+        ):
+            return False
+
+        # Search for asset
+        if not self.selenium.send_keys(
+            By.XPATH, "//input[@placeholder='Search']", asset_name
+        ):
+            return False
+
+        # Select asset from results
+        return self.selenium.click_element(
+            By.XPATH, f"//div[contains(text(), '{asset_name}')]"
+        )
+
+    @timed('quotex')
+    def get_tab_status(self):
+        """Price and JS heap (MB) of every asset tab, read in one round-robin pass."""
+        try:
+            if not self.is_logged_in or self.tabs is None:
+                return {}
+
+            status = {}
+            for asset, values in self.tabs.read_all().items():
+                price = values['price']
+                heap = values['heap']
+                status[asset] = {
+                    'price': float(price.replace(',', '')) if price else None,
+                    'memory_mb': round(heap / 2**20, 1) if heap else None,
+                }
+            return status
+
+        except Exception as e:
+            logger.error("Failed to read asset tabs: %s", e)
+            return {}
+
+    @timed('quotex')
+    def get_chart_candles(self, limit):
+        """Get up to ``limit`` of the chart's most recent candles (the last one still forming) in one read."""
+        try:
+            if not self.is_logged_in:
+                logger.error("Must be logged in to read the chart")
+                return None
+
+            return self.selenium.driver.execute_script(
+                """
+                var candles = (%s) || [];
+                return candles.slice(-arguments[0]).map(function (candle) {
+                    return {time: Number(candle.time), close: Number(candle.close)};
+                });
+                """ % SELENIUM_CONFIG['CHART_CANDLES_JS'],
+                limit
+            )
+
+        except Exception as e:
+            logger.error("Failed to read chart candles: %s", e)
+            return None
+
+    @timed('quotex')
+    def set_amount(self, amount, fast=False):
+        """Type the trade amount into the amount field ahead of the order."""
+        try:
+            if not self.is_logged_in:
+                logger.error("Must be logged in to set amount")
                 return False
 
-            # Select asset from results
-            if not self.selenium.click_element(
-                By.XPATH, f"//div[contains(text(), '{asset_name}')]"
+            if not self.selenium.send_keys(
+                By.XPATH, "//input[@placeholder='Amount']", str(amount), delay=not fast
             ):
+                self.preset_amount = None
                 return False
 
-            logger.info(f"Selected asset: {asset_name}")
+            self.preset_amount = amount
             return True
 
         except Exception as e:
-            logger.error(f"Failed to select asset {asset_name}: {str(e)}")
+            self.preset_amount = None
+            logger.error("Failed to set amount: %s", e)
             return False
 
-    def place_trade(self, direction, amount):
-        """Place a trade in the specified direction."""
+    @timed('quotex')
+    def place_trade(self, direction, amount, fast=False):
+        """Place a trade in the specified direction.
+
+        The amount is only typed when the field does not already hold it.
+        ``fast`` skips the human-like pauses so the click follows the signal
+        within milliseconds.
+        """
         try:
             if not self.is_logged_in:
                 logger.error("Must be logged in to place trade")
                 return False
 
-            # Click on trade amount input
-            if not self.selenium.click_element(
-                By.XPATH, "//input[@placeholder='Amount']"
-            ):
+            if direction.lower() == 'up':
+                button = "//button[contains(@class, 'up')]"
+            elif direction.lower() == 'down':
+                button = "//button[contains(@class, 'down')]"
+            else:
+                logger.error("Invalid trade direction: %s", direction)
                 return False
 
-            # Enter trade amount
-            if not self.selenium.send_keys(
-                By.XPATH, "//input[@placeholder='Amount']", str(amount)
-            ):
+            # Enter trade amount unless it was preset
+            if self.preset_amount != amount and not self.set_amount(amount, fast):
                 return False
 
             # Click trade button based on direction
-            if direction.lower() == 'up':
-                if not self.selenium.click_element(
-                    By.XPATH, "//button[contains(@class, 'up')]"
-                ):
-                    return False
-            elif direction.lower() == 'down':
-                if not self.selenium.click_element(
-                    By.XPATH, "//button[contains(@class, 'down')]"
-                ):
-                    return False
-            else:
-                logger.error(f"Invalid trade direction: {direction}")
+            if not self.selenium.click_element(By.XPATH, button, delay=not fast):
                 return False
 
-            logger.info(f"Placed {direction} trade for ${amount}")
+            # The stake leaves the balance immediately
+            self.invalidate_balance()
+            logger.info(
+                "Placed %s trade for $%s",
+                direction,
+                amount,
+                extra={'trade': {'direction': direction, 'amount': amount}}
+            )
             return True
 
         except Exception as e:
-            logger.error(f"Failed to place trade: {str(e)}")
+            logger.error("Failed to place trade: %s", e)
             return False
 
+    @timed('quotex')
+    def get_trade_history(self, limit=20):
+        """Get the most recent closed trades from the history panel in one read, newest first.
+
+        ``opened_at`` is the open time in epoch seconds and ``id`` the
+        platform's order id, read from the row's ``data-*`` attributes.
+        """
+        try:
+            if not self.is_logged_in:
+                logger.error("Must be logged in to read trade history")
+                return None
+
+            rows = self.selenium.driver.execute_script(
+                """
+                return Array.from(document.querySelectorAll('.trade-history-item'))
+                    .slice(0, arguments[0])
+                    .map(function (item) {
+                        return {
+                            id: item.dataset.id || null,
+                            opened_at: item.dataset.openedAt ? parseFloat(item.dataset.openedAt) : null,
+                            asset: item.dataset.asset,
+                            direction: item.dataset.direction,
+                            amount: parseFloat(item.dataset.amount),
+                            profit: parseFloat(item.dataset.profit)
+                        };
+                    });
+                """,
+                limit
+            )
+            return rows
+
+        except Exception as e:
+            logger.error("Failed to get trade history: %s", e)
+            return None
+
+    def take_screenshot(self, filename):
+        """Take a screenshot of the trading page."""
+        return self.selenium.take_screenshot(filename)
+
     def close(self):
         """Close the Quotex interface."""
         self.selenium.close()
@@ -1,5 +1,4 @@
 import logging
-import time
 import random
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -8,20 +7,29 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from config.config import SELENIUM_CONFIG
+from src.monitoring.metrics import timed
+from src.trading.clock import REAL_CLOCK
 
 logger = logging.getLogger(__name__)
 
 class SeleniumManager:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, clock=REAL_CLOCK):
         self.driver = None
         self.headless = headless
+        self.clock = clock
         self.timeout = SELENIUM_CONFIG['TIMEOUT']
         self.user_agent = SELENIUM_CONFIG['USER_AGENT']
+        self.min_action_delay = SELENIUM_CONFIG['MIN_ACTION_DELAY']
+        self.max_action_delay = SELENIUM_CONFIG['MAX_ACTION_DELAY']
+        self.debugger_address = SELENIUM_CONFIG['DEBUGGER_ADDRESS']
+        self.attached = False  # driving a sidecar Chrome that outlives this process
 
+    @timed('selenium')
     def setup_driver(self):
-        """Initialize the Chrome WebDriver with configured options."""
+        """Initialize the Chrome WebDriver with configured options, or attach to the sidecar."""
+        if self.debugger_address:
+            return self.attach_driver()
         try:
             chrome_options = Options()
             if self.headless:
@@ -38,6 +46,8 @@ class SeleniumManager:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
 
+            from webdriver_manager.chrome import ChromeDriverManager
+
             service = Service(ChromeDriverManager().install())
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
@@ -54,14 +64,41 @@ class SeleniumManager:
             logger.info("Chrome WebDriver initialized successfully")
             return True
         except Exception as e:
-            logger.error(f"Failed to initialize Chrome WebDriver: {str(e)}")
+            logger.error("Failed to initialize Chrome WebDriver: %s", e)
+            return False
+
+    @timed('selenium')
+    def attach_driver(self):
+        """Attach to the Chrome listening on ``debugger_address``; its pages stay as they are."""
+        try:
+            # Launch flags (user agent, automation switches) were given to the
+            # sidecar; options that start a browser are not allowed here
+            chrome_options = Options()
+            chrome_options.add_experimental_option('debuggerAddress', self.debugger_address)
+
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            service = Service(ChromeDriverManager().install())
+            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            self.attached = True
+            logger.info("Attached to Chrome at %s (%s)", self.debugger_address, self.driver.current_url)
+            return True
+        except Exception as e:
+            logger.error("Failed to attach to Chrome at %s: %s", self.debugger_address, e)
             return False
 
-    def random_delay(self, min_seconds=2, max_seconds=5):
+    @timed('selenium')
+    def random_delay(self, min_seconds=None, max_seconds=None):
         """Add a random delay between actions to avoid detection."""
+        if min_seconds is None:
+            min_seconds = self.min_action_delay
+        if max_seconds is None:
+            max_seconds = self.max_action_delay
         delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
+        if delay > 0:
+            self.clock.sleep_sync(delay)
 
+    @timed('selenium')
     def wait_for_element(self, by, value, timeout=None):
         """Wait for an element to be present and visible."""
         if timeout is None:
@@ -73,36 +110,41 @@ class SeleniumManager:
             )
             return element
         except TimeoutException:
-            logger.error(f"Timeout waiting for element: {value}")
+            logger.error("Timeout waiting for element: %s", value)
             return None
 
-    def click_element(self, by, value, timeout=None):
-        """Click an element with error handling."""
+    @timed('selenium')
+    def click_element(self, by, value, timeout=None, delay=True):
+        """Click an element with error handling; ``delay=False`` skips the human pause."""
         try:
             element = self.wait_for_element(by, value, timeout)
             if element:
-                self.random_delay()
+                if delay:
+                    self.random_delay()
                 element.click()
                 return True
             return False
         except Exception as e:
-            logger.error(f"Failed to click element {value}: {str(e)}")
+            logger.error("Failed to click element %s: %s", value, e)
             return False
 
-    def send_keys(self, by, value, text, timeout=None):
-        """Send keys to an element with error handling."""
+    @timed('selenium')
+    def send_keys(self, by, value, text, timeout=None, delay=True):
+        """Send keys to an element with error handling; ``delay=False`` skips the human pause."""
         try:
             element = self.wait_for_element(by, value, timeout)
             if element:
-                self.random_delay()
+                if delay:
+                    self.random_delay()
                 element.clear()
                 element.send_keys(text)
                 return True
             return False
         except Exception as e:
-            logger.error(f"Failed to send keys to element {value}: {str(e)}")
+            logger.error("Failed to send keys to element %s: %s", value, e)
             return False
 
+    @timed('selenium')
     def get_element_text(self, by, value, timeout=None):
         """Get text from an element with error handling."""
         try:
@@ -111,24 +153,30 @@ class SeleniumManager:
                 return element.text
             return None
         except Exception as e:
-            logger.error(f"Failed to get text from element {value}: {str(e)}")
+            logger.error("Failed to get text from element %s: %s", value, e)
             return None
 
+    @timed('selenium')
     def take_screenshot(self, filename):
         """Take a screenshot of the current page."""
         try:
             self.driver.save_screenshot(filename)
-            logger.info(f"Screenshot saved as {filename}")
+            logger.info("Screenshot saved as %s", filename)
             return True
         except Exception as e:
-            logger.error(f"Failed to take screenshot: {str(e)}")
+            logger.error("Failed to take screenshot: %s", e)
             return False
 
     def close(self):
-        """Close the WebDriver."""
+        """Close the WebDriver; an attached sidecar browser is left running."""
         if self.driver:
             try:
+                if self.attached:
+                    # quit() would close the browser; stopping chromedriver only detaches
+                    self.driver.service.stop()
+                    logger.info("Detached from Chrome at %s", self.debugger_address)
+                    return
                 self.driver.quit()
                 logger.info("WebDriver closed successfully")
             except Exception as e:
-                logger.error(f"Error closing WebDriver: {str(e)}") 
\ No newline at end of file
+                logger.error("Error closing WebDriver: %s", e) 
\ No newline at end of file
@@ -0,0 +1,102 @@
+import logging
+from collections import OrderedDict
+from src.monitoring.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+# Price of the tab's selected asset and the JS heap of its page, in one script call
+TAB_STATUS_JS = """
+var price = document.querySelector('.current-price');
+return {
+    price: price ? price.textContent : null,
+    heap: window.performance && performance.memory ? performance.memory.usedJSHeapSize : null
+};
+"""
+
+class TabManager:
+    """One browser tab per asset in a single Chrome session.
+
+    Switching assets activates the asset's tab through its window handle
+    instead of navigating, so the page, its chart and its socket stay
+    loaded. Once more than ``max_tabs`` assets are open, the least recently
+    used tab is closed.
+    """
+
+    def __init__(self, selenium, max_tabs=10):
+        self.selenium = selenium
+        self.max_tabs = max(1, max_tabs)
+        self.tabs = OrderedDict()  # asset -> window handle
+
+    @property
+    def driver(self):
+        return self.selenium.driver
+
+    def __contains__(self, asset):
+        return asset in self.tabs
+
+    def __len__(self):
+        return len(self.tabs)
+
+    def adopt(self, asset):
+        """Register the active tab as the tab of ``asset``."""
+        self.tabs[asset] = self.driver.current_window_handle
+        self.tabs.move_to_end(asset)
+
+    @timed('tabs')
+    def switch_to(self, asset):
+        """Activate the tab of ``asset``; False when it has none or it was closed."""
+        handle = self.tabs.get(asset)
+        if handle is None:
+            return False
+        if handle not in self.driver.window_handles:
+            del self.tabs[asset]
+            return False
+        if self.driver.current_window_handle != handle:
+            self.driver.switch_to.window(handle)
+        self.tabs.move_to_end(asset)
+        return True
+
+    @timed('tabs')
+    def open(self, asset, url):
+        """Open ``url`` in a new active tab for ``asset``, closing the least recently used tab if full."""
+        while len(self.tabs) >= self.max_tabs:
+            oldest = next(iter(self.tabs))
+            self.close(oldest)
+        self.driver.switch_to.new_window('tab')
+        self.driver.get(url)
+        self.tabs[asset] = self.driver.current_window_handle
+        logger.info("Opened a tab for %s (%d open)", asset, len(self.tabs))
+
+    def close(self, asset):
+        """Close the tab of ``asset``; the browser keeps at least one tab."""
+        handle = self.tabs.pop(asset, None)
+        if handle is None or len(self.driver.window_handles) <= 1:
+            return
+        active = self.driver.current_window_handle
+        self.driver.switch_to.window(handle)
+        self.driver.close()
+        remaining = self.driver.window_handles
+        self.driver.switch_to.window(active if active in remaining else remaining[0])
+
+    @timed('tabs')
+    def read_all(self):
+        """Price text and JS heap bytes of every tab, visiting them round-robin.
+
+        The tab that was active is active again afterwards. Returns
+        ``{asset: {'price': text or None, 'heap': bytes or None}}``.
+        """
+        active = self.driver.current_window_handle
+        results = {}
+        try:
+            for asset, handle in list(self.tabs.items()):
+                try:
+                    if self.driver.current_window_handle != handle:
+                        self.driver.switch_to.window(handle)
+                    results[asset] = self.driver.execute_script(TAB_STATUS_JS)
+                except Exception as e:
+                    logger.error("Failed to read the tab of %s: %s", asset, e)
+                    results[asset] = {'price': None, 'heap': None}
+        finally:
+            if self.driver.current_window_handle != active:
+                self.driver.switch_to.window(active)
+        return results
@@ -0,0 +1,177 @@
+"""Vectorized backtest of the strategy plugins on bar closes.
+
+Indicators are computed for every bar at once with the windowed definitions
+the live engine uses (SMA and RSI over the last ``history_size`` closes), so
+signals match TradingStrategy bar for bar. Trades stake one unit each; the
+loss-streak pause and balance compounding of RiskManager are not modelled.
+"""
+import hashlib
+import logging
+from pathlib import Path
+from contextlib import contextmanager
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from config.config import STRATEGY_CONFIG
+from .candles import timeframe_to_seconds
+from .market_store import MarketStore, ticks_to_bars
+
+logger = logging.getLogger(__name__)
+
+def _code_version():
+    digest = hashlib.sha256()
+    for name in ('backtest.py', 'strategies.py'):
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()[:12]
+
+# Changes with the backtest or the strategy rules; cached results are keyed on it
+CODE_VERSION = _code_version()
+
+def series_sma(prices, history_size, period):
+    """SMA at every bar, NaN until ``history_size`` bars are available."""
+    result = np.full(len(prices), np.nan)
+    if len(prices) >= history_size:
+        sma = sliding_window_view(prices, period).mean(axis=1)  # sma[i] ends at bar i + period - 1
+        result[history_size - 1:] = sma[history_size - period:]
+    return result
+
+def series_rsi(prices, history_size, period):
+    """RSI at every bar over the last ``history_size`` prices, as the live engine computes it.
+
+    ta's RSI is a Wilder EWM (alpha = 1/period) seeded with a zero move, so
+    over a fixed window it is a weighted sum of that window's moves.
+    """
+    result = np.full(len(prices), np.nan)
+    if len(prices) < history_size:
+        return result
+    moves = np.diff(prices)
+    alpha = 1 / period
+    weights = alpha * (1 - alpha) ** np.arange(history_size - 2, -1, -1)  # oldest move first
+    gains = np.correlate(np.clip(moves, 0, None), weights, 'valid')
+    losses = np.correlate(np.clip(-moves, 0, None), weights, 'valid')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result[history_size - 1:] = np.where(losses == 0, 100.0, 100 - 100 / (1 + gains / losses))
+    return result
+
+# Indicator name -> function(prices, history_size, *params), mirroring INDICATORS
+SERIES_INDICATORS = {
+    'sma': series_sma,
+    'rsi': series_rsi,
+}
+
+@contextmanager
+def strategy_config(params):
+    """Temporarily override STRATEGY_CONFIG values, e.g. one point of a parameter grid."""
+    saved = {key: STRATEGY_CONFIG[key] for key in params}
+    STRATEGY_CONFIG.update(params)
+    try:
+        yield
+    finally:
+        STRATEGY_CONFIG.update(saved)
+
+def load_bars(paths, asset, timeframe, store=None):
+    """Closed bars as ``(bar_times, closes)`` arrays from tick files, or the market data store without paths."""
+    from .replay import load_ticks
+
+    if not paths:
+        return (store or MarketStore()).load_bars(asset, timeframe)
+
+    rows = sorted(row for path in paths for row in load_ticks(path, asset))
+    times = np.fromiter((row[0] for row in rows), float, len(rows))
+    prices = np.fromiter((row[2] for row in rows), float, len(rows))
+    # The end of the data closes the final bar, so appending a day of ticks
+    # leaves the earlier bars unchanged
+    return ticks_to_bars(times, prices, timeframe_to_seconds(timeframe))
+
+def combine_vote_series(votes, policy):
+    """Vectorized ``combine_votes`` over per-strategy signal arrays in priority order."""
+    votes = np.vstack(votes)
+    if policy == 'priority':
+        first = (votes != 0).argmax(axis=0)
+        return votes[first, np.arange(votes.shape[1])]
+
+    ups = (votes == 1).sum(axis=0)
+    downs = (votes == -1).sum(axis=0)
+    if policy == 'majority':
+        up, down = ups * 2 > len(votes), downs * 2 > len(votes)
+    elif policy == 'unanimous':
+        up, down = ups == len(votes), downs == len(votes)
+    else:
+        raise ValueError(f"Unknown voting policy: {policy}")
+    return np.where(up, 1, np.where(down, -1, 0)).astype('i1')
+
+def compute_signals(closes, params=None, names=None, policy=None, cache=None):
+    """Combined signal of every bar under the STRATEGY_CONFIG overrides ``params``.
+
+    ``cache`` (a dict) shares indicator series between calls on the same closes.
+    """
+    from .strategy import TradingStrategy
+
+    with strategy_config(params or {}):
+        engine = TradingStrategy(names=names, policy=policy)
+    cache = {} if cache is None else cache
+
+    values = {}
+    for requirement in engine.requirements:
+        key = (requirement, engine.history_size)
+        if key not in cache:
+            name, indicator_params = requirement
+            cache[key] = SERIES_INDICATORS[name](closes, engine.history_size, *indicator_params)
+        values[requirement] = cache[key]
+
+    votes = []
+    for strategy in engine.strategies:
+        inputs = {label: values[requirement] for label, requirement in strategy.indicators.items()}
+        votes.append(strategy.evaluate_series(closes, inputs))
+    return combine_vote_series(votes, engine.policy)
+
+def simulate_trades(bar_times, closes, signals, expiry, payout, cooldown, end=None):
+    """Trade the signals of bars ``[0, end)``; returns ``(signal bar indices, per-unit returns)``.
+
+    A trade opens at the close of its signal bar and settles at the last
+    close ``expiry`` seconds later. Signals within ``cooldown`` seconds of
+    the previous trade are skipped, as are trades that cannot settle by
+    the last bar.
+    """
+    end = len(closes) if end is None else end
+    if end == 0:
+        return np.empty(0, int), np.empty(0)
+    candidates = np.flatnonzero(signals[:end])
+    candidates = candidates[bar_times[candidates] + expiry <= bar_times[end - 1]]
+
+    taken = []
+    next_allowed = -np.inf
+    for index in candidates:  # only signal bars, not every bar
+        if bar_times[index] >= next_allowed:
+            taken.append(index)
+            next_allowed = bar_times[index] + cooldown
+    taken = np.array(taken, dtype=int)
+
+    settle = np.searchsorted(bar_times, bar_times[taken] + expiry, side='right') - 1
+    moves = (closes[settle] - closes[taken]) * signals[taken]
+    returns = np.where(moves > 0, payout, np.where(moves < 0, -1.0, 0.0))
+    return taken, returns
+
+def summarize(returns):
+    """Trade statistics of per-unit returns, in the style of RiskManager.get_trade_stats."""
+    returns = np.asarray(returns, dtype=float)
+    if not len(returns):
+        return {
+            'total_trades': 0,
+            'win_rate': 0,
+            'expectancy': 0,
+            'total_return': 0,
+            'profit_factor': 0,
+            'max_drawdown': 0,
+        }
+
+    gross_profit = returns[returns > 0].sum()
+    gross_loss = -returns[returns < 0].sum()
+    equity = np.concatenate(([0.0], np.cumsum(returns)))
+    return {
+        'total_trades': len(returns),
+        'win_rate': round(float((returns > 0).mean()) * 100, 2),
+        'expectancy': round(float(returns.mean()), 4),  # per unit staked
+        'total_return': round(float(equity[-1]), 2),   # in units staked
+        'profit_factor': round(float(gross_profit / gross_loss), 2) if gross_loss else float('inf'),
+        'max_drawdown': round(float((np.maximum.accumulate(equity) - equity).max()), 2),
+    }
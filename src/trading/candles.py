@@ -0,0 +1,55 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+TIMEFRAME_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '1h': 3600,
+}
+
+def timeframe_to_seconds(timeframe):
+    """Convert a timeframe string like '1m' to seconds."""
+    try:
+        return TIMEFRAME_SECONDS[timeframe]
+    except KeyError:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+
+class CandleAggregator:
+    """Aggregate price ticks into OHLC candles of a fixed timeframe."""
+
+    def __init__(self, timeframe):
+        self.timeframe = timeframe
+        self.seconds = timeframe_to_seconds(timeframe)
+        self.current = None
+
+    def add_tick(self, price, timestamp):
+        """Add a tick; return the candle it closed, if any."""
+        bucket = int(timestamp // self.seconds) * self.seconds
+        closed = None
+
+        if self.current is not None and bucket != self.current['time']:
+            closed = self.current
+            self.current = None
+
+        if self.current is None:
+            self.current = {
+                'time': bucket,
+                'open': price,
+                'high': price,
+                'low': price,
+                'close': price,
+                'ticks': 1,
+            }
+        else:
+            current = self.current
+            if price > current['high']:
+                current['high'] = price
+            elif price < current['low']:
+                current['low'] = price
+            current['close'] = price
+            current['ticks'] += 1
+
+        return closed
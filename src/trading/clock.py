@@ -0,0 +1,121 @@
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+import threading
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+class RealClock:
+    """Wall-clock time; what the bot uses in production."""
+
+    def time(self):
+        return time.time()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+    def sleep_sync(self, seconds):
+        """Blocking sleep for worker threads (e.g. the browser thread)."""
+        time.sleep(seconds)
+
+    @asynccontextmanager
+    async def busy(self):
+        """Mark work that happens off the event loop; nothing to track in real time."""
+        yield
+
+class ScaledClock(RealClock):
+    """Real time running ``speed`` times faster, starting at ``start``."""
+
+    def __init__(self, start, speed=1.0):
+        self.start = start
+        self.speed = speed
+        self.origin = time.monotonic()
+
+    def time(self):
+        return self.start + (time.monotonic() - self.origin) * self.speed
+
+    def monotonic(self):
+        return self.time()
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds / self.speed)
+
+    def sleep_sync(self, seconds):
+        time.sleep(seconds / self.speed)
+
+class VirtualClock:
+    """Virtual time that jumps straight to the next scheduled wake-up.
+
+    Coroutines sleep on the clock instead of asyncio; ``run()`` advances the
+    time to the earliest sleeper whenever the event loop has nothing else to
+    do and no ``busy()`` block (e.g. a call on an executor thread) is in
+    flight. Hours of loop behaviour then take as long as the work itself.
+    """
+
+    def __init__(self, start=1_700_000_000.0):
+        self.now = start
+        self.sleepers = []  # heap of (wake_at, seq, future)
+        self.sequence = itertools.count()
+        self.pending = 0
+        self.idle = asyncio.Event()  # set while no busy() block is in flight
+        self.idle.set()
+        self.lock = threading.Lock()
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        if seconds <= 0:
+            await asyncio.sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.sleepers, (self.now + seconds, next(self.sequence), future))
+        await future
+
+    def sleep_sync(self, seconds):
+        """Let time pass for a worker thread without blocking it."""
+        with self.lock:
+            self.now += max(0.0, seconds)
+
+    @asynccontextmanager
+    async def busy(self):
+        """Hold time still while work outside the event loop is in flight."""
+        self.pending += 1
+        self.idle.clear()
+        try:
+            yield
+        finally:
+            self.pending -= 1
+            if not self.pending:
+                self.idle.set()
+
+    async def run(self, idle_yields=5):
+        """Advance time whenever every task is waiting on the clock; runs until cancelled."""
+        while True:
+            # Give ready tasks a chance to run (and to schedule new sleeps)
+            for _ in range(idle_yields):
+                await asyncio.sleep(0)
+            if self.pending:
+                await self.idle.wait()  # no spinning while executor work is in flight
+                continue
+            if not self.sleepers:
+                await asyncio.sleep(0.001)
+                continue
+
+            wake_at, _, future = heapq.heappop(self.sleepers)
+            if future.done():  # the sleeping task was cancelled
+                continue
+            with self.lock:
+                self.now = max(self.now, wake_at)
+            future.set_result(None)
+
+REAL_CLOCK = RealClock()
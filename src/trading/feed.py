@@ -0,0 +1,46 @@
+import logging
+from collections import deque
+from .candles import CandleAggregator
+from .clock import REAL_CLOCK
+
+logger = logging.getLogger(__name__)
+
+class PriceFeed:
+    """Poll the platform price and turn it into tick and bar-close events.
+
+    Events are tuples of ``('tick', price, timestamp)`` when the price changes
+    and ``('bar', candle, timestamp)`` when a candle of the timeframe closes.
+    ``read_price`` is a coroutine function returning the price or None.
+    """
+
+    def __init__(self, asset, read_price, timeframe, poll_interval, clock=REAL_CLOCK):
+        self.asset = asset
+        self.clock = clock
+        self.read_price = read_price
+        self.poll_interval = poll_interval
+        self.aggregator = CandleAggregator(timeframe)
+        self.last_price = None
+        self.next_poll_at = 0.0
+        self.pending = deque()
+
+    async def next_event(self):
+        """Wait for the next event; returns None if the price read failed."""
+        while not self.pending:
+            delay = self.next_poll_at - self.clock.monotonic()
+            if delay > 0:
+                await self.clock.sleep(delay)
+            self.next_poll_at = self.clock.monotonic() + self.poll_interval
+
+            price = await self.read_price()
+            if price is None:
+                return None
+
+            timestamp = self.clock.time()
+            closed = self.aggregator.add_tick(price, timestamp)
+            if closed is not None:
+                self.pending.append(('bar', closed, timestamp))
+            if price != self.last_price:
+                self.last_price = price
+                self.pending.append(('tick', price, timestamp))
+
+        return self.pending.popleft()
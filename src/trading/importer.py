@@ -0,0 +1,289 @@
+"""Bulk import of historical tick or OHLC files into the market data store.
+
+Sources are read in chunks (byte ranges of a CSV, row groups of a Parquet
+file) and parsed with pandas, so files larger than memory import with a
+flat footprint. Timestamps are normalized to epoch seconds (UTC) and asset
+names to the TRADING_CONFIG style ('EUR/USD' -> 'EURUSD').
+
+Progress is saved after every chunk. Before a chunk is appended, the sizes
+of the day files it touches are saved too; an interrupted import rolls those
+files back and continues where it stopped.
+
+    python -m src.trading.importer EURUSD_2023.csv --asset EURUSD
+    python -m src.trading.importer quotes.parquet --kind ohlc --timeframe 1m
+"""
+import io
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import argparse
+import numpy as np
+from config.config import MARKET_DATA_CONFIG
+from .candles import TIMEFRAME_SECONDS
+from .market_store import MarketStore
+
+logger = logging.getLogger(__name__)
+
+TIME_COLUMNS = ('timestamp', 'time', 'datetime', 'date', 'ts', 'gmt time', 'local time')
+ASSET_COLUMNS = ('asset', 'symbol', 'instrument', 'ticker', 'pair')
+PRICE_COLUMNS = ('price', 'last', 'mid', 'close', 'bid')
+OHLC_COLUMNS = ('open', 'high', 'low', 'close')
+
+def normalize_asset(name):
+    """Convert a vendor symbol to the bot's asset style: 'eur/usd', 'EURUSD=X', 'EUR_USD.r' -> 'EURUSD'."""
+    name = re.split(r'[.:=]', str(name).strip())[0]
+    return re.sub(r'[^A-Z0-9]', '', name.upper())
+
+def parse_timestamps(values, time_format=None, timezone='UTC'):
+    """Convert a column of epoch numbers or date strings to epoch seconds.
+
+    Epoch units (s, ms, us, ns) are told apart by magnitude; strings without
+    an offset are read in ``timezone``.
+    """
+    import pandas as pd
+
+    if pd.api.types.is_numeric_dtype(values):
+        seconds = values.to_numpy(dtype=float)
+        magnitude = np.nanmedian(np.abs(seconds)) if len(seconds) else 0
+        for threshold, scale in ((1e17, 1e9), (1e14, 1e6), (1e11, 1e3)):
+            if magnitude >= threshold:
+                return seconds / scale
+        return seconds
+
+    parsed = pd.to_datetime(values, format=time_format)
+    if parsed.dt.tz is None:
+        parsed = parsed.dt.tz_localize(timezone)
+    return parsed.dt.tz_convert(None).to_numpy(dtype='datetime64[ms]').astype(np.int64) / 1000
+
+def detect_timeframe(times):
+    """Timeframe of candles from the most common spacing of their timestamps."""
+    steps = np.diff(np.unique(times))
+    if not len(steps):
+        return None
+    values, counts = np.unique(steps, return_counts=True)
+    step = values[counts.argmax()]
+    for timeframe, seconds in TIMEFRAME_SECONDS.items():
+        if seconds == step:
+            return timeframe
+    return None
+
+class ChunkNormalizer:
+    """Map the columns of a source to the store's tick or candle layout."""
+
+    def __init__(self, columns, kind=None, asset=None, time_format=None, timezone='UTC'):
+        lower = {column.strip().lower(): column for column in columns}
+        self.time_format = time_format
+        self.timezone = timezone
+        self.asset = normalize_asset(asset) if asset else None
+
+        self.date_time = None
+        if 'date' in lower and 'time' in lower:
+            self.date_time = (lower['date'], lower['time'])  # separate date and time columns
+        else:
+            self.time_column = next((lower[name] for name in TIME_COLUMNS if name in lower), None)
+            if self.time_column is None:
+                raise ValueError(f"No timestamp column among {list(columns)}")
+
+        self.asset_column = next((lower[name] for name in ASSET_COLUMNS if name in lower), None)
+        if self.asset is None and self.asset_column is None:
+            raise ValueError("The source has no asset column, pass the asset name")
+
+        has_ohlc = all(name in lower for name in OHLC_COLUMNS)
+        self.kind = kind or ('ohlc' if has_ohlc else 'ticks')
+        if self.kind == 'ohlc':
+            if not has_ohlc:
+                raise ValueError(f"OHLC import needs open/high/low/close columns, got {list(columns)}")
+            self.price_columns = [lower[name] for name in OHLC_COLUMNS]
+        elif 'bid' in lower and 'ask' in lower:
+            self.price_columns = [lower['bid'], lower['ask']]  # ticks at the mid price
+        else:
+            price = next((lower[name] for name in PRICE_COLUMNS if name in lower), None)
+            if price is None:
+                raise ValueError(f"No price column among {list(columns)}")
+            self.price_columns = [price]
+
+    def normalize(self, frame):
+        """Return the chunk as ticks (timestamp, asset, price) or candles (time, asset, o/h/l/c)."""
+        import pandas as pd
+
+        if self.date_time:
+            date, clock = self.date_time
+            stamps = frame[date].astype(str) + ' ' + frame[clock].astype(str)
+        else:
+            stamps = frame[self.time_column]
+        times = np.round(parse_timestamps(stamps, self.time_format, self.timezone), 3)
+
+        if self.asset is not None:
+            assets = self.asset
+        else:
+            # Few distinct symbols per chunk: normalize each once
+            symbols = frame[self.asset_column].astype(str)
+            assets = symbols.map({symbol: normalize_asset(symbol) for symbol in symbols.unique()})
+
+        prices = frame[self.price_columns].apply(pd.to_numeric, errors='coerce')
+        if self.kind == 'ohlc':
+            result = pd.DataFrame({'time': times, 'asset': assets})
+            for name, column in zip(OHLC_COLUMNS, self.price_columns):
+                result[name] = prices[column].to_numpy()
+        else:
+            result = pd.DataFrame({'timestamp': times, 'asset': assets, 'price': prices.mean(axis=1).to_numpy()})
+        return result.dropna()
+
+class ImportProgress:
+    """Resumable position in one source file, saved next to the store."""
+
+    def __init__(self, store, source):
+        digest = hashlib.sha256(os.path.realpath(source).encode()).hexdigest()[:16]
+        self.path = os.path.join(store.root, 'imports', f"{digest}.json")
+        self.state = {'source': os.path.realpath(source), 'offset': 0, 'rows': 0, 'pending': None}
+        try:
+            with open(self.path) as f:
+                self.state.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(f"{self.path}.tmp", 'w') as f:
+            json.dump(self.state, f)
+        os.replace(f"{self.path}.tmp", self.path)
+
+    def begin(self, paths):
+        """Remember the sizes of the files a chunk is about to append to."""
+        self.state['pending'] = {path: os.path.getsize(path) if os.path.exists(path) else 0 for path in paths}
+        self.save()
+
+    def commit(self, offset, rows):
+        self.state.update(offset=offset, rows=self.state['rows'] + rows, pending=None)
+        self.save()
+
+    def rollback(self):
+        """Undo the appends of a chunk that was interrupted."""
+        for path, size in (self.state['pending'] or {}).items():
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+                logger.info("Rolled back partial import into %s", path)
+        self.state['pending'] = None
+
+def read_csv_chunks(path, offset, chunk_bytes, sep=',', names=None):
+    """Yield ``(frame, end offset)`` for blocks of whole lines, starting at byte ``offset``."""
+    import pandas as pd
+
+    with open(path, 'rb') as f:
+        header = f.readline()
+        if names is None:
+            names = [name.strip() for name in header.decode('utf-8-sig').rstrip('\r\n').split(sep)]
+            offset = max(offset, len(header))
+        f.seek(offset)
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                return
+            if not block.endswith(b'\n'):
+                cut = block.rfind(b'\n')
+                if cut == -1:
+                    block += f.readline()  # a line longer than a chunk, or the last line
+                else:
+                    block = block[:cut + 1]
+                    f.seek(offset + len(block))
+            offset += len(block)
+            yield pd.read_csv(io.BytesIO(block), sep=sep, header=None, names=names, skipinitialspace=True), offset
+
+def open_parquet(path):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet import needs pyarrow: pip install pyarrow")
+    return pq.ParquetFile(path)
+
+def read_parquet_chunks(path, offset):
+    """Yield ``(frame, next row group)`` for every row group from ``offset`` on."""
+    source = open_parquet(path)
+    for group in range(offset, source.num_row_groups):
+        yield source.read_row_group(group).to_pandas(), group + 1
+
+def peek_columns(path, sep=',', names=None):
+    if names:
+        return names
+    if path.endswith('.parquet'):
+        return open_parquet(path).schema_arrow.names
+    with open(path, encoding='utf-8-sig') as f:
+        return [name.strip() for name in f.readline().rstrip('\r\n').split(sep)]
+
+def import_file(path, store=None, asset=None, kind=None, timeframe=None, sep=',', names=None,
+                time_format=None, timezone=None, chunk_bytes=None, restart=False):
+    """Stream one source file into the store, continuing a previous import of it.
+
+    Only data past the saved offset is read, so a file that grew since (e.g.
+    a daily export) imports just the new rows. ``restart`` starts over.
+    """
+    store = store or MarketStore()
+    progress = ImportProgress(store, path)
+    progress.rollback()
+    if restart:
+        progress.state.update(offset=0, rows=0, timeframe=None)
+
+    normalizer = ChunkNormalizer(
+        peek_columns(path, sep, names), kind, asset, time_format, timezone or MARKET_DATA_CONFIG['TIMEZONE']
+    )
+    timeframe = timeframe or progress.state.get('timeframe')
+    if path.endswith('.parquet'):
+        chunks = read_parquet_chunks(path, progress.state['offset'])
+    else:
+        chunks = read_csv_chunks(path, progress.state['offset'], chunk_bytes or MARKET_DATA_CONFIG['CHUNK_BYTES'], sep, names)
+
+    started = time.perf_counter()
+    if progress.state['offset']:
+        logger.info("Resuming %s at offset %s (%s rows done)", path, progress.state['offset'], progress.state['rows'])
+    count = 0
+    for frame, offset in chunks:
+        rows = normalizer.normalize(frame)
+        if normalizer.kind == 'ohlc':
+            if timeframe is None:
+                timeframe = detect_timeframe(rows['time'].to_numpy())
+                if timeframe is None:
+                    raise ValueError("Cannot tell the candle timeframe, pass it explicitly")
+                progress.state['timeframe'] = timeframe
+            parts = store.partition_candles(rows, timeframe)
+        else:
+            parts = store.partition_ticks(rows)
+
+        progress.begin(parts)
+        for day_path, day_rows in parts.items():
+            store.write(day_path, day_rows)
+        progress.commit(offset, len(rows))
+        count += 1
+        logger.info("%s: chunk %d, %s rows imported", path, count, progress.state['rows'])
+
+    return dict(progress.state, kind=normalizer.kind, chunks=count, seconds=round(time.perf_counter() - started, 2))
+
+def main():
+    parser = argparse.ArgumentParser(description="Import historical tick or OHLC files into the market data store")
+    parser.add_argument('files', nargs='+', help="CSV or Parquet files")
+    parser.add_argument('--asset', help="asset of files without a symbol column, e.g. EURUSD")
+    parser.add_argument('--kind', choices=('ticks', 'ohlc'), help="default: ohlc when open/high/low/close exist")
+    parser.add_argument('--timeframe', choices=sorted(TIMEFRAME_SECONDS), help="candle timeframe (default: detected)")
+    parser.add_argument('--sep', default=',', help="CSV separator")
+    parser.add_argument('--columns', help="comma-separated column names for CSV files without a header")
+    parser.add_argument('--time-format', help="strptime format of date strings, e.g. '%%Y%%m%%d %%H%%M%%S'")
+    parser.add_argument('--timezone', help="zone of timestamps without an offset (default: MARKET_DATA_CONFIG)")
+    parser.add_argument('--store', help="store directory (default: MARKET_DATA_CONFIG)")
+    parser.add_argument('--restart', action='store_true', help="ignore saved progress and import from the start")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    store = MarketStore(args.store)
+    names = [name.strip() for name in args.columns.split(',')] if args.columns else None
+    for path in args.files:
+        result = import_file(
+            path, store, args.asset, args.kind, args.timeframe, args.sep, names,
+            args.time_format, args.timezone, restart=args.restart
+        )
+        print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
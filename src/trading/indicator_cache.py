@@ -0,0 +1,66 @@
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class IndicatorCache:
+    """LRU cache of indicator values, computed once per closed bar.
+
+    Entries are keyed by ``(asset, timeframe, indicator, params)`` and remember
+    the bar they were computed for; any consumer asking for the same bar gets
+    the memoized value. The least recently used series is evicted across all
+    assets once ``max_entries`` is exceeded.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # key -> (bar_time, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, asset, timeframe, indicator, params, bar_time, compute):
+        """Get the value for ``bar_time``, calling ``compute()`` only on a miss."""
+        key = (asset, timeframe, indicator, params)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == bar_time:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        value = compute()
+        self.entries[key] = (bar_time, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def invalidate(self, asset=None):
+        """Drop the entries of one asset, or all entries."""
+        if asset is None:
+            self.entries.clear()
+            return
+        for key in [key for key in self.entries if key[0] == asset]:
+            del self.entries[key]
+
+    def get_stats(self):
+        """Get hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups * 100, 2) if lookups else 0,
+        }
+
+    def collect_metrics(self):
+        """Expose the counters as gauges for the metrics registry."""
+        return [
+            ('indicator_cache_hits', {}, self.hits),
+            ('indicator_cache_misses', {}, self.misses),
+            ('indicator_cache_evictions', {}, self.evictions),
+            ('indicator_cache_entries', {}, len(self.entries)),
+        ]
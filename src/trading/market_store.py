@@ -0,0 +1,149 @@
+"""On-disk store of historical ticks and candles.
+
+One CSV file per asset and UTC day, so appends stay cheap and readers only
+open the days they need:
+
+    ticks/EURUSD/2024-01-02.csv          timestamp,asset,price (the replay format)
+    candles/1m/EURUSD/2024-01-02.csv     time,open,high,low,close
+
+Timestamps are epoch seconds (UTC). Readers sort and drop duplicate
+timestamps, so overlapping imports do no harm.
+"""
+import os
+import logging
+from datetime import datetime, timezone
+import numpy as np
+from config.config import MARKET_DATA_CONFIG
+from .candles import timeframe_to_seconds
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+TICK_COLUMNS = ['timestamp', 'asset', 'price']
+CANDLE_COLUMNS = ['time', 'open', 'high', 'low', 'close']
+
+def day_name(day_number):
+    """File name of a day counted since the epoch."""
+    return datetime.fromtimestamp(int(day_number) * DAY, timezone.utc).strftime('%Y-%m-%d')
+
+def ticks_to_bars(times, prices, seconds):
+    """Close of every bar as ``(bar_times, closes)``, like CandleAggregator; the last tick closes the final bar."""
+    if not len(times):
+        return np.empty(0), np.empty(0)
+    buckets = times // seconds * seconds
+    closes_at = np.append(np.flatnonzero(buckets[1:] != buckets[:-1]), len(buckets) - 1)
+    return buckets[closes_at], prices[closes_at]
+
+class MarketStore:
+    """Daily tick and candle files under MARKET_DATA_CONFIG['STORE_DIR']."""
+
+    def __init__(self, root=None):
+        self.root = str(root or MARKET_DATA_CONFIG['STORE_DIR'])
+
+    def tick_dir(self, asset):
+        return os.path.join(self.root, 'ticks', asset)
+
+    def candle_dir(self, asset, timeframe):
+        return os.path.join(self.root, 'candles', timeframe, asset)
+
+    def get_assets(self):
+        """Assets with stored ticks."""
+        try:
+            return sorted(os.listdir(os.path.join(self.root, 'ticks')))
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _day_files(directory, start=None, end=None):
+        """Day files of a directory in date order, optionally within ``[start, end)`` epoch seconds."""
+        try:
+            names = sorted(name for name in os.listdir(directory) if name.endswith('.csv'))
+        except FileNotFoundError:
+            return []
+        if start is not None:
+            names = [name for name in names if name >= day_name(start // DAY) + '.csv']
+        if end is not None:
+            names = [name for name in names if name < day_name(-(-end // DAY)) + '.csv']
+        return [os.path.join(directory, name) for name in names]
+
+    def tick_files(self, asset, start=None, end=None):
+        return self._day_files(self.tick_dir(asset), start, end)
+
+    def candle_files(self, asset, timeframe, start=None, end=None):
+        return self._day_files(self.candle_dir(asset, timeframe), start, end)
+
+    def partition_ticks(self, frame):
+        """Split normalized ticks (timestamp, asset, price) into ``{day file: rows}``."""
+        days = (frame['timestamp'].to_numpy() // DAY).astype(np.int64)
+        return {
+            os.path.join(self.tick_dir(asset), f"{day_name(day)}.csv"): group[TICK_COLUMNS]
+            for (asset, day), group in frame.groupby([frame['asset'], days], sort=False)
+        }
+
+    def partition_candles(self, frame, timeframe):
+        """Split normalized candles (time, asset, open, high, low, close) into ``{day file: rows}``."""
+        days = (frame['time'].to_numpy() // DAY).astype(np.int64)
+        return {
+            os.path.join(self.candle_dir(asset, timeframe), f"{day_name(day)}.csv"): group[CANDLE_COLUMNS]
+            for (asset, day), group in frame.groupby([frame['asset'], days], sort=False)
+        }
+
+    @staticmethod
+    def write(path, rows):
+        """Append rows to a day file, with a header when the file is new or empty."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        header = not os.path.exists(path) or os.path.getsize(path) == 0
+        rows.to_csv(path, mode='a', header=header, index=False)
+
+    @staticmethod
+    def read(path, time_column):
+        """Read a day file sorted by time without duplicate timestamps."""
+        import pandas as pd
+
+        frame = pd.read_csv(path)
+        return frame.drop_duplicates(time_column, keep='last').sort_values(time_column, kind='stable')
+
+    def load_ticks(self, asset, start=None, end=None):
+        """Stored ticks of an asset as one DataFrame (timestamp, asset, price)."""
+        import pandas as pd
+
+        frames = [self.read(path, 'timestamp') for path in self.tick_files(asset, start, end)]
+        if not frames:
+            return pd.DataFrame(columns=TICK_COLUMNS)
+        return self._between(pd.concat(frames, ignore_index=True), 'timestamp', start, end)
+
+    def load_candles(self, asset, timeframe, start=None, end=None):
+        """Stored candles of an asset as one DataFrame (time, open, high, low, close)."""
+        import pandas as pd
+
+        frames = [self.read(path, 'time') for path in self.candle_files(asset, timeframe, start, end)]
+        if not frames:
+            return pd.DataFrame(columns=CANDLE_COLUMNS)
+        return self._between(pd.concat(frames, ignore_index=True), 'time', start, end)
+
+    def load_bars(self, asset, timeframe, start=None, end=None):
+        """Bar closes as ``(bar_times, closes)``: stored candles, else ticks aggregated one day at a time."""
+        candles = self.load_candles(asset, timeframe, start, end)
+        if len(candles):
+            return candles['time'].to_numpy(float), candles['close'].to_numpy(float)
+
+        times, closes = [], []
+        for path in self.tick_files(asset, start, end):
+            ticks = self._between(self.read(path, 'timestamp'), 'timestamp', start, end)
+            bar_times, bar_closes = ticks_to_bars(
+                ticks['timestamp'].to_numpy(float), ticks['price'].to_numpy(float),
+                timeframe_to_seconds(timeframe)
+            )
+            times.append(bar_times)
+            closes.append(bar_closes)
+        if not times:
+            return np.empty(0), np.empty(0)
+        return np.concatenate(times), np.concatenate(closes)
+
+    @staticmethod
+    def _between(frame, column, start, end):
+        if start is not None:
+            frame = frame[frame[column] >= start]
+        if end is not None:
+            frame = frame[frame[column] < end]
+        return frame
@@ -0,0 +1,56 @@
+import logging
+import random
+from .clock import REAL_CLOCK
+
+logger = logging.getLogger(__name__)
+
+class TradeCooldown:
+    """Enforce a randomized MIN_DELAY..MAX_DELAY gap between trades."""
+
+    def __init__(self, min_delay, max_delay, clock=REAL_CLOCK):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.ready_at = 0.0
+
+    def is_ready(self):
+        """Check if the cooldown since the last trade has elapsed."""
+        return self.clock.monotonic() >= self.ready_at
+
+    def remaining(self):
+        """Seconds left until the next trade is allowed."""
+        return max(0.0, self.ready_at - self.clock.monotonic())
+
+    def record_trade(self):
+        """Start a new cooldown after a trade was placed."""
+        self.ready_at = self.clock.monotonic() + random.uniform(self.min_delay, self.max_delay)
+
+    def reset(self):
+        """Clear the cooldown, e.g. when a reserved trade failed to execute."""
+        self.ready_at = 0.0
+
+class Backoff:
+    """Exponential backoff for consecutive failures."""
+
+    def __init__(self, base=1.0, maximum=60.0, factor=2.0, clock=REAL_CLOCK):
+        self.base = base
+        self.maximum = maximum
+        self.factor = factor
+        self.clock = clock
+        self.failures = 0
+
+    def next_delay(self):
+        """Get the delay for the current failure streak and extend the streak."""
+        delay = min(self.maximum, self.base * self.factor ** self.failures)
+        self.failures += 1
+        return delay
+
+    def reset(self):
+        """Reset the failure streak after a success."""
+        self.failures = 0
+
+    async def wait(self):
+        """Sleep for the next backoff delay."""
+        delay = self.next_delay()
+        logger.debug("Backing off for %.1fs after %s failures", delay, self.failures)
+        await self.clock.sleep(delay)
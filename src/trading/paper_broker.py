@@ -0,0 +1,214 @@
+import csv
+import heapq
+import random
+import logging
+import itertools
+from collections import defaultdict, deque
+from config.config import TRADING_CONFIG, PAPER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Starting prices of the synthetic random walk
+BASE_PRICES = {
+    'EURUSD': 1.08500,
+    'GBPUSD': 1.27000,
+    'USDJPY': 151.200,
+    'AUDUSD': 0.65500,
+    'USDCAD': 1.36000,
+    'EURJPY': 164.100,
+}
+
+class SyntheticTicks:
+    """Seeded per-asset random walk; every read advances time by ``spacing`` seconds."""
+
+    def __init__(self, seed=42, spacing=1.0, start_time=1_700_000_000.0, volatility=0.0001):
+        self.random = random.Random(seed)
+        self.spacing = spacing
+        self.volatility = volatility
+        self.timestamp = start_time
+        self.prices = dict(BASE_PRICES)
+
+    def next_tick(self, asset):
+        """Get the next ``(timestamp, price)`` of an asset."""
+        price = self.prices.get(asset, 1.0)
+        price = round(price * (1 + self.random.gauss(0, self.volatility)), 5)
+        self.prices[asset] = price
+        self.timestamp += self.spacing
+        return self.timestamp, price
+
+class RecordedTicks:
+    """Replay ``timestamp,asset,price`` rows from a CSV file, per asset in file order."""
+
+    def __init__(self, path):
+        self.ticks = defaultdict(deque)
+        with open(path, newline='') as f:
+            for row in csv.reader(f):
+                if not row or row[0].startswith('#') or row[0] == 'timestamp':
+                    continue
+                self.ticks[row[1].strip().upper()].append((float(row[0]), float(row[2])))
+
+    def next_tick(self, asset):
+        """Get the next recorded ``(timestamp, price)`` of an asset, or None when exhausted."""
+        ticks = self.ticks.get(asset)
+        if not ticks:
+            return None
+        return ticks.popleft()
+
+class PaperBroker:
+    """In-process broker with the QuotexInterface surface, for tests and soak runs.
+
+    Orders fill at the last price of the tick source and settle at expiry on
+    the source's own timeline: every price read advances it, so a run is as
+    fast as the caller polls and needs no browser.
+    """
+
+    def __init__(self, ticks=None, balance=10000.0, payouts=None, expiry=None, clock=None):
+        self.ticks = ticks or SyntheticTicks()
+        self.clock = clock  # follow the bot's clock instead of the tick timestamps
+        self.payouts = payouts or {}
+        self.default_payout = TRADING_CONFIG['PAYOUT']
+        self.expiry = expiry or TRADING_CONFIG['TRADE_EXPIRY']
+        self.balances = {'demo': balance, 'live': balance}
+        self.is_logged_in = False
+        self.is_demo_mode = False
+        self.current_asset = TRADING_CONFIG['DEFAULT_ASSET']
+        self.preset_amount = None
+        self.now = None
+        self.last_prices = {}
+        self.open_trades = []  # heap of (expires_at, seq, trade)
+        self.history = deque(maxlen=1000)  # settled trades, newest first
+        self.sequence = itertools.count()
+
+    @property
+    def account(self):
+        return 'demo' if self.is_demo_mode else 'live'
+
+    @property
+    def balance(self):
+        """Balance of the active account, always current."""
+        return round(self.balances[self.account], 2)
+
+    def is_balance_fresh(self, max_age):
+        """The simulated balance is always current."""
+        return self.is_logged_in
+
+    def invalidate_balance(self):
+        """Nothing to invalidate, balances are read from memory."""
+
+    def login(self):
+        """Log in to the simulated account."""
+        self.is_logged_in = True
+        logger.info("Paper broker ready (%s balance $%.2f)", self.account, self.balances[self.account])
+        return True
+
+    def switch_to_demo(self):
+        """Switch to the demo account."""
+        self.is_demo_mode = True
+        return True
+
+    def switch_to_live(self):
+        """Switch to the live (still simulated) account."""
+        self.is_demo_mode = False
+        return True
+
+    def get_balance(self):
+        """Get the balance of the active account."""
+        if not self.is_logged_in:
+            return None
+        return self.balance
+
+    def get_current_price(self):
+        """Advance the tick source by one tick of the selected asset and settle due trades."""
+        if not self.is_logged_in:
+            return None
+        tick = self.ticks.next_tick(self.current_asset)
+        if tick is None:
+            return None
+        timestamp, price = tick
+        self.now = self.clock.time() if self.clock else timestamp
+        self.last_prices[self.current_asset] = price
+        self.settle_due(self.now)
+        return price
+
+    def push_tick(self, asset, price, timestamp):
+        """Move an asset's price from an outside feed (e.g. a replay) and settle due trades."""
+        self.now = self.clock.time() if self.clock else timestamp
+        self.last_prices[asset] = price
+        self.settle_due(self.now)
+
+    def select_asset(self, asset_name):
+        """Select the traded asset."""
+        self.current_asset = asset_name
+        return True
+
+    def get_tab_status(self):
+        """Last price of every asset traded so far; there are no tabs to measure."""
+        return {asset: {'price': price, 'memory_mb': None} for asset, price in self.last_prices.items()}
+
+    def get_chart_candles(self, limit):
+        """There is no chart; warm-up falls back to stored history."""
+        return None
+
+    def set_amount(self, amount, fast=False):
+        """Preset the order amount."""
+        self.preset_amount = amount
+        return True
+
+    def place_trade(self, direction, amount, fast=False):
+        """Fill an order at the last price; the stake is debited immediately."""
+        if not self.is_logged_in or direction not in ('up', 'down'):
+            return False
+        price = self.last_prices.get(self.current_asset)
+        if price is None or amount <= 0 or amount > self.balances[self.account]:
+            return False
+
+        self.balances[self.account] -= amount
+        trade = {
+            'account': self.account,
+            'asset': self.current_asset,
+            'direction': direction,
+            'amount': amount,
+            'price': price,
+            'id': str(next(self.sequence)),
+            'opened_at': self.now,
+        }
+        heapq.heappush(self.open_trades, (self.now + self.expiry, next(self.sequence), trade))
+        return True
+
+    def settle_due(self, now):
+        """Settle every trade that expired at or before ``now``."""
+        while self.open_trades and self.open_trades[0][0] <= now:
+            _, _, trade = heapq.heappop(self.open_trades)
+            close_price = self.last_prices.get(trade['asset'], trade['price'])
+            if close_price == trade['price']:
+                profit, payout = 0.0, trade['amount']
+            elif (close_price > trade['price']) == (trade['direction'] == 'up'):
+                profit = round(trade['amount'] * self.payouts.get(trade['asset'], self.default_payout), 2)
+                payout = trade['amount'] + profit
+            else:
+                profit, payout = -trade['amount'], 0.0
+            self.balances[trade['account']] += payout
+            self.history.appendleft(dict(trade, close_price=close_price, profit=profit))
+
+    def get_trade_history(self, limit=20):
+        """Get the most recent settled trades, newest first."""
+        return [
+            {key: trade[key] for key in ('id', 'opened_at', 'asset', 'direction', 'amount', 'profit')}
+            for trade in itertools.islice(self.history, limit)
+        ]
+
+    def take_screenshot(self, filename):
+        """There is no page to capture."""
+        return False
+
+    def close(self):
+        """Log out of the simulated account."""
+        self.is_logged_in = False
+
+def create_paper_broker(clock=None):
+    """Build a PaperBroker from PAPER_CONFIG."""
+    if PAPER_CONFIG['TICKS_FILE']:
+        ticks = RecordedTicks(PAPER_CONFIG['TICKS_FILE'])
+    else:
+        ticks = SyntheticTicks(PAPER_CONFIG['SEED'], PAPER_CONFIG['TICK_SPACING'])
+    return PaperBroker(ticks, PAPER_CONFIG['BALANCE'], PAPER_CONFIG['PAYOUTS'], clock=clock)
@@ -0,0 +1,211 @@
+import logging
+import time
+import asyncio
+from src.monitoring.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+# Back-pressure policies for a full stage queue
+BLOCK = 'block'              # wait for space, nothing is lost
+DROP_OLDEST = 'drop_oldest'  # discard the stalest droppable item to make room
+
+class StageStats:
+    """Latency and throughput counters for one pipeline stage."""
+
+    def __init__(self, name):
+        self.histogram = REGISTRY.histogram('stage_seconds', stage=name)
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency):
+        """Record the latency of one processed item."""
+        self.histogram.observe(latency)
+        self.processed += 1
+        self.total_latency += latency
+        self.last_latency = latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    def as_dict(self):
+        """Get the counters as a plain dict."""
+        return {
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'avg_latency': self.total_latency / self.processed if self.processed else 0.0,
+            'last_latency': self.last_latency,
+            'max_latency': self.max_latency,
+        }
+
+class StageQueue(asyncio.Queue):
+    """asyncio.Queue that can discard its oldest item matching a predicate."""
+
+    def drop_oldest(self, droppable):
+        """Remove the oldest item for which ``droppable(item)`` is true; False if there is none."""
+        for item in self._queue:
+            if droppable(item):
+                break
+        else:
+            return False
+        self._queue.remove(item)
+        self.task_done()
+        return True
+
+class Stage:
+    """A pipeline stage: a bounded queue drained by one or more workers.
+
+    ``handler`` is a coroutine function taking one item. Whatever it returns,
+    unless None, is forwarded to the next stage. Under DROP_OLDEST only items
+    for which ``droppable(item)`` is true are ever discarded (all by default);
+    the others wait for space as under BLOCK. Once the stage is closed its
+    items are discarded unprocessed, each passed to ``on_discard`` if set.
+    """
+
+    def __init__(self, name, handler, maxsize, policy=BLOCK, workers=1, droppable=None, on_discard=None):
+        if policy not in (BLOCK, DROP_OLDEST):
+            raise ValueError(f"Unknown back-pressure policy: {policy}")
+        self.name = name
+        self.handler = handler
+        self.queue = StageQueue(maxsize)
+        self.policy = policy
+        self.droppable = droppable or (lambda item: True)
+        self.on_discard = on_discard
+        self.closed = False
+        self.workers = workers
+        self.downstream = None
+        self.stats = StageStats(name)
+
+    async def put(self, item):
+        """Enqueue an item, applying the stage's back-pressure policy."""
+        if self.policy == DROP_OLDEST:
+            while self.queue.full() and self.queue.drop_oldest(self.droppable):
+                self.stats.dropped += 1
+            if not self.queue.full():
+                self.queue.put_nowait(item)
+                return
+            if self.droppable(item):
+                # Only items that must be kept are queued; this one is the stalest now
+                self.stats.dropped += 1
+                return
+        await self.queue.put(item)
+
+    async def worker(self):
+        """Process items from the queue until cancelled."""
+        while True:
+            item = await self.queue.get()
+            started = time.perf_counter()
+            try:
+                if self.closed:
+                    self.discard(item)
+                    continue
+                result = await self.handler(item)
+                self.stats.record(time.perf_counter() - started)
+                if result is not None and self.downstream is not None:
+                    await self.downstream.put(result)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats.errors += 1
+                logger.error("Error in pipeline stage %s: %s", self.name, e)
+            finally:
+                self.queue.task_done()
+
+    def discard(self, item):
+        """Drop an item of a closed stage."""
+        self.stats.dropped += 1
+        if self.on_discard is not None:
+            self.on_discard(item)
+
+    def get_stats(self):
+        """Get the stage counters including the current queue depth."""
+        stats = self.stats.as_dict()
+        stats['queue_depth'] = self.queue.qsize()
+        return stats
+
+class Pipeline:
+    """Chain of stages fed by a single producer coroutine.
+
+    On stop, stages from ``drain_from`` onwards (all by default) finish their
+    queued items; earlier stages are closed, so their queued items are
+    discarded while items already being handled still complete.
+    """
+
+    def __init__(self, source_name='feed', drain_timeout=30.0, drain_from=None):
+        self.stages = []
+        self.source_name = source_name
+        self.drain_timeout = drain_timeout
+        self.drain_from = drain_from
+        self.source_stats = StageStats(source_name)
+        self.source_task = None
+
+    def add_stage(self, name, handler, maxsize, policy=BLOCK, workers=1, droppable=None, on_discard=None):
+        """Append a stage and link it to the previous one."""
+        stage = Stage(name, handler, maxsize, policy, workers, droppable, on_discard)
+        if self.stages:
+            self.stages[-1].downstream = stage
+        self.stages.append(stage)
+        return stage
+
+    async def run(self, source):
+        """Run the stage workers while ``source(first_stage)`` produces items.
+
+        When the source returns or is stopped with ``stop()``, queued items
+        are drained before the workers stop, so placed trades are still
+        notified. If the source fails or ``run`` is cancelled, the pipeline
+        stops at once.
+        """
+        tasks = [
+            asyncio.create_task(stage.worker(), name=f"pipeline-{stage.name}-{i}")
+            for stage in self.stages
+            for i in range(stage.workers)
+        ]
+        self.source_task = asyncio.create_task(source(self.stages[0]), name=f"pipeline-{self.source_name}")
+        try:
+            # wait() keeps a cancellation of run() apart from a stop() of the source
+            await asyncio.wait({self.source_task})
+            if not self.source_task.cancelled():
+                self.source_task.result()
+            await self.drain()
+        finally:
+            self.source_task.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(self.source_task, *tasks, return_exceptions=True)
+
+    def stop(self):
+        """Stop the source; ``run`` then drains the queues and returns."""
+        if self.source_task is not None:
+            self.source_task.cancel()
+
+    async def drain(self):
+        """Finish queued items from ``drain_from`` on, in order, within ``drain_timeout`` overall.
+
+        Earlier stages are closed first and emptied along the way, so
+        nothing new reaches the drained stages except results of items that
+        were already being handled.
+        """
+        names = [stage.name for stage in self.stages]
+        first = names.index(self.drain_from) if self.drain_from else 0
+        for stage in self.stages[:first]:
+            stage.closed = True
+
+        deadline = time.monotonic() + self.drain_timeout
+        for stage in self.stages:
+            try:
+                await asyncio.wait_for(stage.queue.join(), max(deadline - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Pipeline stopped with %d items left in stage %s", stage.queue.qsize(), stage.name
+                )
+                return
+
+    def get_stats(self):
+        """Get counters for the producer and every stage, in pipeline order."""
+        stats = {self.source_name: dict(self.source_stats.as_dict(), queue_depth=0)}
+        for stage in self.stages:
+            stats[stage.name] = stage.get_stats()
+        return stats
@@ -0,0 +1,170 @@
+import heapq
+import logging
+import itertools
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class PositionTracker:
+    """Track open trades by expiry and settle their outcomes into the RiskManager.
+
+    Open trades sit in a min-heap keyed by expiry, so checking for due trades
+    on every tick is O(1) and settling is O(log n). A trade is settled from the
+    tick feed with the last price at or before its expiry when that tick is
+    within ``tick_tolerance`` seconds of it; trades the feed cannot settle
+    (asset switched, feed stalled) are left for one batched read of the
+    platform's trade history via ``settle_from_history``. A trade that
+    history cannot settle either becomes unknown: RiskManager pauses trading
+    until it is reconciled by hand.
+    """
+
+    def __init__(self, risk_manager, payout, match_window=10.0, tick_tolerance=2.0, max_consumed=1000):
+        self.risk_manager = risk_manager
+        self.payout = payout
+        self.tick_tolerance = tick_tolerance  # max seconds between the settling tick and expiry
+        self.match_window = match_window  # seconds between our and the platform's open time
+        self.pending = []  # heap of (expires_at, seq, trade)
+        self.unresolved = []  # expired trades waiting for the history read
+        self.unknown = []  # trades no history read could settle, oldest first
+        self.last_ticks = {}  # asset -> (price, timestamp)
+        self.consumed = OrderedDict()  # keys of history rows already used, oldest first
+        self.max_consumed = max_consumed
+        self.sequence = itertools.count()
+
+    def open(self, trade):
+        """Start tracking a placed trade (needs asset, direction, amount, price, opened_at, expires_at)."""
+        heapq.heappush(self.pending, (trade['expires_at'], next(self.sequence), trade))
+
+    def get_open_trades(self):
+        """Get the trades that have not expired yet, soonest expiry first."""
+        return [trade for _, _, trade in sorted(self.pending)]
+
+    def on_tick(self, asset, price, timestamp):
+        """Settle the trades that expired before this tick; returns the settled trades."""
+        settled = []
+        while self.pending and self.pending[0][0] <= timestamp:
+            _, _, trade = heapq.heappop(self.pending)
+            last_tick = self.last_ticks.get(trade['asset'])
+            if (trade['asset'] == asset and last_tick is not None
+                    and trade['expires_at'] - last_tick[1] <= self.tick_tolerance):
+                # The previous tick is the last price at or before expiry, and recent enough
+                settled.append(self.settle(trade, last_tick[0], 'tick'))
+            else:
+                self.unresolved.append(trade)
+        self.last_ticks[asset] = (price, timestamp)
+        return settled
+
+    def collect_overdue(self, before):
+        """Hand trades that expired before ``before`` without a tick to the history read."""
+        while self.pending and self.pending[0][0] <= before:
+            self.unresolved.append(heapq.heappop(self.pending)[2])
+        return list(self.unresolved)
+
+    def abandon(self, before):
+        """Mark unresolved trades that expired before ``before`` as unknown; trading pauses."""
+        stale = [trade for trade in self.unresolved if trade['expires_at'] <= before]
+        for trade in stale:
+            self.unresolved.remove(trade)
+            self.unknown.append(trade)
+            self.risk_manager.add_unknown(trade)
+            logger.warning(
+                "Could not settle %s %s $%s, trading paused until it is reconciled",
+                trade['direction'], trade['asset'], trade['amount'],
+                extra={'trade': trade, 'asset': trade['asset']}
+            )
+        return stale
+
+    def reconcile(self, result):
+        """Settle the oldest unknown trade as a 'win', 'loss' or 'tie'; None if there is none."""
+        if not self.unknown:
+            return None
+        trade = self.unknown.pop(0)
+        if result == 'win':
+            profit = round(trade['amount'] * self.payout, 2)
+        elif result == 'loss':
+            profit = -trade['amount']
+        else:
+            profit = 0.0
+        outcome = self.settle(trade, None, 'manual', profit)
+        self.risk_manager.resolve_unknown(trade)
+        return outcome
+
+    def settle(self, trade, close_price, resolved_by, profit=None):
+        """Record the outcome of an expired trade in the RiskManager."""
+        if profit is None:
+            if close_price == trade['price']:
+                profit = 0.0
+            elif (close_price > trade['price']) == (trade['direction'] == 'up'):
+                profit = round(trade['amount'] * self.payout, 2)
+            else:
+                profit = -trade['amount']
+
+        if profit > 0:
+            result = 'win'
+        elif profit < 0:
+            result = 'loss'
+        else:
+            result = 'tie'
+
+        outcome = dict(
+            trade,
+            close_price=close_price,
+            result=result,
+            profit=profit,
+            resolved_by=resolved_by
+        )
+        self.risk_manager.add_trade(outcome)
+        logger.info(
+            "Trade %s %s $%s settled: %s %+.2f",
+            trade['direction'],
+            trade['asset'],
+            trade['amount'],
+            result,
+            profit,
+            extra={'trade': outcome, 'asset': trade['asset']}
+        )
+        return outcome
+
+    def settle_from_history(self, history):
+        """Settle unresolved trades from platform history rows.
+
+        ``history`` is a list of dicts with id, opened_at, asset, direction,
+        amount and profit, as returned by QuotexInterface.get_trade_history.
+        Rows are taken oldest first and each settles the oldest unresolved
+        trade with the same asset, direction and amount opened within
+        ``match_window`` seconds of it. A row is used once across calls;
+        rows without an open time cannot be told apart and are skipped.
+        Returns the settled trades.
+        """
+        settled = []
+        rows = sorted(
+            (row for row in history if row.get('opened_at') is not None),
+            key=lambda row: row['opened_at']
+        )
+        for row in rows:
+            key = self.row_key(row)
+            if key in self.consumed:
+                continue
+            for trade in self.unresolved:
+                if (row['asset'] == trade['asset']
+                        and row['direction'] == trade['direction']
+                        and abs(row['amount'] - trade['amount']) < 0.01
+                        and abs(row['opened_at'] - trade['opened_at']) <= self.match_window):
+                    self.consume(key)
+                    self.unresolved.remove(trade)
+                    settled.append(self.settle(trade, None, 'history', row['profit']))
+                    break
+        return settled
+
+    @staticmethod
+    def row_key(row):
+        """Identity of a history row: the platform's id, else its open time and order."""
+        if row.get('id'):
+            return row['id']
+        return (row['opened_at'], row['asset'], row['direction'], round(row['amount'], 2))
+
+    def consume(self, key):
+        """Remember a used history row; the oldest keys are forgotten beyond ``max_consumed``."""
+        self.consumed[key] = True
+        while len(self.consumed) > self.max_consumed:
+            self.consumed.popitem(last=False)
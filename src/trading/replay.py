@@ -0,0 +1,196 @@
+"""Deterministic replay of recorded ticks through the live trading pipeline.
+
+Recorded ``timestamp,asset,price`` rows are fed to the real TradingBot in
+place of the browser price feed, with the paper broker filling orders. Every
+signal, risk decision and order is written to a JSON-lines log, so two runs
+over the same data can be diffed line by line.
+
+    python -m src.trading.replay data/ticks/EURUSD.csv --speed max --record run.jsonl
+"""
+import os
+import csv
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+from .candles import CandleAggregator
+from .clock import VirtualClock, ScaledClock
+
+logger = logging.getLogger(__name__)
+
+def load_ticks(path, asset=None):
+    """Load ``(timestamp, asset, price)`` rows, optionally for one asset, in time order."""
+    rows = []
+    with open(path, newline='') as f:
+        for row in csv.reader(f):
+            if not row or row[0].startswith('#') or row[0] == 'timestamp':
+                continue
+            row_asset = row[1].strip().upper()
+            if asset is None or row_asset == asset:
+                rows.append((float(row[0]), row_asset, float(row[2])))
+    rows.sort(key=lambda row: row[0])
+    return rows
+
+class TickRecorder:
+    """Append live ticks to a CSV file in the format replay reads."""
+
+    def __init__(self, path, flush_every=100):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.file = open(path, 'a', newline='')
+        self.writer = csv.writer(self.file)
+        self.flush_every = flush_every
+        self.unflushed = 0
+
+    def record(self, timestamp, asset, price):
+        self.writer.writerow((f"{timestamp:.3f}", asset, price))
+        self.unflushed += 1
+        if self.unflushed >= self.flush_every:
+            self.file.flush()
+            self.unflushed = 0
+
+    def close(self):
+        self.file.close()
+
+class DecisionRecorder:
+    """Write signals, risk decisions and orders as sorted-key JSON lines."""
+
+    def __init__(self, path):
+        self.file = open(path, 'w')
+        self.sequence = 0
+        self.counts = {}
+
+    def record(self, kind, timestamp, **fields):
+        self.sequence += 1
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        entry = dict(fields, seq=self.sequence, kind=kind, time=round(timestamp, 3))
+        self.file.write(json.dumps(entry, sort_keys=True, default=float) + '\n')
+
+    def close(self):
+        self.file.close()
+
+class ReplayFeed:
+    """Feed recorded ticks with the PriceFeed event interface.
+
+    The clock decides the pace: a VirtualClock replays at maximum speed, a
+    ScaledClock at N times real time. ``on_tick`` sees every tick before it
+    is emitted (e.g. to move the paper broker's price).
+    """
+
+    def __init__(self, asset, rows, timeframe, clock, on_tick=None):
+        self.asset = asset
+        self.rows = [row for row in rows if row[1] == asset]
+        self.position = 0
+        self.clock = clock
+        self.on_tick = on_tick
+        self.aggregator = CandleAggregator(timeframe)
+        self.last_price = None
+        self.pending = []
+        self.finished = asyncio.Event()
+
+    async def next_event(self):
+        """Wait until the next recorded event is due; blocks forever once the data ends."""
+        while not self.pending:
+            if self.position >= len(self.rows):
+                self.finished.set()
+                await asyncio.Future()
+            timestamp, _, price = self.rows[self.position]
+            self.position += 1
+
+            delay = timestamp - self.clock.time()
+            if delay > 0:
+                await self.clock.sleep(delay)
+            if self.on_tick:
+                self.on_tick(self.asset, price, timestamp)
+
+            closed = self.aggregator.add_tick(price, timestamp)
+            if closed is not None:
+                self.pending.append(('bar', closed, timestamp))
+            if price != self.last_price:
+                self.last_price = price
+                self.pending.append(('tick', price, timestamp))
+
+        return self.pending.pop(0)
+
+async def run_replay(path, asset, speed=None, record_path=None, seed=0, settle=True):
+    """Replay a tick file through TradingBot; ``speed`` None means as fast as possible."""
+    from main import TradingBot
+    from config.config import TRADING_CONFIG
+    from .paper_broker import PaperBroker
+
+    random.seed(seed)  # cooldown jitter must match between runs
+    rows = load_ticks(path, asset)
+    if not rows:
+        raise ValueError(f"No ticks for {asset} in {path}")
+
+    start = rows[0][0]
+    clock = VirtualClock(start) if speed is None else ScaledClock(start, speed)
+    broker = PaperBroker(clock=clock)
+    bot = TradingBot(broker, clock)
+    bot.telegram_bot.admin_ids = []
+    bot.current_asset = asset
+    bot.recorder = DecisionRecorder(record_path) if record_path else None
+
+    feed = ReplayFeed(asset, rows, TRADING_CONFIG['DEFAULT_TIMEFRAME'], clock, broker.push_tick)
+    bot.feed_factory = lambda feed_asset: feed
+
+    clock_task = asyncio.create_task(clock.run()) if speed is None else None
+    started = time.perf_counter()
+    try:
+        await bot.start_browser()
+        bot.trade_task = asyncio.create_task(bot.start_trading())
+        await feed.finished.wait()
+        if settle:
+            # Let the last trades expire on the broker's timeline
+            await clock.sleep(TRADING_CONFIG['TRADE_EXPIRY'] + 1)
+            broker.settle_due(clock.time())
+        await bot.stop_trading()
+    finally:
+        if clock_task:
+            clock_task.cancel()
+        if bot.settle_task:
+            bot.settle_task.cancel()
+        if bot.recorder:
+            bot.recorder.close()
+        wall = time.perf_counter() - started
+        balance = broker.get_balance()
+        bot.stop()
+
+    return {
+        'asset': asset,
+        'ticks': len(feed.rows),
+        'data_hours': (rows[-1][0] - start) / 3600,
+        'wall_seconds': wall,
+        'ticks_per_second': len(feed.rows) / wall if wall else None,
+        'decisions': bot.recorder.counts if bot.recorder else None,
+        'trade_stats': bot.risk_manager.get_trade_stats(),
+        'balance': balance,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded ticks through the trading pipeline")
+    parser.add_argument('ticks', help="CSV file of timestamp,asset,price rows")
+    parser.add_argument('--asset', help="asset to trade (default: first asset in the file)")
+    parser.add_argument('--speed', default='max', help="'max' or a real-time multiplier such as 1 or 60")
+    parser.add_argument('--record', help="write the decision log to this JSON-lines file")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Nothing is sent to Telegram or a browser during a replay
+    os.environ.setdefault('TELEGRAM_BOT_TOKEN', '0:replay')
+    os.environ.setdefault('QUOTEX_EMAIL', 'replay@example.com')
+    os.environ.setdefault('QUOTEX_PASSWORD', 'replay')
+
+    from config.config import JOURNAL_CONFIG, load_config
+    load_config()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    JOURNAL_CONFIG['ENABLED'] = False  # keep replayed trades out of the real journal
+
+    asset = args.asset.upper() if args.asset else load_ticks(args.ticks)[0][1]
+    speed = None if args.speed == 'max' else float(args.speed)
+    results = asyncio.run(run_replay(args.ticks, asset, speed, args.record, args.seed))
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
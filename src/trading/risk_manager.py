@@ -4,11 +4,30 @@ from config.config import TRADING_CONFIG
 logger = logging.getLogger(__name__)
 
 class RiskManager:
-    def __init__(self):
+    def __init__(self, journal=None):
         self.risk_percentage = TRADING_CONFIG['RISK_PERCENTAGE']
         self.min_delay = TRADING_CONFIG['MIN_DELAY']
         self.max_delay = TRADING_CONFIG['MAX_DELAY']
         self.trade_history = []
+        self.unknown_trades = []  # placed trades whose outcome is not known; trading pauses
+        self.net_profit = 0.0  # over every recorded trade, seeded from the journal
+        self.journal = journal
+        if journal is not None:
+            self.restore()
+
+    def restore(self):
+        """Reload the recent trade window from the journal after a restart."""
+        try:
+            self.trade_history = self.journal.get_recent_trades(100)
+            aggregates = self.journal.get_aggregates()
+            self.net_profit = aggregates['net_profit']
+            logger.info(
+                "Restored %s journaled trades, loss streak %s",
+                aggregates['total_trades'],
+                aggregates['loss_streak']
+            )
+        except Exception as e:
+            logger.error("Failed to restore trade history: %s", e)
 
     def calculate_position_size(self, balance):
         """Calculate position size based on account balance and risk percentage."""
@@ -16,7 +35,7 @@ class RiskManager:
             risk_amount = balance * self.risk_percentage
             return round(risk_amount, 2)
         except Exception as e:
-            logger.error(f"Error calculating position size: {str(e)}")
+            logger.error("Error calculating position size: %s", e)
             return None
 
     def can_trade(self, balance):
@@ -27,6 +46,10 @@ class RiskManager:
             if min_trade is None or min_trade < 1:  # Assuming minimum trade size is 1
                 return False
 
+            if self.unknown_trades:
+                logger.warning("%d trades with unknown outcome - trading paused", len(self.unknown_trades))
+                return False
+
             # Check if we've had too many consecutive losses
             if len(self.trade_history) >= 3:
                 last_three = self.trade_history[-3:]
@@ -36,15 +59,31 @@ class RiskManager:
 
             return True
         except Exception as e:
-            logger.error(f"Error in can_trade check: {str(e)}")
+            logger.error("Error in can_trade check: %s", e)
             return False
 
     def add_trade(self, trade_data):
         """Add a trade to the history."""
+        if self.journal is not None:
+            self.journal.record(trade_data)
         self.trade_history.append(trade_data)
+        self.net_profit += trade_data['profit']
         if len(self.trade_history) > 100:  # Keep last 100 trades
             self.trade_history.pop(0)
 
+    def add_unknown(self, trade):
+        """Hold a trade that could not be settled; trading pauses until it is resolved."""
+        self.unknown_trades.append(trade)
+
+    def resolve_unknown(self, trade):
+        """Release an unknown trade once its outcome has been recorded with add_trade."""
+        if trade in self.unknown_trades:
+            self.unknown_trades.remove(trade)
+
+    def get_total_profit(self):
+        """Get the net profit/loss over all recorded trades, journaled ones included."""
+        return round(self.net_profit, 2)
+
     def get_trade_stats(self):
         """Get trading statistics."""
         if not self.trade_history:
@@ -75,6 +114,12 @@ class RiskManager:
             'average_loss': round(average_loss, 2)
         }
 
+    def get_lifetime_stats(self):
+        """Get aggregates over all journaled trades, or None without a journal."""
+        if self.journal is None:
+            return None
+        return self.journal.get_aggregates()
+
     def get_risk_settings(self):
         """Get current risk management settings."""
         return {
@@ -0,0 +1,99 @@
+"""Monte Carlo risk of ruin under the RiskManager rules.
+
+Every path is one account: all paths advance one trade at a time as NumPy
+arrays, with the stake sized like ``calculate_position_size`` (rounded
+RISK_PERCENTAGE of the balance), no trade below the $1 minimum, and the
+permanent pause ``can_trade`` applies after three consecutive losses.
+With ``resume=True`` the streak is cleared instead, as when an operator
+restarts trading after every pause.
+"""
+import time
+import logging
+import numpy as np
+from config.config import TRADING_CONFIG, RISK_SIMULATION_CONFIG
+
+logger = logging.getLogger(__name__)
+
+PAUSE_STREAK = 3  # consecutive losses after which RiskManager stops trading
+MIN_TRADE = 1
+
+def simulate_risk(win_rate, balance, payout=None, risk_percentage=None, trades=None,
+                  paths=None, loss_streak=0, ruin_drawdown=None, resume=False, seed=None):
+    """Simulate ``paths`` accounts over ``trades`` signals and summarize their drawdowns.
+
+    A path is ruined when its drawdown reaches ``ruin_drawdown`` or the stake
+    falls below the minimum trade. ``loss_streak`` is the current run of losses.
+    By default ``paths`` is PATHS, or fewer for long runs so that paths x
+    trades stays within PATH_TRADES.
+    """
+    started = time.perf_counter()
+    payout = TRADING_CONFIG['PAYOUT'] if payout is None else payout
+    risk_percentage = risk_percentage or TRADING_CONFIG['RISK_PERCENTAGE']
+    trades = trades or RISK_SIMULATION_CONFIG['TRADES']
+    # Bound paths x trades so a /risk reply stays within a second or two
+    paths = paths or min(RISK_SIMULATION_CONFIG['PATHS'], RISK_SIMULATION_CONFIG['PATH_TRADES'] // trades)
+    ruin_drawdown = ruin_drawdown or RISK_SIMULATION_CONFIG['RUIN_DRAWDOWN']
+    rng = np.random.default_rng(seed)
+
+    if resume:
+        loss_streak = 0
+    # Balances in cents so that rounding to the cent is a plain rint; masks
+    # are applied arithmetically, which is far cheaper than masked writes
+    balances = np.full(paths, float(round(balance * 100)))
+    peaks = balances.copy()
+    max_drawdowns = np.zeros(paths)
+    streaks = np.full(paths, loss_streak, dtype=np.int32)
+    traded = np.zeros(paths, dtype=np.int32)
+    pauses = np.zeros(paths, dtype=np.int32)
+    active = np.full(paths, loss_streak < PAUSE_STREAK)
+    stakes, gains, drawdowns = np.empty(paths), np.empty(paths), np.empty(paths)
+
+    for _ in range(trades):
+        np.rint(np.multiply(balances, risk_percentage, out=stakes), out=stakes)
+        active &= stakes >= MIN_TRADE * 100
+        if not active.any():
+            break
+        wins = rng.random(paths, dtype=np.float32) < win_rate
+        np.rint(np.multiply(stakes, payout, out=gains), out=gains)
+        # +gain on a win, -stake on a loss, nothing while inactive
+        gains += stakes
+        gains *= wins
+        gains -= stakes
+        gains *= active
+        balances += gains
+        traded += active
+
+        streaks += 1
+        streaks *= ~wins
+        paused = active & (streaks >= PAUSE_STREAK)
+        pauses += paused
+        if resume:
+            streaks *= ~paused
+        else:
+            active &= ~paused
+
+        np.maximum(peaks, balances, out=peaks)
+        np.divide(balances, peaks, out=drawdowns)
+        np.subtract(1, drawdowns, out=drawdowns)
+        np.maximum(max_drawdowns, drawdowns, out=max_drawdowns)
+
+    balances /= 100
+    ruined = (max_drawdowns >= ruin_drawdown) | (np.round(balances * risk_percentage, 2) < MIN_TRADE)
+    drawdown_quantiles = np.quantile(max_drawdowns, (0.5, 0.9, 0.95, 0.99))
+    balance_quantiles = np.quantile(balances, (0.05, 0.5, 0.95))
+    return {
+        'paths': paths,
+        'trades': trades,
+        'win_rate': win_rate,
+        'payout': payout,
+        'risk_percentage': risk_percentage,
+        'ruin_drawdown': ruin_drawdown,
+        'ruin_probability': round(float(ruined.mean()), 4),
+        'resume': resume,
+        'pause_probability': round(float((pauses > 0).mean()), 4),
+        'median_pauses': int(np.median(pauses)),
+        'median_trades': int(np.median(traded)),
+        'drawdown_quantiles': dict(zip(('p50', 'p90', 'p95', 'p99'), np.round(drawdown_quantiles, 4).tolist())),
+        'balance_quantiles': dict(zip(('p5', 'p50', 'p95'), np.round(balance_quantiles, 2).tolist())),
+        'seconds': round(time.perf_counter() - started, 2),
+    }
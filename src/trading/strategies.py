@@ -0,0 +1,208 @@
+import logging
+from config.config import STRATEGY_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Indicator name -> function(prices, *params) returning the latest value
+INDICATORS = {}
+
+# Strategy name -> Strategy subclass
+STRATEGIES = {}
+
+# Ways combine_votes can merge the strategies' signals
+VOTING_POLICIES = ('priority', 'majority', 'unanimous')
+
+def register_indicator(name):
+    """Register an indicator function under ``name``."""
+    def decorator(func):
+        INDICATORS[name] = func
+        return func
+    return decorator
+
+def register_strategy(name):
+    """Register a Strategy subclass under ``name``."""
+    def decorator(cls):
+        cls.name = name
+        STRATEGIES[name] = cls
+        return cls
+    return decorator
+
+def create_strategy(name):
+    """Instantiate a registered strategy with its STRATEGY_PARAMS overrides."""
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {name}")
+    return STRATEGIES[name](**STRATEGY_CONFIG['STRATEGY_PARAMS'].get(name, {}))
+
+@register_indicator('sma')
+def compute_sma(prices, period):
+    """Simple moving average of the last ``period`` prices."""
+    import pandas as pd
+    from ta.trend import SMAIndicator
+
+    return SMAIndicator(close=pd.Series(prices), window=period).sma_indicator().iloc[-1]
+
+@register_indicator('rsi')
+def compute_rsi(prices, period):
+    """Relative strength index over ``period`` prices."""
+    import pandas as pd
+    from ta.momentum import RSIIndicator
+
+    return RSIIndicator(close=pd.Series(prices), window=period).rsi().iloc[-1]
+
+class StrategyState:
+    """Per-strategy, per-asset mutable state; subclasses add their own slots."""
+    __slots__ = ('evaluations', 'signals', 'last_signal')
+
+    def __init__(self):
+        self.evaluations = 0
+        self.signals = 0
+        self.last_signal = None
+
+    def snapshot(self):
+        """Every slot of the state, subclass slots included."""
+        return {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__ for slot in getattr(cls, '__slots__', ())
+        }
+
+    def restore(self, values):
+        """Set the slots saved by ``snapshot``."""
+        for slot, value in values.items():
+            setattr(self, slot, value)
+
+class Strategy:
+    """Base class for strategy plugins.
+
+    ``indicators`` declares the inputs as ``{label: (indicator, params)}``; the
+    engine computes every distinct input once per update and passes the
+    values to ``evaluate`` by label. ``evaluate`` returns 'up', 'down' or None;
+    ``evaluate_series`` applies the same rule to every bar at once for backtests.
+    """
+    name = None
+    state_class = StrategyState
+
+    def __init__(self):
+        self.indicators = {}
+
+    def new_state(self):
+        """Create the state object for one asset."""
+        return self.state_class()
+
+    def evaluate(self, price, values, state):
+        raise NotImplementedError
+
+    def evaluate_series(self, prices, values):
+        """Signal of every bar as 1 (up), -1 (down) or 0; ``values`` are NaN while warming up."""
+        raise NotImplementedError(f"{self.name} has no vectorized rule")
+
+    def is_near(self, price, values, state, margin):
+        """Whether a signal is likely on one of the next bars; used to prepare orders."""
+        return False
+
+    def get_info(self):
+        """Get the strategy name and inputs."""
+        return {
+            'name': self.name,
+            'indicators': {label: f"{name}{params}" for label, (name, params) in self.indicators.items()},
+        }
+
+@register_strategy('sma_rsi')
+class SmaRsiStrategy(Strategy):
+    """Trend filter with RSI extremes: up above SMA when oversold, down below SMA when overbought."""
+
+    def __init__(self, sma_period=None, rsi_period=None, overbought=None, oversold=None):
+        super().__init__()
+        self.overbought = overbought or STRATEGY_CONFIG['RSI_OVERBOUGHT']
+        self.oversold = oversold or STRATEGY_CONFIG['RSI_OVERSOLD']
+        self.indicators = {
+            'sma': ('sma', (sma_period or STRATEGY_CONFIG['SMA_PERIOD'],)),
+            'rsi': ('rsi', (rsi_period or STRATEGY_CONFIG['RSI_PERIOD'],)),
+        }
+
+    def evaluate(self, price, values, state):
+        if price > values['sma'] and values['rsi'] < self.oversold:
+            return 'up'
+        if price < values['sma'] and values['rsi'] > self.overbought:
+            return 'down'
+        return None
+
+    def evaluate_series(self, prices, values):
+        sma, rsi = values['sma'], values['rsi']
+        up = (prices > sma) & (rsi < self.oversold)
+        down = (prices < sma) & (rsi > self.overbought)
+        return up.astype('i1') - down.astype('i1')
+
+    def is_near(self, price, values, state, margin):
+        if price > values['sma']:
+            return values['rsi'] < self.oversold + margin
+        if price < values['sma']:
+            return values['rsi'] > self.overbought - margin
+        return False
+
+class RsiReversalState(StrategyState):
+    __slots__ = ('previous_rsi',)
+
+    def __init__(self):
+        super().__init__()
+        self.previous_rsi = None
+
+@register_strategy('rsi_reversal')
+class RsiReversalStrategy(Strategy):
+    """Trade the RSI leaving an extreme: up when it crosses back above oversold, down below overbought."""
+    state_class = RsiReversalState
+
+    def __init__(self, rsi_period=None, overbought=None, oversold=None):
+        super().__init__()
+        self.overbought = overbought or STRATEGY_CONFIG['RSI_OVERBOUGHT']
+        self.oversold = oversold or STRATEGY_CONFIG['RSI_OVERSOLD']
+        self.indicators = {
+            'rsi': ('rsi', (rsi_period or STRATEGY_CONFIG['RSI_PERIOD'],)),
+        }
+
+    def evaluate(self, price, values, state):
+        previous, rsi = state.previous_rsi, values['rsi']
+        state.previous_rsi = rsi
+        if previous is None:
+            return None
+        if previous < self.oversold <= rsi:
+            return 'up'
+        if previous > self.overbought >= rsi:
+            return 'down'
+        return None
+
+    def evaluate_series(self, prices, values):
+        import numpy as np
+
+        rsi = values['rsi']
+        previous = np.concatenate(([np.nan], rsi[:-1]))  # NaN on the first evaluated bar too
+        up = (previous < self.oversold) & (self.oversold <= rsi)
+        down = (previous > self.overbought) & (self.overbought >= rsi)
+        return up.astype('i1') - down.astype('i1')
+
+    def is_near(self, price, values, state, margin):
+        # A reversal can only follow while the RSI is at an extreme
+        return values['rsi'] < self.oversold or values['rsi'] > self.overbought
+
+def combine_votes(votes, policy):
+    """Combine per-strategy signals (ordered by priority) into one signal.
+
+    ``priority``: the first strategy with a signal wins.
+    ``majority``: a direction backed by more than half of the strategies.
+    ``unanimous``: every strategy agrees on the direction.
+    """
+    signals = [signal for signal in votes.values() if signal]
+    if not signals:
+        return None
+
+    if policy == 'priority':
+        return signals[0]
+
+    for direction in ('up', 'down'):
+        count = signals.count(direction)
+        if policy == 'majority' and count * 2 > len(votes):
+            return direction
+        if policy == 'unanimous' and count == len(votes):
+            return direction
+    if policy not in VOTING_POLICIES:
+        raise ValueError(f"Unknown voting policy: {policy}")
+    return None
@@ -1,59 +1,165 @@
 import logging
-import pandas as pd
-import numpy as np
-from ta.trend import SMAIndicator
-from ta.momentum import RSIIndicator
+from collections import deque
 from config.config import STRATEGY_CONFIG
+from src.monitoring.metrics import timed
+from .strategies import INDICATORS, VOTING_POLICIES, create_strategy, combine_votes
 
 logger = logging.getLogger(__name__)
 
 class TradingStrategy:
-    def __init__(self):
+    """Run the enabled strategy plugins of one asset on a shared price history."""
+    __slots__ = (
+        'sma_period', 'rsi_period', 'rsi_overbought', 'rsi_oversold', 'asset', 'timeframe', 'cache',
+        'policy', 'arm_margin', 'strategies', 'states', 'requirements', 'history_size',
+        'price_history', 'bars_seen', 'bar_time', 'evaluated_bar', 'last_result',
+    )
+
+    def __init__(self, asset=None, timeframe=None, cache=None, names=None, policy=None):
         self.sma_period = STRATEGY_CONFIG['SMA_PERIOD']
         self.rsi_period = STRATEGY_CONFIG['RSI_PERIOD']
         self.rsi_overbought = STRATEGY_CONFIG['RSI_OVERBOUGHT']
         self.rsi_oversold = STRATEGY_CONFIG['RSI_OVERSOLD']
-        self.price_history = []
+        self.asset = asset
+        self.timeframe = timeframe
+        self.cache = cache  # shared IndicatorCache, optional
+        self.policy = policy or STRATEGY_CONFIG['VOTING_POLICY']
+        if self.policy not in VOTING_POLICIES:
+            raise ValueError(f"Unknown voting policy: {self.policy}")
+        self.arm_margin = STRATEGY_CONFIG['ARM_MARGIN']
+        self.strategies = [create_strategy(name) for name in names or STRATEGY_CONFIG['ENABLED_STRATEGIES']]
+        self.states = {strategy.name: strategy.new_state() for strategy in self.strategies}
+
+        # Every distinct input is computed once per update; SMA/RSI at the
+        # configured periods are always included for the status views
+        self.requirements = {('sma', (self.sma_period,)), ('rsi', (self.rsi_period,))}
+        for strategy in self.strategies:
+            self.requirements.update(strategy.indicators.values())
+        self.history_size = max(params[0] for _, params in self.requirements)
+
+        self.price_history = deque(maxlen=self.history_size)  # ring buffer of closes
+        self.bars_seen = 0
+        self.bar_time = None
+        self.evaluated_bar = None
+        self.last_result = None
 
-    def add_price(self, price):
-        """Add a new price to the history."""
+    @staticmethod
+    def preload_dependencies():
+        """Import the analytics stack ahead of the first signal calculation."""
+        import pandas
+        import ta
+
+    def add_price(self, price, bar_time=None):
+        """Add a new price to the history; ``bar_time`` identifies the bar for caching."""
         self.price_history.append(price)
-        if len(self.price_history) > self.sma_period:
-            self.price_history.pop(0)
+        self.bars_seen += 1
+        self.bar_time = bar_time if bar_time is not None else self.bars_seen
 
-    def calculate_signals(self):
-        """Calculate trading signals based on SMA and RSI."""
-        if len(self.price_history) < self.sma_period:
-            return None
+    def load_history(self, bars):
+        """Replace the price history with closed ``(bar_time, close)`` bars, oldest first.
+
+        Strategies are evaluated once on the newest bar so stateful rules
+        start from it; that bar is not signalled again.
+        """
+        bars = list(bars)[-self.history_size:]
+        if not bars:
+            return 0
+        self.price_history = deque((close for _, close in bars), maxlen=self.history_size)
+        self.bars_seen += len(bars)
+        self.bar_time = bars[-1][0]
+        self.evaluated_bar = None
+        self.calculate_signals()
+        return len(bars)
+
+    def signature(self):
+        """What a saved state depends on: strategies, voting policy and window."""
+        return [[strategy.name for strategy in self.strategies], self.policy, self.history_size]
 
-        # Convert price history to pandas Series
-        prices = pd.Series(self.price_history)
+    def snapshot(self):
+        """JSON-serializable state of the asset, for restoring it later without recomputation."""
+        return {
+            'asset': self.asset,
+            'timeframe': self.timeframe,
+            'signature': self.signature(),
+            'price_history': list(self.price_history),
+            'bars_seen': self.bars_seen,
+            'bar_time': self.bar_time,
+            'evaluated_bar': self.evaluated_bar,
+            'last_result': self.last_result,
+            'states': {name: state.snapshot() for name, state in self.states.items()},
+        }
 
-        # Calculate SMA
-        sma = SMAIndicator(close=prices, window=self.sma_period)
-        sma_value = sma.sma_indicator().iloc[-1]
+    def restore(self, snapshot):
+        """Resume from a ``snapshot``; returns False when it was taken with other settings."""
+        if snapshot['signature'] != self.signature() or snapshot['timeframe'] != self.timeframe:
+            return False
+        self.price_history = deque(snapshot['price_history'], maxlen=self.history_size)
+        self.bars_seen = snapshot['bars_seen']
+        self.bar_time = snapshot['bar_time']
+        self.evaluated_bar = snapshot['evaluated_bar']
+        self.last_result = snapshot['last_result']
+        for name, values in snapshot['states'].items():
+            self.states[name].restore(values)
+        return True
 
-        # Calculate RSI
-        rsi = RSIIndicator(close=prices, window=self.rsi_period)
-        rsi_value = rsi.rsi().iloc[-1]
+    def get_indicator(self, name, params):
+        """Get an indicator for the current bar, memoized in the shared cache."""
+        def compute():
+            return INDICATORS[name](self.price_history, *params)
 
-        # Generate signals
-        current_price = prices.iloc[-1]
-        signal = None
+        if self.cache is None:
+            return compute()
+        return self.cache.get(self.asset, self.timeframe, name, params, self.bar_time, compute)
 
-        # Buy signal: Price above SMA and RSI oversold
-        if current_price > sma_value and rsi_value < self.rsi_oversold:
-            signal = 'up'
-        # Sell signal: Price below SMA and RSI overbought
-        elif current_price < sma_value and rsi_value > self.rsi_overbought:
-            signal = 'down'
+    def compute_requirements(self):
+        """Compute every indicator the strategies depend on, or None while warming up."""
+        if len(self.price_history) < self.history_size:
+            return None
+        return {requirement: self.get_indicator(*requirement) for requirement in self.requirements}
 
+    def calculate_indicators(self):
+        """Get SMA and RSI for the latest bar, or None while warming up."""
+        if len(self.price_history) < self.history_size:
+            return None
         return {
-            'signal': signal,
+            'sma': self.get_indicator('sma', (self.sma_period,)),
+            'rsi': self.get_indicator('rsi', (self.rsi_period,)),
+        }
+
+    @timed('strategy')
+    def calculate_signals(self):
+        """Evaluate every strategy on the latest bar and combine their votes."""
+        if self.evaluated_bar is not None and self.evaluated_bar == self.bar_time:
+            return self.last_result  # strategies keep state, evaluate each bar once
+
+        values = self.compute_requirements()
+        if values is None:
+            return None
+
+        current_price = self.price_history[-1]
+        votes = {}
+        armed = False
+        for strategy in self.strategies:
+            state = self.states[strategy.name]
+            inputs = {label: values[requirement] for label, requirement in strategy.indicators.items()}
+            signal = strategy.evaluate(current_price, inputs, state)
+            state.evaluations += 1
+            if signal:
+                state.signals += 1
+                state.last_signal = signal
+            elif strategy.is_near(current_price, inputs, state, self.arm_margin):
+                armed = True
+            votes[strategy.name] = signal
+
+        self.evaluated_bar = self.bar_time
+        self.last_result = {
+            'signal': combine_votes(votes, self.policy),
             'price': current_price,
-            'sma': sma_value,
-            'rsi': rsi_value
+            'sma': values[('sma', (self.sma_period,))],
+            'rsi': values[('rsi', (self.rsi_period,))],
+            'votes': votes,
+            'armed': armed,  # a signal is close, orders can be prepared
         }
+        return self.last_result
 
     def get_strategy_info(self):
         """Get current strategy parameters and status."""
@@ -62,5 +168,9 @@ class TradingStrategy:
             'rsi_period': self.rsi_period,
             'rsi_overbought': self.rsi_overbought,
             'rsi_oversold': self.rsi_oversold,
-            'price_history_length': len(self.price_history)
-        } 
\ No newline at end of file
+            'history_size': self.history_size,
+            'price_history_length': len(self.price_history),
+            'indicators': self.calculate_indicators(),
+            'strategies': [strategy.get_info() for strategy in self.strategies],
+            'voting_policy': self.policy,
+        }
@@ -0,0 +1,121 @@
+import os
+import json
+import logging
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+class StrategyStore:
+    """Per-asset TradingStrategy objects, the most recently used kept in memory.
+
+    Once more than ``capacity`` assets are held, the least recently used one
+    is snapshotted to ``directory`` and dropped; asking for it again restores
+    the snapshot, so its indicators are warm without replaying any bars.
+    Snapshots only outlive an eviction within one run: leftovers of a
+    previous run are stale and removed on start.
+    """
+
+    def __init__(self, factory, capacity=8, directory=None):
+        self.factory = factory  # asset -> new TradingStrategy
+        self.capacity = max(1, capacity)
+        self.directory = str(directory) if directory else None
+        self.entries = OrderedDict()  # asset -> TradingStrategy
+        self.hits = 0
+        self.restores = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.directory:
+            self.clear_disk()
+
+    def __contains__(self, asset):
+        return asset in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def path(self, asset):
+        return os.path.join(self.directory, f"{asset}.json")
+
+    def get(self, asset):
+        """Get the strategy of an asset: from memory, restored from disk, or new."""
+        strategy = self.entries.get(asset)
+        if strategy is not None:
+            self.hits += 1
+            self.entries.move_to_end(asset)
+            return strategy
+
+        strategy = self.factory(asset)
+        if self.load(asset, strategy):
+            self.restores += 1
+        else:
+            self.misses += 1
+        self.entries[asset] = strategy
+        while len(self.entries) > self.capacity:
+            evicted, state = self.entries.popitem(last=False)
+            self.evictions += 1
+            self.save(evicted, state)
+        return strategy
+
+    def save(self, asset, strategy):
+        """Write the snapshot of an evicted strategy; without a directory it is discarded."""
+        if not self.directory:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self.path(asset)
+            with open(path + '.tmp', 'w') as f:
+                json.dump(strategy.snapshot(), f)
+            os.replace(path + '.tmp', path)
+        except Exception as e:
+            logger.error("Failed to save strategy state of %s: %s", asset, e)
+
+    def load(self, asset, strategy):
+        """Restore an evicted snapshot into ``strategy``; the file is consumed either way."""
+        if not self.directory:
+            return False
+        path = self.path(asset)
+        try:
+            with open(path) as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error("Failed to load strategy state of %s: %s", asset, e)
+            return False
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+        if not strategy.restore(snapshot):
+            logger.info("Discarding strategy state of %s saved with other settings", asset)
+            return False
+        return True
+
+    def clear_disk(self):
+        """Remove the snapshots of a previous run."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.directory, name))
+
+    def get_stats(self):
+        """Get hit/restore/miss counters."""
+        return {
+            'assets': len(self.entries),
+            'hits': self.hits,
+            'restores': self.restores,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def collect_metrics(self):
+        """Expose the counters as gauges for the metrics registry."""
+        return [
+            ('strategy_store_hits', {}, self.hits),
+            ('strategy_store_restores', {}, self.restores),
+            ('strategy_store_misses', {}, self.misses),
+            ('strategy_store_evictions', {}, self.evictions),
+            ('strategy_store_assets', {}, len(self.entries)),
+        ]
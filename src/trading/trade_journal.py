@@ -0,0 +1,169 @@
+import json
+import time
+import queue
+import sqlite3
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at REAL NOT NULL,
+    result TEXT NOT NULL,
+    profit REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_trades INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    gross_profit REAL NOT NULL,
+    gross_loss REAL NOT NULL,
+    loss_streak INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO aggregates VALUES (1, 0, 0, 0, 0.0, 0.0, 0);
+"""
+
+class TradeJournal:
+    """SQLite (WAL) journal of settled trades with running aggregates.
+
+    record() only queues the trade; a writer thread commits whatever has
+    queued up in one transaction, so the event loop never waits on the disk
+    and a burst of settlements shares one commit. With synchronous=FULL (the
+    default) every commit fsyncs the WAL, one fsync per batch, so a committed
+    trade survives power loss or an OS crash. synchronous=NORMAL fsyncs only
+    at checkpoints and can lose the last commits with the machine.
+    Lifetime aggregates live in a single row updated in the same transaction,
+    so restoring them at startup does not scan the history.
+    """
+
+    def __init__(self, path, synchronous='FULL', max_batch=100):
+        self.path = path
+        self.max_batch = max_batch
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"PRAGMA synchronous={synchronous}")
+        self.conn.executescript(SCHEMA)
+        # Reads use their own connection: under WAL they see the last commit
+        # without waiting for the writer's lock or fsync
+        self.read_lock = threading.Lock()
+        self.reader = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self.pending = queue.Queue()
+        self.writer = threading.Thread(target=self._write_loop, name='trade-journal', daemon=True)
+        self.writer.start()
+
+    def record(self, trade_data):
+        """Queue a settled trade for the writer thread; returns at once.
+
+        close() commits whatever is still queued. Trades queued when the
+        process is killed or crashes, milliseconds' worth, are lost.
+        """
+        self.pending.put((time.time(), trade_data))
+
+    def flush(self):
+        """Wait until every queued trade is committed."""
+        self.pending.join()
+
+    def _write_loop(self):
+        while True:
+            batch = [self.pending.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            trades = [item for item in batch if item is not None]
+            try:
+                if trades:
+                    self._commit(trades)
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+            if len(trades) < len(batch):
+                return  # close() sent the stop marker
+
+    def _commit(self, trades):
+        """Append trades and update the aggregates in one transaction."""
+        wins = losses = 0
+        gross_profit = gross_loss = 0.0
+        trailing_losses = 0
+        for _, trade_data in trades:
+            profit = trade_data['profit']
+            gross_profit += max(profit, 0.0)
+            gross_loss += max(-profit, 0.0)
+            if trade_data['result'] == 'loss':
+                losses += 1
+                trailing_losses += 1
+            else:
+                wins += trade_data['result'] == 'win'
+                trailing_losses = 0
+        all_losses = trailing_losses == len(trades)
+        with self.lock:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.executemany(
+                    "INSERT INTO trades (recorded_at, result, profit, data) VALUES (?, ?, ?, ?)",
+                    [
+                        (recorded_at, trade_data['result'], trade_data['profit'],
+                         json.dumps(trade_data, default=str))
+                        for recorded_at, trade_data in trades
+                    ]
+                )
+                self.conn.execute(
+                    "UPDATE aggregates SET "
+                    "total_trades = total_trades + ?, "
+                    "wins = wins + ?, losses = losses + ?, "
+                    "gross_profit = gross_profit + ?, gross_loss = gross_loss + ?, "
+                    "loss_streak = CASE WHEN ? THEN loss_streak + ? ELSE ? END "
+                    "WHERE id = 1",
+                    (len(trades), wins, losses, gross_profit, gross_loss,
+                     int(all_losses), trailing_losses, trailing_losses)
+                )
+                self.conn.execute("COMMIT")
+            except Exception as e:
+                self.conn.execute("ROLLBACK")
+                logger.error("Failed to journal %d trades: %s", len(trades), e)
+
+    def get_aggregates(self):
+        """Get the lifetime aggregates over committed trades."""
+        with self.read_lock:
+            row = self.reader.execute(
+                "SELECT total_trades, wins, losses, gross_profit, gross_loss, loss_streak "
+                "FROM aggregates WHERE id = 1"
+            ).fetchone()
+        total_trades, wins, losses, gross_profit, gross_loss, loss_streak = row
+        return {
+            'total_trades': total_trades,
+            'wins': wins,
+            'losses': losses,
+            'net_profit': round(gross_profit - gross_loss, 2),
+            'loss_streak': loss_streak,
+        }
+
+    def get_recent_trades(self, limit):
+        """Get the last ``limit`` committed trades, oldest first."""
+        with self.read_lock:
+            rows = self.reader.execute(
+                "SELECT data FROM trades ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [json.loads(data) for (data,) in reversed(rows)]
+
+    def checkpoint(self):
+        """Fold the WAL back into the database file (fsyncs both)."""
+        with self.lock:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        """Commit queued trades, checkpoint and close the database."""
+        try:
+            self.pending.put(None)
+            self.writer.join()
+            self.checkpoint()
+            self.reader.close()
+            self.conn.close()
+        except Exception as e:
+            logger.error("Error closing trade journal: %s", e)
@@ -0,0 +1,211 @@
+"""Walk-forward optimization of STRATEGY_CONFIG on recorded ticks.
+
+History is split into rolling folds on UTC day boundaries: every fold picks
+the best point of the parameter grid on its in-sample days and trades it on
+the following out-of-sample days. The out-of-sample trades of all folds are
+stitched into one result. Fold results are cached on disk under a hash of
+the fold's bars, the grid and settings, and the backtest code version, so
+adding a day of data only computes the new fold.
+
+    python -m src.trading.walk_forward --asset EURUSD --output wf.json   # market data store
+    python -m src.trading.walk_forward data/ticks.csv --asset EURUSD
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import argparse
+import itertools
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from config.config import TRADING_CONFIG, STRATEGY_CONFIG, WALK_FORWARD_CONFIG
+from .backtest import CODE_VERSION, load_bars, compute_signals, simulate_trades, summarize
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+
+def make_folds(bar_times, in_sample_days, out_of_sample_days):
+    """Split bars into folds of ``(start, oos_start, oos_end)`` bar indices.
+
+    Fold boundaries are whole UTC days counted from the first day of data, so
+    the bars of a fold, and therefore its cache key, do not change when data
+    is appended after it.
+    """
+    folds = []
+    if not len(bar_times):
+        return folds
+    start = bar_times[0] // DAY * DAY
+    while start + in_sample_days * DAY <= bar_times[-1]:
+        oos_start = start + in_sample_days * DAY
+        oos_end = oos_start + out_of_sample_days * DAY
+        indices = tuple(int(index) for index in np.searchsorted(bar_times, (start, oos_start, oos_end)))
+        if indices[0] < indices[1]:  # skip folds without in-sample bars (data gaps)
+            folds.append(indices)
+        start += out_of_sample_days * DAY
+    return folds
+
+def expand_grid(grid):
+    """Every combination of a ``{key: [values]}`` grid, as override dicts."""
+    keys = sorted(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+
+def optimize_fold(bar_times, closes, oos_index, grid, settings):
+    """Pick the best grid point on bars before ``oos_index`` and trade it on the rest."""
+    def trade(params, end=None):
+        signals = compute_signals(closes, params, settings['strategies'], settings['policy'], indicators)
+        return simulate_trades(
+            bar_times, closes, signals,
+            settings['expiry'], settings['payout'], settings['cooldown'], end
+        )
+
+    indicators = {}  # indicator series shared by every grid point
+    best_params, best_stats, best_score = None, None, None
+    for params in expand_grid(grid):
+        _, returns = trade(params, oos_index)
+        stats = summarize(returns)
+        if stats['total_trades'] < settings['min_trades']:
+            continue
+        score = stats[settings['objective']]
+        if best_score is None or score > best_score:
+            best_params, best_stats, best_score = params, stats, score
+
+    if best_params is None:
+        # Nothing traded often enough; keep the configured values
+        best_params = {key: STRATEGY_CONFIG[key] for key in grid}
+        best_stats = summarize(trade(best_params, oos_index)[1])
+
+    # Run over the whole fold so indicators and cooldown are warm at the split
+    taken, returns = trade(best_params)
+    returns = returns[taken >= oos_index]
+    return {
+        'params': best_params,
+        'in_sample': best_stats,
+        'out_of_sample': summarize(returns),
+        'returns': returns.tolist(),
+    }
+
+class FoldCache:
+    """Fold results as JSON files named by their cache key."""
+
+    def __init__(self, directory):
+        self.directory = str(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(bar_times, closes, oos_index, grid, settings):
+        digest = hashlib.sha256()
+        digest.update(bar_times.tobytes())
+        digest.update(closes.tobytes())
+        digest.update(json.dumps(
+            {'oos_index': oos_index, 'grid': grid, 'settings': settings, 'code': CODE_VERSION},
+            sort_keys=True
+        ).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        try:
+            with open(os.path.join(self.directory, f"{key}.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, result):
+        path = os.path.join(self.directory, f"{key}.json")
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(result, f)
+        os.replace(f"{path}.tmp", path)
+
+def _day(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%d')
+
+def run_walk_forward(paths, asset, grid=None, workers=None, cache_dir=None):
+    """Optimize every fold, reusing cached folds, and stitch the out-of-sample trades.
+
+    Without ``paths`` the bars come from the market data store.
+    """
+    started = time.perf_counter()
+    grid = grid or WALK_FORWARD_CONFIG['GRID']
+    settings = {
+        'timeframe': TRADING_CONFIG['DEFAULT_TIMEFRAME'],
+        'strategies': STRATEGY_CONFIG['ENABLED_STRATEGIES'],
+        'policy': STRATEGY_CONFIG['VOTING_POLICY'],
+        'expiry': TRADING_CONFIG['TRADE_EXPIRY'],
+        'payout': TRADING_CONFIG['PAYOUT'],
+        'cooldown': (TRADING_CONFIG['MIN_DELAY'] + TRADING_CONFIG['MAX_DELAY']) / 2,
+        'objective': WALK_FORWARD_CONFIG['OBJECTIVE'],
+        'min_trades': WALK_FORWARD_CONFIG['MIN_TRADES'],
+    }
+    cache = FoldCache(cache_dir or WALK_FORWARD_CONFIG['CACHE_DIR'])
+
+    bar_times, closes = load_bars(paths, asset, settings['timeframe'])
+    folds = make_folds(
+        bar_times, WALK_FORWARD_CONFIG['IN_SAMPLE_DAYS'], WALK_FORWARD_CONFIG['OUT_OF_SAMPLE_DAYS']
+    )
+
+    results, missing = {}, {}
+    for number, (start, oos_start, oos_end) in enumerate(folds):
+        fold_times, fold_closes = bar_times[start:oos_end], closes[start:oos_end]
+        key = cache.key(fold_times, fold_closes, oos_start - start, grid, settings)
+        results[number] = cache.get(key)
+        if results[number] is None:
+            missing[number] = (key, (fold_times, fold_closes, oos_start - start, grid, settings))
+
+    logger.info("Walk-forward: %d folds, %d cached, %d to compute", len(folds), len(folds) - len(missing), len(missing))
+    if missing:
+        workers = workers or WALK_FORWARD_CONFIG['WORKERS'] or os.cpu_count()
+        if workers == 1 or len(missing) == 1:
+            computed = {number: optimize_fold(*args) for number, (_, args) in missing.items()}
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as pool:
+                futures = {number: pool.submit(optimize_fold, *args) for number, (_, args) in missing.items()}
+                computed = {number: future.result() for number, future in futures.items()}
+        for number, result in computed.items():
+            cache.put(missing[number][0], result)
+            results[number] = result
+
+    report_folds = []
+    stitched = []
+    for number, (start, oos_start, oos_end) in enumerate(folds):
+        result = results[number]
+        stitched.extend(result['returns'])
+        report_folds.append({
+            'in_sample': f"{_day(bar_times[start])}..{_day(bar_times[oos_start - 1])}",
+            'out_of_sample': f"{_day(bar_times[oos_start])}..{_day(bar_times[oos_end - 1])}",
+            'params': result['params'],
+            'in_sample_stats': result['in_sample'],
+            'out_of_sample_stats': result['out_of_sample'],
+            'cached': number not in missing,
+        })
+
+    return {
+        'asset': asset,
+        'bars': len(closes),
+        'code_version': CODE_VERSION,
+        'folds': report_folds,
+        'computed': len(missing),
+        'out_of_sample': summarize(stitched),
+        'seconds': round(time.perf_counter() - started, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk-forward optimization of the strategy parameters")
+    parser.add_argument('ticks', nargs='*', help="CSV files of timestamp,asset,price rows (default: the market data store)")
+    parser.add_argument('--asset', default=TRADING_CONFIG['DEFAULT_ASSET'])
+    parser.add_argument('--workers', type=int, help="worker processes (default: WALK_FORWARD_CONFIG)")
+    parser.add_argument('--cache-dir', help="fold cache directory (default: WALK_FORWARD_CONFIG)")
+    parser.add_argument('--output', help="write the report as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    report = run_walk_forward(args.ticks, args.asset.upper(), workers=args.workers, cache_dir=args.cache_dir)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+
+if __name__ == "__main__":
+    main()